@@ -1,17 +1,80 @@
 """
 Advanced Performance Analysis for Snake A* Algorithm
-This script provides comprehensive analysis of the snake game performance data
+This script provides comprehensive analysis of the snake game performance data.
+Only NumPy is imported up front; matplotlib and seaborn are loaded through
+analysis_backend the first time a plot is drawn.
 """
 
-import matplotlib.pyplot as plt
+import math
+import sys
 import numpy as np
-import statistics
-from scipy import stats
-import seaborn as sns
 
-# Set style for better-looking plots
-plt.style.use('seaborn-v0_8')
-sns.set_palette("husl")
+from analysis_backend import figure_class, pyplot
+from plot_decimation import (HEXBIN_THRESHOLD, box_stats, decimate_line, frequency_bins,
+                             line_style, prebinned_hist, rolling_mean_std)
+
+
+def _incomplete_beta(a, b, x):
+    """Regularized incomplete beta function I_x(a, b) (continued fraction)"""
+    if x <= 0.0:
+        return 0.0
+    if x >= 1.0:
+        return 1.0
+    # The continued fraction converges quickly only below the mean
+    if x > (a + 1.0) / (a + b + 2.0):
+        return 1.0 - _incomplete_beta(b, a, 1.0 - x)
+    front = math.exp(math.lgamma(a + b) - math.lgamma(a) - math.lgamma(b) +
+                     a * math.log(x) + b * math.log(1.0 - x))
+
+    tiny = 1e-300
+    c, d = 1.0, 1.0 - (a + b) * x / (a + 1.0)
+    d = 1.0 / (d if abs(d) > tiny else tiny)
+    result = d
+    for m in range(1, 200):
+        for numerator in (m * (b - m) * x / ((a + 2 * m - 1) * (a + 2 * m)),
+                          -(a + m) * (a + b + m) * x / ((a + 2 * m) * (a + 2 * m + 1))):
+            d = 1.0 + numerator * d
+            d = 1.0 / (d if abs(d) > tiny else tiny)
+            c = 1.0 + numerator / c
+            c = c if abs(c) > tiny else tiny
+            result *= c * d
+        if abs(c * d - 1.0) < 1e-12:
+            break
+    return front * result / a
+
+
+def _linregress(x, y):
+    """
+    Least-squares line fit with a two-sided t-test on the slope
+
+    NumPy-only equivalent of scipy.stats.linregress.
+
+    Returns:
+        tuple: (slope, intercept, r_value, p_value, std_err)
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    n = len(x)
+    x_dev, y_dev = x - x.mean(), y - y.mean()
+    sxx, syy, sxy = np.dot(x_dev, x_dev), np.dot(y_dev, y_dev), np.dot(x_dev, y_dev)
+    if sxx == 0:
+        return float('nan'), float('nan'), 0.0, float('nan'), float('nan')
+
+    slope = sxy / sxx
+    intercept = y.mean() - slope * x.mean()
+    r_value = sxy / math.sqrt(sxx * syy) if syy > 0 else 0.0
+    r_value = max(-1.0, min(1.0, r_value))
+
+    df = n - 2
+    if df <= 0:
+        return slope, intercept, r_value, float('nan'), float('nan')
+    if abs(r_value) == 1.0:
+        return slope, intercept, r_value, 0.0, 0.0
+    t_stat = r_value * math.sqrt(df / (1.0 - r_value ** 2))
+    p_value = _incomplete_beta(0.5 * df, 0.5, df / (df + t_stat ** 2))
+    std_err = math.sqrt((1.0 - r_value ** 2) * syy / sxx / df)
+    return slope, intercept, r_value, p_value, std_err
+
 
 class SnakePerformanceAnalyzer:
     def __init__(self, scores, times=None):
@@ -23,7 +86,7 @@ class SnakePerformanceAnalyzer:
             times (list, optional): List of time taken for each game
         """
         self.scores = np.array(scores)
-        self.times = np.array(times) if times else None
+        self.times = np.array(times) if times is not None else None
         self.n_trials = len(scores)
         
     def basic_statistics(self):
@@ -45,7 +108,7 @@ class SnakePerformanceAnalyzer:
         """Analyze performance trends over time"""
         # Linear regression to find trend
         x = np.arange(len(self.scores))
-        slope, intercept, r_value, p_value, std_err = stats.linregress(x, self.scores)
+        slope, intercept, r_value, p_value, std_err = _linregress(x, self.scores)
         
         # Calculate moving averages
         window_sizes = [3, 5, 7]
@@ -112,7 +175,8 @@ class SnakePerformanceAnalyzer:
         iqr_outliers = np.where((self.scores < lower_bound) | (self.scores > upper_bound))[0]
         
         # Z-score method
-        z_scores = np.abs(stats.zscore(self.scores))
+        std = np.std(self.scores)
+        z_scores = np.abs(self.scores - np.mean(self.scores)) / std if std > 0 else np.zeros(self.n_trials)
         z_outliers = np.where(z_scores > 2)[0]  # Using 2 sigma threshold
         
         return {
@@ -194,114 +258,138 @@ class SnakePerformanceAnalyzer:
         
         print("=" * 80)
     
-    def create_advanced_visualizations(self):
-        """Create comprehensive visualizations"""
-        fig = plt.figure(figsize=(20, 15))
-        
-        # 1. Main performance plot with trend line
-        ax1 = plt.subplot(3, 3, 1)
+    # Individual dashboard panels, in display order. Each name maps to a
+    # plot_<name>(ax) method so panels can also be rendered one per file.
+    PANELS = ('performance', 'boxplot', 'distribution', 'volatility', 'cumulative',
+              'classification', 'rolling', 'frequency', 'summary')
+    # Extra panels that only exist as separate files, when time data is present
+    TIME_PANELS = ('score_vs_time',)
+
+    def plot_performance(self, ax):
+        """Main performance plot with trend line and moving average"""
         x = np.arange(len(self.scores))
-        plt.plot(x, self.scores, 'o-', linewidth=2, markersize=6, alpha=0.7, label='Scores')
+        x_plot, y_plot, decimated = decimate_line(x, self.scores)
+        ax.plot(x_plot, y_plot, line_style(decimated), linewidth=2, markersize=6, alpha=0.7, label='Scores')
         
-        # Add trend line
+        # Add trend line (a straight line only needs its end points)
         trend_data = self.trend_analysis()
         slope, intercept = trend_data['slope'], np.mean(self.scores) - trend_data['slope'] * np.mean(x)
-        trend_line = slope * x + intercept
-        plt.plot(x, trend_line, '--', color='red', linewidth=2, 
+        ends = x[[0, -1]]
+        ax.plot(ends, slope * ends + intercept, '--', color='red', linewidth=2, 
                 label=f'Trend (slope={slope:.2f})')
         
         # Add moving average
         if 'MA_5' in trend_data['moving_averages']:
             ma = trend_data['moving_averages']['MA_5']
-            plt.plot(range(2, 2+len(ma)), ma, color='green', linewidth=2, 
+            ma_x, ma_y, _ = decimate_line(np.arange(2, 2+len(ma)), ma)
+            ax.plot(ma_x, ma_y, color='green', linewidth=2, 
                     label='5-trial Moving Average')
         
-        plt.xlabel('Trial Number')
-        plt.ylabel('Score')
-        plt.title('Performance Over Time with Trend Analysis')
-        plt.legend()
-        plt.grid(True, alpha=0.3)
-        
-        # 2. Box plot
-        ax2 = plt.subplot(3, 3, 2)
-        plt.boxplot(self.scores, labels=['Scores'])
-        plt.ylabel('Score')
-        plt.title('Score Distribution (Box Plot)')
-        plt.grid(True, alpha=0.3)
-        
-        # 3. Histogram with normal distribution overlay
-        ax3 = plt.subplot(3, 3, 3)
-        plt.hist(self.scores, bins=8, alpha=0.7, density=True, color='skyblue', edgecolor='black')
+        ax.set_xlabel('Trial Number')
+        ax.set_ylabel('Score')
+        ax.set_title('Performance Over Time with Trend Analysis')
+        ax.legend()
+        ax.grid(True, alpha=0.3)
+    
+    def plot_boxplot(self, ax):
+        """Box plot of the score distribution"""
+        ax.bxp([box_stats(self.scores, 'Scores')])
+        ax.set_ylabel('Score')
+        ax.set_title('Score Distribution (Box Plot)')
+        ax.grid(True, alpha=0.3)
+    
+    def plot_distribution(self, ax):
+        """Histogram with normal distribution overlay"""
+        prebinned_hist(ax, self.scores, bins=8, alpha=0.7, density=True, color='skyblue', edgecolor='black')
         
         # Overlay normal distribution
         mean, std = np.mean(self.scores), np.std(self.scores)
         x_norm = np.linspace(self.scores.min(), self.scores.max(), 100)
-        y_norm = stats.norm.pdf(x_norm, mean, std)
-        plt.plot(x_norm, y_norm, 'r-', linewidth=2, label='Normal Distribution')
-        
-        plt.xlabel('Score')
-        plt.ylabel('Density')
-        plt.title('Score Distribution with Normal Overlay')
-        plt.legend()
-        plt.grid(True, alpha=0.3)
-        
-        # 4. Performance volatility
-        ax4 = plt.subplot(3, 3, 4)
+        y_norm = np.exp(-0.5 * ((x_norm - mean) / std) ** 2) / (std * math.sqrt(2 * math.pi))
+        ax.plot(x_norm, y_norm, 'r-', linewidth=2, label='Normal Distribution')
+        
+        ax.set_xlabel('Score')
+        ax.set_ylabel('Density')
+        ax.set_title('Score Distribution with Normal Overlay')
+        ax.legend()
+        ax.grid(True, alpha=0.3)
+    
+    def plot_volatility(self, ax):
+        """Trial-to-trial score changes"""
         diffs = np.diff(self.scores)
-        plt.plot(range(1, len(diffs)+1), diffs, 'o-', color='purple', alpha=0.7)
-        plt.axhline(0, color='black', linestyle='--', alpha=0.5)
-        plt.xlabel('Trial Transition')
-        plt.ylabel('Score Change')
-        plt.title('Performance Volatility')
-        plt.grid(True, alpha=0.3)
-        
-        # 5. Cumulative performance
-        ax5 = plt.subplot(3, 3, 5)
+        x_plot, y_plot, decimated = decimate_line(np.arange(1, len(diffs)+1), diffs, method='minmax')
+        ax.plot(x_plot, y_plot, line_style(decimated), color='purple', alpha=0.7)
+        ax.axhline(0, color='black', linestyle='--', alpha=0.5)
+        ax.set_xlabel('Trial Transition')
+        ax.set_ylabel('Score Change')
+        ax.set_title('Performance Volatility')
+        ax.grid(True, alpha=0.3)
+    
+    def plot_cumulative(self, ax):
+        """Cumulative score over trials"""
         cumulative_scores = np.cumsum(self.scores)
-        plt.plot(range(len(cumulative_scores)), cumulative_scores, 'o-', color='orange')
-        plt.xlabel('Trial Number')
-        plt.ylabel('Cumulative Score')
-        plt.title('Cumulative Performance')
-        plt.grid(True, alpha=0.3)
-        
-        # 6. Performance classification pie chart
-        ax6 = plt.subplot(3, 3, 6)
+        x_plot, y_plot, decimated = decimate_line(np.arange(len(cumulative_scores)), cumulative_scores)
+        ax.plot(x_plot, y_plot, line_style(decimated), color='orange')
+        ax.set_xlabel('Trial Number')
+        ax.set_ylabel('Cumulative Score')
+        ax.set_title('Cumulative Performance')
+        ax.grid(True, alpha=0.3)
+    
+    def plot_classification(self, ax):
+        """Performance classification pie chart"""
         classification = self.performance_classification()
         labels = ['Excellent', 'Good', 'Average', 'Poor']
         sizes = [classification['excellent_count'], classification['good_count'], 
                 classification['average_count'], classification['poor_count']]
         colors = ['green', 'lightgreen', 'yellow', 'red']
-        plt.pie(sizes, labels=labels, colors=colors, autopct='%1.1f%%', startangle=90)
-        plt.title('Performance Classification')
-        
-        # 7. Rolling statistics
-        ax7 = plt.subplot(3, 3, 7)
-        window = min(5, len(self.scores)//2)
-        rolling_mean = np.convolve(self.scores, np.ones(window), 'valid') / window
-        rolling_std = [np.std(self.scores[i:i+window]) for i in range(len(self.scores)-window+1)]
-        
-        plt.plot(range(window-1, len(self.scores)), rolling_mean, label=f'Rolling Mean (window={window})')
-        plt.plot(range(window-1, len(self.scores)), rolling_std, label=f'Rolling Std (window={window})')
-        plt.xlabel('Trial Number')
-        plt.ylabel('Value')
-        plt.title('Rolling Statistics')
-        plt.legend()
-        plt.grid(True, alpha=0.3)
-        
-        # 8. Score frequency
-        ax8 = plt.subplot(3, 3, 8)
-        unique_scores, counts = np.unique(self.scores, return_counts=True)
-        plt.bar(unique_scores, counts, alpha=0.7, color='lightcoral')
-        plt.xlabel('Score')
-        plt.ylabel('Frequency')
-        plt.title('Score Frequency Distribution')
-        plt.grid(True, alpha=0.3)
-        
-        # 9. Performance metrics summary
-        ax9 = plt.subplot(3, 3, 9)
-        ax9.axis('off')
+        ax.pie(sizes, labels=labels, colors=colors, autopct='%1.1f%%', startangle=90)
+        ax.set_title('Performance Classification')
+    
+    def plot_rolling(self, ax):
+        """Rolling mean and standard deviation"""
+        window = max(1, min(5, len(self.scores)//2))
+        rolling_mean, rolling_std = rolling_mean_std(self.scores, window)
+        x = np.arange(window-1, len(self.scores))
+        
+        ax.plot(*decimate_line(x, rolling_mean)[:2], label=f'Rolling Mean (window={window})')
+        ax.plot(*decimate_line(x, rolling_std)[:2], label=f'Rolling Std (window={window})')
+        ax.set_xlabel('Trial Number')
+        ax.set_ylabel('Value')
+        ax.set_title('Rolling Statistics')
+        ax.legend()
+        ax.grid(True, alpha=0.3)
+    
+    def plot_frequency(self, ax):
+        """Score frequency bars"""
+        positions, counts, bar_width = frequency_bins(self.scores)
+        ax.bar(positions, counts, width=bar_width, alpha=0.7, color='lightcoral')
+        ax.set_xlabel('Score')
+        ax.set_ylabel('Frequency')
+        ax.set_title('Score Frequency Distribution')
+        ax.grid(True, alpha=0.3)
+    
+    def plot_score_vs_time(self, ax):
+        """Score against time taken; large datasets switch to a hexbin density"""
+        if self.times is None:
+            ax.axis('off')
+            ax.set_title('Score vs Time (no time data)')
+            return
+        if len(self.scores) > HEXBIN_THRESHOLD:
+            hb = ax.hexbin(self.times, self.scores, gridsize=60, cmap='viridis', mincnt=1)
+            ax.figure.colorbar(hb, ax=ax, label='Trials')
+        else:
+            ax.scatter(self.times, self.scores, alpha=0.7, color='blue')
+        ax.set_xlabel('Time Taken (seconds)')
+        ax.set_ylabel('Score')
+        ax.set_title('Score vs Time Taken')
+        ax.grid(True, alpha=0.3)
+    
+    def plot_summary(self, ax):
+        """Text panel with the key performance metrics"""
+        ax.axis('off')
         
         basic_stats = self.basic_statistics()
+        trend_data = self.trend_analysis()
         consistency = self.consistency_analysis()
         
         summary_text = f"""
@@ -322,14 +410,32 @@ class SnakePerformanceAnalyzer:
         • Volatility: {consistency['volatility']:.1f}
         """
         
-        ax9.text(0.1, 0.9, summary_text, transform=ax9.transAxes, fontsize=10,
+        ax.text(0.1, 0.9, summary_text, transform=ax.transAxes, fontsize=10,
                 verticalalignment='top', fontfamily='monospace',
                 bbox=dict(boxstyle='round,pad=0.5', facecolor='lightblue', alpha=0.8))
+    
+    def create_advanced_visualizations(self, save_path=None):
+        """
+        Create comprehensive visualizations
+        
+        Args:
+            save_path (str, optional): Write the dashboard to this file instead
+                of opening a blocking window
+        """
+        # A bare Figure renders through Agg without touching the GUI backend
+        fig = figure_class()(figsize=(20, 15)) if save_path else pyplot().figure(figsize=(20, 15))
         
-        plt.suptitle('Comprehensive Snake A* Algorithm Performance Analysis', 
+        for i, panel in enumerate(self.PANELS, 1):
+            ax = fig.add_subplot(3, 3, i)
+            getattr(self, f'plot_{panel}')(ax)
+        
+        fig.suptitle('Comprehensive Snake A* Algorithm Performance Analysis', 
                     fontsize=16, fontweight='bold', y=0.98)
-        plt.tight_layout()
-        plt.show()
+        fig.tight_layout()
+        if save_path:
+            fig.savefig(save_path, dpi=100)
+        else:
+            pyplot().show()
 
 
 # Example usage with the snake game data
@@ -346,5 +452,5 @@ if __name__ == "__main__":
     # Generate comprehensive report
     analyzer.create_comprehensive_report()
     
-    # Create advanced visualizations
-    analyzer.create_advanced_visualizations()
+    # Create advanced visualizations (pass an output path to skip the window)
+    analyzer.create_advanced_visualizations(sys.argv[1] if len(sys.argv) > 1 else None)
@@ -0,0 +1,44 @@
+"""
+Lazy Access to the Heavy Analysis Dependencies
+matplotlib, seaborn, scipy and pandas are imported the first time a plotting
+or statistical-test path asks for them, so numeric summaries only pay for NumPy.
+"""
+
+_style_applied = False
+
+
+def apply_plot_style():
+    """Apply the project plot style once per process"""
+    global _style_applied
+    if not _style_applied:
+        import matplotlib.pyplot as plt
+        import seaborn as sns
+        plt.style.use('seaborn-v0_8')
+        sns.set_palette("husl")
+        _style_applied = True
+
+
+def pyplot():
+    """matplotlib.pyplot with the project style applied"""
+    apply_plot_style()
+    import matplotlib.pyplot as plt
+    return plt
+
+
+def figure_class():
+    """matplotlib Figure, for rendering to files without a GUI backend"""
+    apply_plot_style()
+    from matplotlib.figure import Figure
+    return Figure
+
+
+def scipy_stats():
+    """scipy.stats module"""
+    from scipy import stats
+    return stats
+
+
+def pandas():
+    """pandas module"""
+    import pandas as pd
+    return pd
@@ -0,0 +1,359 @@
+"""
+Anytime Planner for Snake A* Experiments
+ARA*-style weighted A* with a hard per-tick budget. Every call to plan()
+pops at most max_expansions heap entries (and/or runs for at most max_seconds),
+returns the next move along the best path found so far, and keeps the search
+state so later ticks can finish it and then tighten the weight epsilon
+towards 1 (optimal) while the snake is already moving.
+
+The search runs backwards, from the food to the head, so its tree stays valid
+while the snake moves: the head walks along tree edges towards the root. The
+heuristic depends on the head position, so queued keys are kept as lower
+bounds with a D* Lite style offset (km) and refreshed lazily when popped.
+Until the head is reached the snake makes greedy moves towards the food.
+
+To keep the budget hard, nothing in a tick costs more than the work it is
+allowed: g, parent and closed marks live in flat arrays preallocated per board
+and invalidated in O(1) by bumping a base offset (no dict rehashing as the
+tree grows), and discarded heaps are freed a chunk at a time at the end of
+later ticks instead of all at once.
+"""
+
+import heapq
+import math
+import time
+from array import array
+
+from snake_engine import Planner
+
+TIME_CHECK_INTERVAL = 32  # Heap pops between clock reads
+REBUILD_SECONDS_PER_CELL = 2e-6  # Initial estimate of the requeue cost per open cell
+FREE_CHUNK = 2048  # Discarded heap entries freed per step
+
+
+class _SparseTable(dict):
+    """Dict stand-in for a zeroed array on boards too large to allocate one"""
+
+    def __missing__(self, cell):
+        return 0
+
+
+class AnytimePlanner(Planner):
+    """
+    Deadline-bounded ARA*-style planner (one move per plan() call)
+
+    Like HamiltonianPlanner, plan() returns a single move, so the engine asks
+    again every tick and each tick gets a fresh budget.
+    """
+
+    cacheable = False  # The search carries over between ticks
+
+    def __init__(self, board, epsilon=3.0, epsilon_step=0.5, max_expansions=2000,
+                 max_seconds=None):
+        """
+        Args:
+            board (Board): Board to plan on
+            epsilon (float): Initial heuristic weight
+            epsilon_step (float): Weight decrease after each finished search
+            max_expansions (int, optional): Heap pops per tick, stale entries
+                included (None: unbounded)
+            max_seconds (float, optional): Time budget per tick (None: unbounded)
+        """
+        super().__init__(board)
+        self.initial_epsilon = float(epsilon)
+        self.epsilon_step = float(epsilon_step)
+        self.max_expansions = max_expansions
+        self.max_seconds = max_seconds
+        self.goal = -1
+        self.fallback_moves = 0
+        self.improvements = 0
+        self.rebuild_seconds_per_cell = REBUILD_SECONDS_PER_CELL
+        self.open = []
+        self.incons = set()
+        self.garbage = []  # Discarded heaps, freed in chunks
+        self._allocate()
+
+    def _allocate(self):
+        """
+        Search tables indexed by cell
+
+        g_table holds base + g for cells reached by the current search (any
+        smaller value means unreached), parent_cell/parent_dir the next cell
+        and move towards the goal, and closed the iteration mark of settled
+        cells. Bumping base or mark clears them without touching the arrays.
+        """
+        size = self.board.size
+        if isinstance(self.board.obstacles, (bytes, bytearray, memoryview)):
+            self.g_table = array('q', bytes(8 * size))
+            self.parent_cell = array('q', bytes(8 * size))
+            self.parent_dir = bytearray(size)
+            self.closed = array('q', bytes(8 * size))
+        else:
+            # Sparse boards: tables grow with the search, not with the board
+            self.g_table, self.parent_cell = _SparseTable(), _SparseTable()
+            self.parent_dir, self.closed = _SparseTable(), _SparseTable()
+        self.base = size + 1  # A fresh table reads 0, i.e. unreached
+        self.mark = 1
+
+    def _reset(self, goal, head):
+        """Start a new search tree rooted at goal"""
+        if self.g_table is None:
+            self._allocate()
+        elif isinstance(self.g_table, _SparseTable):
+            self._allocate()  # Dropping the dicts is the only way to shrink them
+        else:
+            self.base += self.board.size + 1
+        self.mark += 1
+        self.goal = goal
+        self.head = head
+        self.epsilon = self.initial_epsilon
+        self.g_table[goal] = self.base
+        self.garbage.append(self.open)
+        self.garbage.append(list(self.incons))
+        self.incons = set()
+        self.km = 0.0
+        self.best = math.inf
+        self.open = [(self._key(goal, 0), 0, goal)]
+        self.searches += 1
+
+    def _g(self, cell):
+        """Cost from cell to the goal in the current tree, or None"""
+        g = self.g_table[cell] - self.base
+        return g if g >= 0 else None
+
+    def _step(self, cell):
+        """(next cell, direction) towards the goal, or None"""
+        if cell == self.goal or self.g_table[cell] < self.base:
+            return None
+        return self.parent_cell[cell], self.parent_dir[cell]
+
+    def _free_garbage(self, budget_end):
+        """Free discarded heaps a chunk at a time while the tick has time left"""
+        garbage = self.garbage
+        while garbage:
+            if budget_end is not None and time.perf_counter() > budget_end:
+                return
+            if len(garbage[-1]) > FREE_CHUNK:
+                del garbage[-1][-FREE_CHUNK:]
+            else:
+                garbage.pop()
+
+    def _h(self, cell):
+        cols = self.board.cols
+        x, y = divmod(cell, cols)
+        hx, hy = divmod(self.head, cols)
+        return math.sqrt((x - hx) ** 2 + (y - hy) ** 2)
+
+    def _key(self, cell, g):
+        return g + self.epsilon * (self._h(cell) + self.km)
+
+    def _move_head(self, head):
+        """Account for the head moving: queued keys stay valid lower bounds"""
+        if head != self.head:
+            cols = self.board.cols
+            (x, y), (hx, hy) = divmod(head, cols), divmod(self.head, cols)
+            self.km += math.sqrt((x - hx) ** 2 + (y - hy) ** 2)
+            self.head = head
+            self.best -= 1  # One step of the known path is behind us
+
+    def _settled(self):
+        """True when the head's cost is proven within the current epsilon"""
+        g = self._g(self.head)
+        if g is None:
+            return False
+        return not self.open or g + self.epsilon * self.km <= self.open[0][0]
+
+    def _next_iteration(self, limit, budget_end):
+        """
+        ARA* step: lower epsilon and requeue open and inconsistent cells
+
+        The requeue is O(open) and cannot be interrupted, so it only starts
+        when it fits in what is left of this tick's budget: one unit of the
+        expansion limit per cell, and the estimated time per cell.
+
+        Returns:
+            int: Cells requeued, or -1 if the rebuild was left for a later tick
+        """
+        queued = len(self.open) + len(self.incons)
+        if limit is not None and queued > limit:
+            return -1
+        if (budget_end is not None
+                and time.perf_counter() + queued * self.rebuild_seconds_per_cell > budget_end):
+            return -1
+        start = time.perf_counter()
+        self.epsilon = max(1.0, self.epsilon - self.epsilon_step)
+        self.km = 0.0
+        cells = {cell for _, _, cell in self.open} | self.incons
+        g_table, base = self.g_table, self.base
+        self.garbage.append(self.open)
+        self.open = [(self._key(cell, g_table[cell] - base), g_table[cell] - base, cell)
+                     for cell in cells]
+        heapq.heapify(self.open)
+        self.mark += 1  # Nothing is closed in the new iteration
+        self.incons = set()
+        self.searches += 1
+        if cells:
+            # Keep the estimate on the safe side of the latest measurement
+            self.rebuild_seconds_per_cell = max(
+                (time.perf_counter() - start) / len(cells), 0.5 * self.rebuild_seconds_per_cell)
+        return queued
+
+    def _expand(self, limit, budget_end):
+        """
+        Run the search until the head is settled or the budget is spent
+
+        Returns:
+            int: Heap pops, stale and requeued entries included, so a run of
+                them cannot slip past the limit or the clock
+        """
+        board = self.board
+        neighbors, occupancy = board.neighbors, board.occupancy
+        g_table, base = self.g_table, self.base
+        parent_cell, parent_dir = self.parent_cell, self.parent_dir
+        closed, mark, open_heap, incons = self.closed, self.mark, self.open, self.incons
+        head = self.head
+        expanded = pops = 0
+        while open_heap and not self._settled():
+            if limit is not None and pops >= limit:
+                break
+            if (budget_end is not None and pops % TIME_CHECK_INTERVAL == 0
+                    and time.perf_counter() > budget_end):
+                break
+            pops += 1
+            key, cell_g, cell = heapq.heappop(open_heap)
+            if cell_g != g_table[cell] - base or closed[cell] == mark:
+                continue  # Stale entry
+            current = self._key(cell, cell_g)
+            if key < current:
+                # Pushed before the head moved: requeue with the fresh key
+                heapq.heappush(open_heap, (current, cell_g, cell))
+                continue
+            closed[cell] = mark
+            expanded += 1
+            if cell == head:
+                continue
+            ng = cell_g + 1
+            for direction, nb in neighbors[cell]:
+                if occupancy[nb] and nb != head:
+                    continue
+                old = g_table[nb] - base
+                if old < 0 or ng < old:
+                    g_table[nb] = base + ng
+                    # The snake moves from nb to cell: the opposite direction
+                    parent_cell[nb] = cell
+                    parent_dir[nb] = (direction + 2) % 4
+                    if closed[nb] == mark:
+                        incons.add(nb)
+                    else:
+                        heapq.heappush(open_heap, (self._key(nb, ng), ng, nb))
+        self.nodes_expanded += expanded
+        return pops
+
+    def _greedy_move(self, head):
+        """Best-effort move while the head is not in the search tree yet"""
+        board = self.board
+        gx, gy = divmod(self.goal, board.cols)
+        best, best_score = [], math.inf
+        for direction, nb in board.neighbors[head]:
+            if board.occupancy[nb]:
+                continue
+            x, y = divmod(nb, board.cols)
+            score = math.sqrt((x - gx) ** 2 + (y - gy) ** 2)
+            if score < best_score:
+                best, best_score = [direction], score
+        if best:
+            self.fallback_moves += 1
+        return best
+
+    def plan(self, sim):
+        head, goal = sim.head, sim.food
+        budget_end = (time.perf_counter() + self.max_seconds
+                      if self.max_seconds is not None else None)
+        if goal != self.goal:
+            self._reset(goal, head)
+        else:
+            self._move_head(head)
+            step = self._step(head)
+            if step is not None and not self.board.passable(step[0]):
+                # The tree path runs into the body: start over from this state
+                self._reset(goal, head)
+
+        spent = 0
+        while True:
+            remaining = None if self.max_expansions is None else self.max_expansions - spent
+            if remaining is not None and remaining <= 0:
+                break
+            if budget_end is not None and time.perf_counter() > budget_end:
+                break
+            if not self._settled():
+                if not self.open:
+                    break
+                spent += self._expand(remaining, budget_end)
+                if not self._settled():
+                    break
+            cost = self._g(head)
+            if cost < self.best:
+                if self.best < math.inf:
+                    self.improvements += 1
+                self.best = cost
+            if self.epsilon <= 1.0:
+                break
+            if budget_end is not None and time.perf_counter() > budget_end:
+                break  # Tighten epsilon next tick
+            requeued = self._next_iteration(
+                None if self.max_expansions is None else self.max_expansions - spent, budget_end)
+            if requeued < 0:
+                break
+            spent += requeued
+
+        self._free_garbage(budget_end)
+        step = self._step(head)
+        if step is not None:
+            return [step[1]]
+        if not self.open:
+            return []  # Search exhausted: the food is unreachable
+        return self._greedy_move(head)
+
+    def stats(self):
+        return {'fallback_moves': self.fallback_moves, 'path_improvements': self.improvements}
+
+    def fork(self, board):
+        # Copying the search tree costs more than regrowing it: start afresh,
+        # with tables of its own allocated on the first search
+        planner = super().fork(board)
+        planner.goal = -1
+        planner.g_table = None
+        planner.open = []
+        planner.incons = set()
+        planner.garbage = []
+        return planner
+
+
+# Example usage
+if __name__ == "__main__":
+    from types import SimpleNamespace
+
+    from snake_engine import AStarPlanner, make_board
+
+    board = make_board(400, 400, 20, seed=1, layout='blobs')
+    head, food = board.cell(200, 200), board.cell(10, 390)
+    board.occupy(head)
+    start = time.perf_counter()
+    optimal = len(AStarPlanner(board).search(head, food))
+    print(f"🎯 A* to completion: {optimal} steps in {(time.perf_counter() - start) * 1000:.0f} ms")
+
+    planner = AnytimePlanner(board, max_seconds=0.002)
+    sim = SimpleNamespace(head=head, food=food)
+    ticks, worst = 0, 0.0
+    while sim.head != food:
+        start = time.perf_counter()
+        move = planner.plan(sim)
+        worst = max(worst, time.perf_counter() - start)
+        if not move:
+            break
+        board.release(sim.head)
+        sim.head = board.move(sim.head, move[0])
+        board.occupy(sim.head)
+        ticks += 1
+    print(f"⏱️  Anytime (2 ms/tick): {ticks} steps, worst tick {worst * 1000:.1f} ms, "
+          f"{planner.fallback_moves} greedy moves, final epsilon {planner.epsilon}")
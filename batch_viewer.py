@@ -0,0 +1,168 @@
+"""
+Live Batch Viewer for Headless Snake Episodes
+Shows a sample of a headless batch in one pygame window: the window is split
+into tiles, each tile plays episodes one after another, and all of them are
+driven by a single GameScheduler, so the simulations can run unbounded (or at
+a fixed rate) while the window only redraws at the render rate.
+"""
+
+import math
+import time
+
+import pygame
+
+from game_scheduler import GameScheduler
+from pixel_renderer import PixelRenderer, use_pixels
+from snake_engine import episode_record, make_episode
+
+# Colors (same palette as the games)
+BLACK = (0, 0, 0)
+WHITE = (255, 255, 255)
+BLUE = (0, 0, 255)
+GREEN = (0, 255, 0)
+RED = (255, 0, 0)
+GRAY = (128, 128, 128)
+
+
+class EpisodeTile:
+    """One tile of the viewer, playing its share of the episode seeds"""
+
+    def __init__(self, seeds, settings, rect, on_record=None, render='auto'):
+        """
+        Args:
+            seeds (list): Episode seeds to play in order
+            settings (dict): make_episode keyword arguments
+            rect (pygame.Rect): Area of the window to draw into
+            on_record (callable, optional): Called with each finished record
+            render (str): 'rects' (one rect per cell), 'pixels' (one
+                surfarray image per frame) or 'auto' (pixels for small cells)
+        """
+        self.seeds = list(seeds)
+        self.settings = settings
+        self.rect = rect
+        self.on_record = on_record
+        self.render = render
+        self.sim = None
+        self.start_time = 0.0
+        self.background = None
+        self.renderer = None
+        self._next_episode()
+
+    def _next_episode(self):
+        """Start the next seed; False when this tile has none left"""
+        if not self.seeds:
+            return False
+        self.sim = make_episode(self.seeds.pop(0), **self.settings)
+        self.start_time = time.perf_counter()
+        self.background = None
+        self.renderer = None
+        return True
+
+    def update(self):
+        """Advance the current episode one tick, moving on when it ends"""
+        if self.sim.step():
+            return True
+        if self.on_record is not None:
+            self.on_record(episode_record(self.sim, time.perf_counter() - self.start_time))
+        return self._next_episode()
+
+    def _cell_rect(self, cell):
+        board = self.sim.board
+        x, y = board.coords(cell)
+        size = min(self.rect.width / board.rows, self.rect.height / board.cols)
+        return pygame.Rect(self.rect.x + int(x * size), self.rect.y + int(y * size),
+                           max(1, int(size)), max(1, int(size)))
+
+    def draw(self, surface, font):
+        board = self.sim.board
+        if use_pixels(self.render, board.rows, board.cols, self.rect.size):
+            if self.renderer is None:
+                self.renderer = PixelRenderer(board.rows, board.cols, board.obstacles,
+                                              self.rect.size)
+            self.renderer.draw(surface, self.rect, board.occupancy, self.sim.food, self.sim.head)
+        else:
+            self._draw_rects(surface)
+        pygame.draw.rect(surface, GRAY, self.rect, 1)
+
+        label = f"seed {self.sim.settings['seed']}  score {self.sim.score}"
+        surface.blit(font.render(label, True, GRAY), (self.rect.x + 4, self.rect.y + 4))
+
+    def _draw_rects(self, surface):
+        board = self.sim.board
+        if self.background is None:
+            # Obstacles never move, so they are drawn once per episode
+            self.background = pygame.Surface(self.rect.size)
+            self.background.fill(BLACK)
+            offset = pygame.Vector2(self.rect.topleft)
+            for cell in range(board.size):
+                if board.obstacles[cell]:
+                    pygame.draw.rect(self.background, RED, self._cell_rect(cell).move(-offset))
+        surface.blit(self.background, self.rect)
+
+        for cell in self.sim.body:
+            surface.fill(WHITE, self._cell_rect(cell))
+        if self.sim.food >= 0:
+            surface.fill(GREEN, self._cell_rect(self.sim.food))
+        surface.fill(BLUE, self._cell_rect(self.sim.head))
+
+
+def watch_episodes(episodes=20, seed=0, tiles=4, sim_rate=None, render_rate=30,
+                   window=800, on_record=None, render='auto', **settings):
+    """
+    Play a batch of episodes while watching them live
+
+    Args:
+        episodes (int): Total number of episodes
+        seed (int): First episode seed
+        tiles (int): Episodes shown at once
+        sim_rate (float, optional): Ticks per second per tile (None: unbounded)
+        render_rate (float): Frames per second
+        window (int): Window size in pixels
+        on_record (callable, optional): Called with each finished episode record
+        render (str): 'rects', 'pixels' or 'auto' (see EpisodeTile)
+        **settings: Passed through to make_episode (dense boards only: both
+            renderers read every cell, which a sparse board cannot afford)
+    """
+    if settings.get('sparse'):
+        raise ValueError("The batch viewer draws every cell and needs a dense board")
+    pygame.init()
+    tiles = max(1, min(tiles, episodes))
+    columns = math.ceil(math.sqrt(tiles))
+    grid_rows = math.ceil(tiles / columns)
+    tile_size = window // columns
+    screen = pygame.display.set_mode([tile_size * columns, tile_size * grid_rows])
+    pygame.display.set_caption("Snake A* - Live Batch")
+    font = pygame.font.Font(None, 20)
+
+    scheduler = GameScheduler(render_rate=render_rate)
+    seeds = list(range(seed, seed + episodes))
+    views = []
+    for index in range(tiles):
+        rect = pygame.Rect((index % columns) * tile_size, (index // columns) * tile_size,
+                           tile_size, tile_size)
+        view = EpisodeTile(seeds[index::tiles], settings, rect, on_record, render)
+        views.append(view)
+        scheduler.add_simulation(view.update, rate=sim_rate)
+
+    def frame(now):
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT or (event.type == pygame.KEYDOWN and
+                                             event.key == pygame.K_ESCAPE):
+                return False
+        screen.fill(BLACK)
+        for view in views:
+            view.draw(screen, font)
+        pygame.display.flip()
+
+    try:
+        scheduler.run(frame)
+    finally:
+        pygame.quit()
+    return scheduler
+
+
+# Example usage
+if __name__ == "__main__":
+    watch_episodes(episodes=8, tiles=4, sim_rate=30,
+                   on_record=lambda record: print(f"🏁 seed {record['seed']}: "
+                                                  f"score {record['score']} ({record['death_cause']})"))
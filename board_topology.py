@@ -0,0 +1,212 @@
+"""
+Board Topology Cache for Snake A* Experiments
+Everything about a board that depends only on its obstacle layout (neighbour
+table, connected components and the Hamiltonian cycle) is computed once per
+layout and reused: Board takes its neighbour lists, ReachabilityIndex starts
+from the components instead of labelling the board itself, and
+HamiltonianPlanner takes the cycle.
+
+Topologies are keyed by a hash of the obstacle bitmap, kept in memory for the
+current process and saved as .npy files that later runs memory-map on load, so
+repeated episodes on the same fixed map skip the whole setup.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from collections import deque
+
+import numpy as np
+
+TOPOLOGY_CACHE_DIR = '.topology_cache'
+TOPOLOGY_VERSION = 2
+MAX_MEMORY_ENTRIES = 32
+
+# Per-cell arrays saved for each layout
+ARRAYS = ('neighbors', 'components', 'successor', 'position')
+
+_memory_cache = {}
+
+
+def topology_key(rows, cols, obstacles):
+    """Hash identifying an obstacle layout"""
+    digest = hashlib.sha1(f'{TOPOLOGY_VERSION}:{rows}x{cols}:'.encode())
+    digest.update(bytes(obstacles))
+    return digest.hexdigest()
+
+
+class Topology:
+    """Obstacle-only precomputations for one board layout"""
+
+    def __init__(self, key, rows, cols, cycle_length, arrays):
+        """
+        Args:
+            key (str): topology_key of the layout
+            rows, cols (int): Board size
+            cycle_length (int): Number of cells on the Hamiltonian cycle
+            arrays (dict): NumPy arrays named in ARRAYS, one entry per cell
+                (neighbors has four columns, -1 where a move is blocked)
+        """
+        self.key = key
+        self.rows = rows
+        self.cols = cols
+        self.cycle_length = cycle_length
+        for name in ARRAYS:
+            setattr(self, name, arrays[name])
+        self._neighbor_lists = None
+
+    def neighbor_lists(self):
+        """Board.neighbors-style (direction, cell) tuples, built once per topology"""
+        if self._neighbor_lists is None:
+            self._neighbor_lists = [
+                tuple((direction, cell) for direction, cell in enumerate(row) if cell >= 0)
+                for row in self.neighbors.tolist()]
+        return self._neighbor_lists
+
+    def component_sizes(self):
+        """Number of free cells in each component, indexed by label"""
+        labels = self.components[self.components >= 0]
+        return np.bincount(labels) if labels.size else np.zeros(0, dtype=np.int64)
+
+
+def _neighbor_table(rows, cols, free):
+    """(size, 4) table of the free cell reached in each direction, or -1"""
+    cells = np.arange(rows * cols, dtype=np.int32).reshape(rows, cols)
+    table = np.full((rows, cols, 4), -1, dtype=np.int32)
+    table[:, :-1, 0] = cells[:, 1:]    # down  (y + 1)
+    table[:-1, :, 1] = cells[1:, :]    # right (x + 1)
+    table[:, 1:, 2] = cells[:, :-1]    # up    (y - 1)
+    table[1:, :, 3] = cells[:-1, :]    # left  (x - 1)
+    table = table.reshape(-1, 4)
+    blocked = table >= 0
+    blocked[blocked] = ~free[table[blocked]]
+    table[blocked] = -1
+    return table
+
+
+def _bfs_labels(table, free):
+    """Component label of every free cell (-1 for obstacles), numbered from 0"""
+    components = np.full(len(free), -1, dtype=np.int32)
+    rows = table.tolist()
+    label = 0
+    for seed in np.flatnonzero(free).tolist():
+        if components[seed] >= 0:
+            continue
+        components[seed] = label
+        queue = deque([seed])
+        while queue:
+            for nb in rows[queue.popleft()]:
+                if nb >= 0 and components[nb] < 0:
+                    components[nb] = label
+                    queue.append(nb)
+        label += 1
+    return components
+
+
+def compute_topology(rows, cols, obstacles):
+    """Build the Topology of an obstacle layout from scratch"""
+    from hamiltonian_planner import build_hamiltonian_cycle
+    from snake_engine import Board
+
+    board = Board(rows, cols, obstacles)
+    free = np.frombuffer(bytes(obstacles), dtype=np.uint8) == 0
+    table = _neighbor_table(rows, cols, free)
+    successor, position, length = build_hamiltonian_cycle(board)
+    arrays = {
+        'neighbors': table,
+        'components': _bfs_labels(table, free),
+        'successor': np.frombuffer(successor, dtype=np.int32).copy(),
+        'position': np.frombuffer(position, dtype=np.int32).copy(),
+    }
+    key = topology_key(rows, cols, obstacles)
+    return Topology(key, rows, cols, length, arrays)
+
+
+def save_topology(topology, cache_dir=TOPOLOGY_CACHE_DIR):
+    """Write a topology to cache_dir/<key>/ atomically"""
+    target = os.path.join(cache_dir, topology.key)
+    if os.path.isdir(target):
+        return target
+    os.makedirs(cache_dir, exist_ok=True)
+    staging = tempfile.mkdtemp(prefix='.tmp-', dir=cache_dir)
+    try:
+        for name in ARRAYS:
+            np.save(os.path.join(staging, name + '.npy'), getattr(topology, name))
+        with open(os.path.join(staging, 'meta.json'), 'w') as f:
+            json.dump({'rows': topology.rows, 'cols': topology.cols,
+                       'cycle_length': topology.cycle_length,
+                       'version': TOPOLOGY_VERSION}, f)
+        os.replace(staging, target)
+    except OSError:
+        # Another process saved the same layout first
+        shutil.rmtree(staging, ignore_errors=True)
+    return target
+
+
+def read_topology(key, cache_dir=TOPOLOGY_CACHE_DIR):
+    """Memory-map a saved topology, or None if it is not on disk"""
+    directory = os.path.join(cache_dir, key)
+    try:
+        with open(os.path.join(directory, 'meta.json')) as f:
+            meta = json.load(f)
+        arrays = {name: np.load(os.path.join(directory, name + '.npy'), mmap_mode='r')
+                  for name in ARRAYS}
+    except (OSError, ValueError):
+        return None
+    if meta.get('version') != TOPOLOGY_VERSION:
+        return None
+    return Topology(key, meta['rows'], meta['cols'], meta['cycle_length'], arrays)
+
+
+def load_topology(rows, cols, obstacles, cache_dir=TOPOLOGY_CACHE_DIR):
+    """
+    Topology of a layout from memory, then disk, computing it on a miss
+
+    Args:
+        rows, cols (int): Board size
+        obstacles (bytes-like): Obstacle bitmap as passed to Board
+        cache_dir (str, optional): Directory of saved topologies (None keeps
+            the cache in memory only)
+
+    Returns:
+        Topology: Shared, read-only topology for the layout
+    """
+    key = topology_key(rows, cols, obstacles)
+    topology = _memory_cache.get(key)
+    if topology is None and cache_dir:
+        topology = read_topology(key, cache_dir)
+    if topology is None:
+        topology = compute_topology(rows, cols, obstacles)
+        if cache_dir:
+            save_topology(topology, cache_dir)
+    if len(_memory_cache) >= MAX_MEMORY_ENTRIES and key not in _memory_cache:
+        del _memory_cache[next(iter(_memory_cache))]
+    _memory_cache[key] = topology
+    return topology
+
+
+def clear_memory_cache():
+    """Forget the topologies held by this process"""
+    _memory_cache.clear()
+
+
+# Example usage
+if __name__ == "__main__":
+    import time
+
+    from snake_engine import make_board
+
+    cache_dir = tempfile.mkdtemp()
+    for label in ('compute', 'disk', 'memory'):
+        if label == 'disk':
+            clear_memory_cache()
+        start = time.perf_counter()
+        board = make_board(100, 100, 3, seed=1, topology_cache=cache_dir)
+        elapsed = (time.perf_counter() - start) * 1000
+        topology = board.topology
+        print(f"⏱️  {label:8s} {elapsed:8.1f} ms  "
+              f"components={len(topology.component_sizes())} "
+              f"cycle={topology.cycle_length}")
+    shutil.rmtree(cache_dir)
@@ -0,0 +1,203 @@
+"""
+Parallel Frame Export for Recorded Snake Episodes
+Replays episode records (the JSON lines written by snake_cli.py simulate)
+headlessly through the SDL dummy video driver and writes every frame straight
+to PNG files or to one raw RGB24 video stream per episode, with no real-time
+playback. Episodes are cut into frame ranges that worker processes render in
+parallel; each worker fast-forwards the headless simulation to its first
+frame, and the obstacle layer is drawn once per range (PixelRenderer).
+
+Records carry the seed and board settings but not every option, so a replay
+is only exact for deterministic runs: planner options can be passed back in,
+and time-budgeted runs (max_seconds, anytime with a time limit) may diverge.
+Each episode summary says whether the replay matched the recorded score and
+length.
+"""
+
+import os
+import shutil
+from concurrent.futures import ProcessPoolExecutor
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')  # must happen before pygame opens a display
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')  # one banner per worker otherwise
+import pygame
+
+from pixel_renderer import PixelRenderer
+from snake_engine import PLANNERS, make_episode
+
+FORMATS = ('png', 'raw')
+FRAME_SIZE = 400       # Pixels along the longer board side
+CHUNK_FRAMES = 1000    # Frames per worker job
+LABEL_COLOR = (128, 128, 128)
+
+# Record fields that make_episode takes back unchanged
+RECORD_SETTINGS = ('planner', 'layout', 'rows', 'cols', 'obstacle_probability', 'seed',
+                   'board_seed')
+
+
+def replay_settings(record, **overrides):
+    """
+    make_episode settings that replay a recorded episode
+
+    The replay is capped at the recorded length and runs without livelock
+    detection, so it stops where the recording stopped.
+
+    Args:
+        record (dict): Episode record
+        **overrides: Extra make_episode settings (e.g. planner_options)
+    """
+    settings = {key: record[key] for key in RECORD_SETTINGS if key in record}
+    settings.update(topology_cache=False, livelock_repeats=0,
+                    max_steps=record.get('steps') or None)
+    if record.get('food_respawns'):
+        settings['unreachable_food'] = 'respawn'
+    elif record.get('death_cause') == 'sealed':
+        settings['unreachable_food'] = 'end'
+    settings.update(overrides)
+    return settings
+
+
+def frame_size(rows, cols, size=FRAME_SIZE):
+    """(width, height) keeping the board aspect, rounded to even pixels for video encoders"""
+    scale = size / max(rows, cols)
+    return (2 * max(1, round(rows * scale / 2)), 2 * max(1, round(cols * scale / 2)))
+
+
+def episode_name(index, record):
+    return f"{index:04d}_{record['planner']}_seed{record['seed']}"
+
+
+def _export_range(job):
+    """Render frames [first, last) of one episode (worker entry point)"""
+    if not pygame.get_init():
+        pygame.init()
+    font = pygame.font.Font(None, 20)
+    sim = make_episode(**job['settings'])
+    board, every = sim.board, job['every']
+    renderer = PixelRenderer(board.rows, board.cols, board.obstacles, job['size'])
+
+    stream = open(job['path'], 'wb') if job['format'] == 'raw' else None
+    written = 0
+    try:
+        for frame in range(job['first'], job['last']):
+            target = min(frame * every, job['steps'])  # The last frame shows the end
+            while sim.steps < target and sim.step():
+                pass
+            if sim.steps < target:
+                break  # The replay ended early
+            surface = renderer.render(board.occupancy, sim.food, sim.head)
+            label = f"seed {sim.settings['seed']}  score {sim.score}  step {sim.steps}"
+            surface.blit(font.render(label, True, LABEL_COLOR), (4, 4))
+            if stream is None:
+                pygame.image.save(surface, os.path.join(job['path'], f"frame_{frame:06d}.png"))
+            else:
+                stream.write(pygame.image.tobytes(surface, 'RGB'))
+            written += 1
+    finally:
+        if stream is not None:
+            stream.close()
+    return {'index': job['index'], 'part': job['part'], 'frames': written,
+            'score': sim.score, 'steps': sim.steps}
+
+
+def _build_jobs(records, output_dir, fmt, size, every, chunk_frames, overrides):
+    jobs = []
+    for index, record in enumerate(records):
+        name = episode_name(index, record)
+        frames = -(-record['steps'] // every) + 1
+        for part, first in enumerate(range(0, frames, chunk_frames)):
+            if fmt == 'png':
+                path = os.path.join(output_dir, name)
+                os.makedirs(path, exist_ok=True)
+            else:
+                path = os.path.join(output_dir, f"{name}.part{part:04d}.rgb")
+            jobs.append({
+                'index': index, 'part': part, 'first': first,
+                'last': min(first + chunk_frames, frames), 'every': every,
+                'steps': record['steps'], 'format': fmt,
+                'size': frame_size(record['rows'], record['cols'], size), 'path': path,
+                'settings': replay_settings(record, **overrides),
+            })
+    return jobs
+
+
+def export_records(records, output_dir='frames', fmt='png', size=FRAME_SIZE, every=1,
+                   chunk_frames=CHUNK_FRAMES, max_workers=None, **overrides):
+    """
+    Render recorded episodes to image files or raw video
+
+    Args:
+        records (iterable): Episode records from snake_cli.py simulate
+        output_dir (str): Directory receiving one folder of PNGs or one .rgb
+            file per episode
+        fmt (str): 'png' (frame_NNNNNN.png files) or 'raw' (RGB24 frames,
+            back to back; see the 'ffmpeg' hint in the summary)
+        size (int): Frame size in pixels along the longer board side
+        every (int): Render every n-th tick (plus the final one)
+        chunk_frames (int): Frames per worker job; long episodes are split
+            into several jobs
+        max_workers (int, optional): Worker processes; 1 renders in-process
+        **overrides: Extra make_episode settings for the replays
+
+    Returns:
+        list: One summary dict per exported episode
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown format '{fmt}' (choose from {', '.join(FORMATS)})")
+    os.makedirs(output_dir, exist_ok=True)
+    # Multi-snake records ('multi-bfs') have no single-snake planner to replay
+    records = [record for record in records if record.get('planner') in PLANNERS]
+    jobs = _build_jobs(records, output_dir, fmt, size, max(1, every), chunk_frames, overrides)
+
+    if max_workers == 1 or len(jobs) <= 1:
+        results = [_export_range(job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            results = list(pool.map(_export_range, jobs))
+
+    summaries = []
+    for index, record in enumerate(records):
+        name = episode_name(index, record)
+        parts = sorted((result['part'], result) for result in results if result['index'] == index)
+        last = parts[-1][1]
+        width, height = frame_size(record['rows'], record['cols'], size)
+        summary = {'episode': name, 'frames': sum(result['frames'] for _, result in parts),
+                   'width': width, 'height': height,
+                   'replay_matches': (last['score'], last['steps']) == (record['score'],
+                                                                         record['steps'])}
+        if fmt == 'raw':
+            path = os.path.join(output_dir, f"{name}.rgb")
+            with open(path, 'wb') as video:
+                for part, _ in parts:
+                    part_path = os.path.join(output_dir, f"{name}.part{part:04d}.rgb")
+                    with open(part_path, 'rb') as chunk:
+                        shutil.copyfileobj(chunk, video)
+                    os.remove(part_path)
+            summary['path'] = path
+            summary['ffmpeg'] = (f"ffmpeg -f rawvideo -pix_fmt rgb24 -s {width}x{height} "
+                                 f"-r 30 -i {path} {os.path.splitext(path)[0]}.mp4")
+        else:
+            summary['path'] = os.path.join(output_dir, name)
+        summaries.append(summary)
+    return summaries
+
+
+# Example usage
+if __name__ == "__main__":
+    import tempfile
+    import time
+
+    from snake_engine import run_episodes
+
+    records = list(run_episodes(4, seed=0, planner='astar'))
+    frames = sum(record['steps'] + 1 for record in records)
+    with tempfile.TemporaryDirectory() as output_dir:
+        for fmt in FORMATS:
+            start = time.perf_counter()
+            summaries = export_records(records, output_dir, fmt=fmt, chunk_frames=250)
+            elapsed = time.perf_counter() - start
+            matched = sum(summary['replay_matches'] for summary in summaries)
+            print(f"🎞️  {fmt}: {frames} frames in {elapsed:.1f} s "
+                  f"({frames / elapsed:.0f} frames/s on {os.cpu_count()} CPUs), "
+                  f"{matched}/{len(records)} replays match")
+        print(f"🎬 {summaries[0]['ffmpeg']}")
@@ -0,0 +1,144 @@
+"""
+Asyncio Game Scheduler for the Snake Games
+Runs simulation and rendering as separate asyncio tasks instead of tying both
+to one clock.tick(fps) call: each simulation loop ticks at its own rate (or as
+fast as possible), while frames are drawn at a capped render rate. When the
+simulation is faster than the display, intermediate states are simply not
+drawn; when it is slower, render callbacks can use SimulationLoop.alpha() to
+interpolate between ticks.
+
+Several simulation loops can share one scheduler, so many games can be stepped
+and observed in a single process.
+"""
+
+import asyncio
+
+
+class SimulationLoop:
+    """One update callback ticking at a fixed rate or unbounded"""
+
+    def __init__(self, update, rate=None, batch=64):
+        """
+        Args:
+            update (callable): Advances the game one tick; returning False
+                ends this loop
+            rate (float, optional): Ticks per second (None runs unbounded)
+            batch (int): Unbounded ticks between yields to the event loop
+        """
+        self.update = update
+        self.rate = rate
+        self.batch = batch
+        self.ticks = 0
+        self.finished = False
+        self.last_tick = None
+
+    def alpha(self, now):
+        """Fraction of the current tick interval that has elapsed (0..1)"""
+        if self.rate is None or self.last_tick is None:
+            return 1.0
+        return min(1.0, (now - self.last_tick) * self.rate)
+
+    def _tick(self, now):
+        if self.update() is False:
+            self.finished = True
+        self.ticks += 1
+        self.last_tick = now
+
+
+class GameScheduler:
+    """Drive simulation loops and one render callback on an asyncio loop"""
+
+    def __init__(self, render_rate=30, max_catch_up=5):
+        """
+        Args:
+            render_rate (float): Maximum frames per second
+            max_catch_up (int): Late fixed-rate ticks run back to back before
+                the rest of the backlog is dropped
+        """
+        self.render_rate = render_rate
+        self.max_catch_up = max_catch_up
+        self.loops = []
+        self.frames = 0
+        self.running = False
+
+    def add_simulation(self, update, rate=None, batch=64):
+        """Register an update callback; returns its SimulationLoop"""
+        loop = SimulationLoop(update, rate, batch)
+        self.loops.append(loop)
+        return loop
+
+    def stop(self):
+        self.running = False
+
+    async def _simulate(self, sim_loop):
+        clock = asyncio.get_running_loop().time
+        if sim_loop.rate is None:
+            while self.running and not sim_loop.finished:
+                for _ in range(sim_loop.batch):
+                    sim_loop._tick(clock())
+                    if sim_loop.finished:
+                        break
+                await asyncio.sleep(0)
+            return
+
+        interval = 1.0 / sim_loop.rate
+        next_tick = clock()
+        while self.running and not sim_loop.finished:
+            now = clock()
+            late = 0
+            while now >= next_tick and late < self.max_catch_up and not sim_loop.finished:
+                sim_loop._tick(now)
+                next_tick += interval
+                late += 1
+            if now >= next_tick:
+                next_tick = now + interval  # Too far behind: drop the backlog
+            await asyncio.sleep(max(0.0, next_tick - clock()))
+
+    async def _render(self, render):
+        clock = asyncio.get_running_loop().time
+        interval = 1.0 / self.render_rate
+        while self.running:
+            start = clock()
+            if render(start) is False:
+                self.running = False
+                break
+            self.frames += 1
+            if self.loops and all(sim_loop.finished for sim_loop in self.loops):
+                self.running = False
+                break
+            await asyncio.sleep(max(0.0, interval - (clock() - start)))
+
+    async def run_async(self, render):
+        """
+        Run until render returns False, stop() is called, or every
+        simulation loop has finished
+
+        Args:
+            render (callable): Called with the loop time once per frame
+        """
+        self.running = True
+        tasks = [self._simulate(sim_loop) for sim_loop in self.loops]
+        await asyncio.gather(self._render(render), *tasks)
+
+    def run(self, render):
+        """Blocking wrapper around run_async"""
+        asyncio.run(self.run_async(render))
+
+
+# Example usage
+if __name__ == "__main__":
+    from snake_engine import make_episode
+
+    sims = [make_episode(seed) for seed in range(4)]
+    scheduler = GameScheduler(render_rate=10)
+    scheduler.add_simulation(sims[0].step, rate=50)
+    for sim in sims[1:]:
+        scheduler.add_simulation(sim.step)
+
+    def report(now):
+        print("🐍 " + " | ".join(f"score {sim.score:3d} ticks {sim_loop.ticks:5d}"
+                                 for sim, sim_loop in zip(sims, scheduler.loops)))
+        return scheduler.frames < 20
+
+    scheduler.run(report)
+    print(f"🎞️  {scheduler.frames} frames rendered")
@@ -0,0 +1,323 @@
+"""
+Hamiltonian-Cycle Planner for Snake A* Algorithm
+Precomputes a Hamiltonian cycle once per board and follows it, so the snake can
+keep going late in the game when a plain A* search would find no path.
+A* is only used to take shortcuts towards the food, and a shortcut is taken only
+while it keeps the body in cycle order (it never jumps past the tail).
+
+The cycle is built with the spanning-tree construction: the board is split into
+2x2 blocks, a spanning tree is grown over the blocks that contain no obstacle,
+and the cycle runs around that tree. It covers every cell of those blocks; cells
+in blocks touched by an obstacle (and the last row/column of odd-sized boards)
+are reached with ordinary A* moves instead.
+"""
+
+from array import array
+from collections import deque
+
+from snake_engine import AStarPlanner, Planner
+
+
+def _free_blocks(board):
+    """Set of (bx, by) 2x2 blocks whose four cells are obstacle-free"""
+    cols, obstacles = board.cols, board.obstacles
+    free = set()
+    for bx in range(board.rows // 2):
+        for by in range(board.cols // 2):
+            x, y = 2 * bx, 2 * by
+            cell = x * cols + y
+            if not (obstacles[cell] or obstacles[cell + 1] or
+                    obstacles[cell + cols] or obstacles[cell + cols + 1]):
+                free.add((bx, by))
+    return free
+
+
+def _spanning_tree(free, root):
+    """BFS spanning tree over free blocks reachable from root, as parent links"""
+    parent = {root: None}
+    queue = deque([root])
+    while queue:
+        bx, by = queue.popleft()
+        for nb in ((bx + 1, by), (bx, by + 1), (bx - 1, by), (bx, by - 1)):
+            if nb in free and nb not in parent:
+                parent[nb] = (bx, by)
+                queue.append(nb)
+    return parent
+
+
+def build_hamiltonian_cycle(board, start=None):
+    """
+    Hamiltonian cycle over the obstacle-free 2x2 blocks connected to start
+
+    Args:
+        board (Board): Board to cover
+        start (int, optional): Cell whose block should be covered (default: centre)
+
+    Returns:
+        tuple: (successor, position, length) where successor[cell] is the next
+            cell on the cycle and position[cell] its index along the cycle,
+            both -1 for cells off the cycle
+    """
+    cols = board.cols
+    if start is None:
+        start = board.cell(board.rows // 2, board.cols // 2)
+    successor = array('i', [-1]) * board.size
+    position = array('i', [-1]) * board.size
+
+    free = _free_blocks(board)
+    if not free:
+        return successor, position, 0
+    sx, sy = board.coords(start)
+    root = (sx // 2, sy // 2)
+    if root not in free:
+        # Cover the largest group of free blocks instead
+        root, best = None, 0
+        seen = set()
+        for block in free:
+            if block not in seen:
+                tree = _spanning_tree(free, block)
+                seen.update(tree)
+                if len(tree) > best:
+                    root, best = block, len(tree)
+    tree = _spanning_tree(free, root)
+
+    # Every block starts as its own 4-cycle a-b-c-d
+    links = {}
+
+    def link(u, v):
+        links.setdefault(u, set()).add(v)
+        links.setdefault(v, set()).add(u)
+
+    def unlink(u, v):
+        links[u].discard(v)
+        links[v].discard(u)
+
+    for bx, by in tree:
+        a = (2 * bx) * cols + 2 * by
+        b, c, d = a + 1, a + cols + 1, a + cols
+        link(a, b)
+        link(b, c)
+        link(c, d)
+        link(d, a)
+
+    # Each tree edge merges two block cycles by swapping their facing sides
+    for block, parent_block in tree.items():
+        if parent_block is None:
+            continue
+        first, second = sorted((block, parent_block))
+        a = (2 * first[0]) * cols + 2 * first[1]
+        if second[0] == first[0] + 1:   # neighbour in +x
+            d, c = a + cols, a + cols + 1
+            a2 = a + 2 * cols
+            b2 = a2 + 1
+            unlink(d, c)
+            unlink(a2, b2)
+            link(d, a2)
+            link(c, b2)
+        else:                            # neighbour in +y
+            b, c = a + 1, a + cols + 1
+            a2 = a + 2
+            d2 = a2 + cols
+            unlink(b, c)
+            unlink(a2, d2)
+            link(b, a2)
+            link(c, d2)
+
+    # Orient the cycle starting from any covered cell
+    first_cell = next(iter(links))
+    prev, cell = None, first_cell
+    index = 0
+    while True:
+        position[cell] = index
+        index += 1
+        nxt = next(v for v in links[cell] if v != prev) if prev is not None else min(links[cell])
+        successor[cell] = nxt
+        prev, cell = cell, nxt
+        if cell == first_cell:
+            break
+    return successor, position, index
+
+
+class HamiltonianPlanner(Planner):
+    """
+    Follow a precomputed Hamiltonian cycle, taking safe A* shortcuts
+
+    plan() returns a single move per call, so the engine asks for a new move
+    every tick; following the cycle costs O(1) and A* runs at most once per
+    food item (plus retries when the food is off the cycle). Off the cycle,
+    each candidate move is checked to leave the tail reachable with a lookup
+    in a ReachabilityIndex, which relabels the board (O(cells)) only after a
+    move that may have split a free region.
+    """
+
+    cacheable = False  # Moves depend on the body order, not just the occupancy
+
+    def __init__(self, board, shortcuts=True, shortcut_limit=0.5, retry_interval=None):
+        """
+        Args:
+            board (Board): Board to plan on
+            shortcuts (bool): Take A* shortcuts when they keep cycle order
+            shortcut_limit (float): Disable shortcuts once the snake covers this
+                fraction of the cycle
+            retry_interval (int, optional): Ticks between A* retries for food off
+                the cycle (default: a quarter of the cycle length)
+        """
+        super().__init__(board)
+        topology = board.topology
+        if topology is not None:
+            self.successor = array('i', topology.successor.tobytes())
+            self.position = array('i', topology.position.tobytes())
+            self.length = topology.cycle_length
+        else:
+            self.successor, self.position, self.length = build_hamiltonian_cycle(board)
+        self.astar = AStarPlanner(board)
+        self.reachability = None  # Own index, made on first use if the episode has none
+        self.shortcuts = shortcuts
+        self.shortcut_limit = shortcut_limit
+        self.retry_interval = retry_interval or max(1, self.length // 4)
+
+        self.path = []            # Cached A* path to path_food
+        self.path_food = -1
+        self.last_search = None   # (food, tick) of the last A* attempt
+        self.consistent = 0       # Consecutive moves that kept cycle order
+        self.last_score = None
+        self.idle_ticks = 0
+
+    def _search(self, sim):
+        """A* to the food, recording the attempt and its cost"""
+        before = self.astar.nodes_expanded
+        self.path = self.astar.search(sim.head, sim.food)
+        self.nodes_expanded += self.astar.nodes_expanded - before
+        self.searches += 1
+        self.path_food = sim.food
+        self.last_search = (sim.food, sim.steps)
+
+    def fork(self, board):
+        # The cycle arrays are shared; the cached path is popped, so copy it
+        planner = super().fork(board)
+        planner.astar = self.astar.fork(board)
+        planner.path = list(self.path)
+        if self.reachability is not None:
+            planner.reachability = self.reachability.fork(board)
+        return planner
+
+    def _direction(self, head, cell):
+        """Direction code for a move between adjacent cells"""
+        delta = cell - head
+        if delta == 1:
+            return 0
+        if delta == self.board.cols:
+            return 1
+        if delta == -1:
+            return 2
+        return 3
+
+    def _cycle_safe(self, sim, cell):
+        """True if moving head -> cell keeps the body in cycle order"""
+        position, length = self.position, self.length
+        if position[cell] < 0 or not self.board.passable(cell):
+            return False
+        tail = position[sim.body[0]]
+        ahead = (position[cell] - tail) % length
+        return (position[sim.head] - tail) % length < ahead and (
+            position[sim.food] < 0 or ahead <= (position[sim.food] - tail) % length)
+
+    def plan(self, sim):
+        direction = self._next_move(sim)
+        return [] if direction is None else [direction]
+
+    def _next_move(self, sim):
+        head, food = sim.head, sim.food
+        if sim.score != self.last_score:
+            self.last_score = sim.score
+            self.idle_ticks = 0
+        self.idle_ticks += 1
+        if self.length == 0 or self.idle_ticks > 2 * self.length:
+            return None  # Circling without ever reaching the food
+        if food != self.path_food:
+            self.path = []
+
+        on_cycle = self.position[head] >= 0
+        ordered = (on_cycle and self.position[food] >= 0 and
+                   self.consistent >= len(sim.body) - 1)
+
+        if ordered:
+            # Shortcut towards the food while it cannot cut off the tail
+            if (self.shortcuts and len(sim.body) < self.shortcut_limit * self.length and
+                    (self.last_search is None or self.last_search[0] != food)):
+                self._search(sim)
+            if self.path:
+                cell = self.board.move(head, self.path[-1])
+                if self._cycle_safe(sim, cell):
+                    self.consistent += 1
+                    return self.path.pop()
+                self.path = []
+        else:
+            # Off the cycle or out of order: A* retried periodically, and every
+            # move must leave the tail reachable until cycle order is restored
+            if not self.path and (self.last_search is None or self.last_search[0] != food or
+                                  sim.steps - self.last_search[1] >= self.retry_interval):
+                self._search(sim)
+            candidates = []
+            if self.path:
+                candidates.append(self.board.move(head, self.path[-1]))
+            if on_cycle:
+                candidates.append(self.successor[head])
+            for cell in candidates:
+                if cell >= 0 and self.board.passable(cell) and self._tail_reachable(sim, cell):
+                    if self.path and cell == self.board.move(head, self.path[-1]):
+                        self.path.pop()
+                    else:
+                        self.path = []
+                    self.consistent = self.consistent + 1 if self.successor[head] == cell else 0
+                    return self._direction(head, cell)
+            self.path = []
+            self.consistent = 0
+            return self._survival_move(sim)
+
+        if on_cycle:
+            cell = self.successor[head]
+            if self.board.passable(cell):
+                self.consistent += 1
+                return self._direction(head, cell)
+        self.consistent = 0
+        return self._survival_move(sim)
+
+    def _tail_reachable(self, sim, cell):
+        """True if the head could still reach the tail after moving to (free) cell"""
+        if len(sim.body) == 1:
+            return True
+        neighbors, tail = self.board.neighbors, sim.body[0]
+        if any(nb == tail for _, nb in neighbors[cell]):
+            return True
+        # A free path from cell to a free neighbour of the tail exists exactly
+        # when they share a component
+        index = sim.reachability
+        if index is None:
+            if self.reachability is None:
+                from reachability import ReachabilityIndex
+
+                self.reachability = ReachabilityIndex(self.board)
+            index = self.reachability
+        component = index.component(cell)
+        return any(index.component(nb) == component for _, nb in neighbors[tail])
+
+    def _survival_move(self, sim):
+        """Move into the neighbour with the most reachable free space, if any"""
+        board = self.board
+        limit = len(sim.body) + 1  # Enough room to let the whole body follow
+        best, best_room = None, 0
+        for direction, cell in board.neighbors[sim.head]:
+            if not board.passable(cell):
+                continue
+            seen = {cell}
+            queue = deque([cell])
+            while queue and len(seen) < limit:
+                for _, nb in board.neighbors[queue.popleft()]:
+                    if nb not in seen and board.passable(nb):
+                        seen.add(nb)
+                        queue.append(nb)
+            self.nodes_expanded += len(seen)
+            if len(seen) > best_room:
+                best, best_room = direction, len(seen)
+        return best
@@ -0,0 +1,349 @@
+"""
+Hierarchical Path Planner (HPA*) for Very Large Snake Boards
+The board is divided into square clusters. Wherever two neighbouring clusters
+share a free stretch of border, one or two entrance cell pairs connect them.
+A query searches the small abstract graph of entrances and only refines the
+chosen segments into cell-level moves, so its cost grows with the number of
+clusters along the way rather than with the number of free cells.
+
+Intra-cluster entrance distances depend on the snake body as well as the
+obstacles. They are computed lazily the first time a cluster is searched and
+kept until the body enters or leaves that cluster (the graph is a Board
+watcher that marks clusters dirty), so snake movement only triggers local
+updates. Each rebuild is one scipy.sparse.csgraph call over the cluster's
+free cells; entrances depend on obstacles alone and are found once with NumPy.
+"""
+
+import copy
+import heapq
+
+import numpy as np
+
+from snake_engine import AStarPlanner, Planner
+
+CLUSTER_SIZE = 16
+LONG_ENTRANCE = 6  # Free border runs at least this long get two entrances
+
+
+def _runs(free, cluster_size):
+    """(start, end) of the free runs in a border line, split at cluster edges"""
+    padded = np.concatenate(([False], free, [False]))
+    edges = np.flatnonzero(padded[1:] != padded[:-1]).tolist()
+    runs = []
+    for start, end in zip(edges[::2], edges[1::2]):
+        while start < end:
+            stop = min(end, (start // cluster_size + 1) * cluster_size)
+            runs.append((start, stop))
+            start = stop
+    return runs
+
+
+class ClusterPaths:
+    """Shortest paths from a few source cells over the free cells of one cluster"""
+
+    def __init__(self, cols, window, sources, dist, pred):
+        self.cols = cols
+        self.x0, self.y0, self.width = window
+        self.rows = {source: row for row, source in enumerate(sources)}
+        self.dist = dist
+        self.pred = pred
+
+    def local(self, cell):
+        x, y = divmod(cell, self.cols)
+        return (x - self.x0) * self.width + y - self.y0
+
+    def distance(self, source, cell):
+        """Steps from source to cell, or None when it cannot be reached"""
+        d = self.dist[self.rows[source], self.local(cell)]
+        return None if d == np.inf else int(d)
+
+    def walk(self, source, cell):
+        """Cells from cell back to source (inclusive)"""
+        pred = self.pred[self.rows[source]]
+        x0, y0, width, cols = self.x0, self.y0, self.width, self.cols
+        index = self.local(cell)
+        cells = []
+        while index >= 0:
+            x, y = divmod(index, width)
+            cells.append((x0 + x) * cols + y0 + y)
+            index = pred[index]
+        return cells
+
+
+class AbstractGraph:
+    """Clusters, entrances and cached intra-cluster distances of one board"""
+
+    def __init__(self, board, cluster_size=CLUSTER_SIZE):
+        self.board = board
+        self.cluster_size = cluster_size
+        self.cluster_cols = -(-board.cols // cluster_size)
+        clusters = -(-board.rows // cluster_size) * self.cluster_cols
+        self.nodes = [set() for _ in range(clusters)]  # Entrance cells per cluster
+        self.inter = {}   # Entrance cell -> cells across the border
+        self.edges = {}   # Cluster -> {node: [(other node, distance)]}
+        self.paths = {}   # Cluster -> ClusterPaths from its entrances, for refinement
+        self.dirty = set()
+        self.rebuilds = 0
+        self.obstacles = np.frombuffer(board.obstacles, dtype=np.uint8).reshape(board.rows, board.cols)
+        self._find_entrances()
+        board.watchers.append(self)
+
+    @property
+    def occupancy(self):
+        # Fetched on use: a forked board replaces its bytearray on first write
+        board = self.board
+        return np.frombuffer(board.dense_occupancy(), dtype=np.uint8).reshape(board.rows, board.cols)
+
+    def cluster_of(self, cell):
+        x, y = divmod(cell, self.board.cols)
+        return (x // self.cluster_size) * self.cluster_cols + y // self.cluster_size
+
+    def _link(self, a, b):
+        self.nodes[self.cluster_of(a)].add(a)
+        self.nodes[self.cluster_of(b)].add(b)
+        self.inter.setdefault(a, []).append(b)
+        self.inter.setdefault(b, []).append(a)
+
+    def _find_entrances(self):
+        size, cols = self.cluster_size, self.board.cols
+        free = self.obstacles == 0
+        for x in range(size, self.board.rows, size):
+            # Border between cluster rows: cells (x - 1, y) and (x, y)
+            for start, end in _runs(free[x - 1] & free[x], size):
+                spots = (start, end - 1) if end - start >= LONG_ENTRANCE else ((start + end - 1) // 2,)
+                for y in spots:
+                    self._link((x - 1) * cols + y, x * cols + y)
+        for y in range(size, cols, size):
+            for start, end in _runs(free[:, y - 1] & free[:, y], size):
+                spots = (start, end - 1) if end - start >= LONG_ENTRANCE else ((start + end - 1) // 2,)
+                for x in spots:
+                    self._link(x * cols + y - 1, x * cols + y)
+
+    # Board watcher interface: the body changed inside this cluster
+    def occupy(self, cell):
+        self.dirty.add(self.cluster_of(cell))
+
+    def release(self, cell):
+        self.dirty.add(self.cluster_of(cell))
+
+    def shortest_paths(self, cluster, sources):
+        """
+        Paths from sources over the cluster's free cells (sources count as free)
+
+        Returns:
+            ClusterPaths: Distances and predecessors for every source
+        """
+        from scipy.sparse import csr_matrix
+        from scipy.sparse.csgraph import shortest_path
+
+        size, cols = self.cluster_size, self.board.cols
+        cx, cy = divmod(cluster, self.cluster_cols)
+        x0, y0 = cx * size, cy * size
+        x1, y1 = min(x0 + size, self.board.rows), min(y0 + size, cols)
+        width = y1 - y0
+        free = (self.obstacles[x0:x1, y0:y1] == 0) & (self.occupancy[x0:x1, y0:y1] == 0)
+        window = (x0, y0, width)
+        paths = ClusterPaths(cols, window, sources, None, None)
+        for source in sources:
+            free.flat[paths.local(source)] = True
+
+        index = np.arange(free.size).reshape(free.shape)
+        across = free[:, :-1] & free[:, 1:]
+        down = free[:-1] & free[1:]
+        src = np.concatenate((index[:, :-1][across], index[:-1][down]))
+        dst = np.concatenate((index[:, 1:][across], index[1:][down]))
+        graph = csr_matrix((np.ones(len(src)), (src, dst)), shape=(free.size, free.size))
+        paths.dist, paths.pred = shortest_path(
+            graph, directed=False, unweighted=True, return_predecessors=True,
+            indices=[paths.local(source) for source in sources])
+        return paths
+
+    def cluster_edges(self, cluster):
+        """Distances between the free entrances of a cluster (rebuilt when dirty)"""
+        edges = self.edges.get(cluster)
+        if edges is not None and cluster not in self.dirty:
+            return edges
+        occupancy = self.board.occupancy
+        nodes = [node for node in self.nodes[cluster] if not occupancy[node]]
+        edges = {}
+        if nodes:
+            paths = self.paths[cluster] = self.shortest_paths(cluster, nodes)
+            for node in nodes:
+                reachable = ((other, paths.distance(node, other)) for other in nodes if other != node)
+                edges[node] = [(other, d) for other, d in reachable if d is not None]
+        self.edges[cluster] = edges
+        self.dirty.discard(cluster)
+        self.rebuilds += 1
+        return edges
+
+    def detach(self):
+        if self in self.board.watchers:
+            self.board.watchers.remove(self)
+
+    def fork(self, board):
+        """Graph for a forked board: entrances shared, cluster caches copied"""
+        graph = copy.copy(self)
+        graph.board = board
+        graph.edges = dict(self.edges)
+        graph.paths = dict(self.paths)
+        graph.dirty = set(self.dirty)
+        board.watchers.append(graph)
+        return graph
+
+
+class HPAPlanner(Planner):
+    """
+    Hierarchical A* over cluster entrances, refined segment by segment
+
+    Paths are near-optimal rather than shortest. If the abstract search finds
+    nothing (e.g. the body blocks the only entrance cell of a border run) the
+    planner falls back to flat A*, so it never misses reachable food.
+    """
+
+    def __init__(self, board, cluster_size=CLUSTER_SIZE, fallback=True):
+        """
+        Args:
+            board (Board): Board to plan on
+            cluster_size (int): Cluster edge length in cells
+            fallback (bool): Run flat A* when the abstract search fails
+        """
+        super().__init__(board)
+        self.graph = AbstractGraph(board, cluster_size)
+        self.fallback = AStarPlanner(board) if fallback else None
+        self.fallbacks = 0
+
+    def plan(self, sim):
+        return self.search(sim.head, sim.food)
+
+    def search(self, start, goal):
+        """Path from start to goal in getpath order (next move last)"""
+        self.searches += 1
+        graph, board = self.graph, self.board
+        if not board.passable(goal):
+            return []
+        cols, occupancy, inter = board.cols, board.occupancy, graph.inter
+        start_cluster, goal_cluster = graph.cluster_of(start), graph.cluster_of(goal)
+        ends = graph.shortest_paths(start_cluster, [start, goal] if start_cluster == goal_cluster
+                                    else [start])
+        goal_ends = ends if start_cluster == goal_cluster else graph.shortest_paths(goal_cluster, [goal])
+        gx, gy = divmod(goal, cols)
+
+        # A* on the abstract graph; start and goal are temporary nodes
+        g_score = {start: 0}
+        came_from = {}
+        closed = set()
+        # Ties on f go to the deeper node, which keeps the search on one route
+        open_heap = [(0, 0, start)]
+        expanded = 0
+        found = False
+        while open_heap:
+            _, g, node = heapq.heappop(open_heap)
+            g = -g
+            if node in closed:
+                continue
+            closed.add(node)
+            expanded += 1
+            if node == goal:
+                found = True
+                break
+
+            if node == start:
+                edges = [(other, ends.distance(start, other))
+                         for other in graph.nodes[start_cluster] | {goal}
+                         if other != start and graph.cluster_of(other) == start_cluster]
+            else:
+                cluster = graph.cluster_of(node)
+                edges = list(graph.cluster_edges(cluster).get(node, ()))
+                if cluster == goal_cluster:
+                    edges.append((goal, goal_ends.distance(goal, node)))
+            edges.extend((other, 1) for other in inter.get(node, ()) if not occupancy[other])
+
+            for other, cost in edges:
+                if cost is None or other in closed:
+                    continue
+                ng = g + cost
+                if ng >= g_score.get(other, ng + 1):
+                    continue
+                g_score[other] = ng
+                came_from[other] = node
+                x, y = divmod(other, cols)
+                heapq.heappush(open_heap, (ng + abs(x - gx) + abs(y - gy), -ng, other))
+
+        self.nodes_expanded += expanded
+        if not found:
+            if self.fallback is None:
+                return []
+            self.fallbacks += 1
+            path = self.fallback.search(start, goal)
+            self.nodes_expanded += self.fallback.nodes_expanded
+            self.fallback.nodes_expanded = 0
+            return path
+
+        abstract = [goal]
+        while abstract[-1] != start:
+            abstract.append(came_from[abstract[-1]])
+        return self._refine(abstract, ends, goal_ends)
+
+    def _refine(self, abstract, ends, goal_ends):
+        """Cell-level directions for an abstract path given goal -> start"""
+        graph, cols = self.graph, self.board.cols
+        start, goal = abstract[-1], abstract[0]
+        cells = [goal]  # Built from the goal back to the start
+        for later, earlier in zip(abstract, abstract[1:]):
+            if later in graph.inter.get(earlier, ()):
+                segment = [later, earlier]  # Across a cluster border
+            elif earlier == start:
+                segment = ends.walk(start, later)
+            elif later == goal:
+                segment = goal_ends.walk(goal, earlier)[::-1]
+            else:
+                segment = graph.paths[graph.cluster_of(earlier)].walk(earlier, later)
+            cells.extend(segment[1:])
+
+        path = []
+        for cell, prev in zip(cells, cells[1:]):
+            delta = cell - prev
+            if delta == 1:
+                path.append(0)
+            elif delta == cols:
+                path.append(1)
+            elif delta == -1:
+                path.append(2)
+            else:
+                path.append(3)
+        return path
+
+    def stats(self):
+        return {'cluster_rebuilds': self.graph.rebuilds, 'hpa_fallbacks': self.fallbacks}
+
+    def fork(self, board):
+        planner = super().fork(board)
+        planner.graph = self.graph.fork(board)
+        if self.fallback is not None:
+            planner.fallback = self.fallback.fork(board)
+        return planner
+
+
+# Example usage
+if __name__ == "__main__":
+    import time
+
+    from snake_engine import make_board
+
+    board = make_board(1000, 1000, 20, seed=1, layout='blobs')
+    head, food = board.cell(500, 500), board.cell(5, 990)
+    board.occupy(head)
+
+    start = time.perf_counter()
+    planner = HPAPlanner(board)
+    print(f"🧩 Abstract graph: {len(planner.graph.inter)} entrances, "
+          f"built in {(time.perf_counter() - start) * 1000:.0f} ms")
+    for attempt in ('cold', 'warm'):
+        start = time.perf_counter()
+        path = planner.search(head, food)
+        print(f"🗺️  HPA* ({attempt}): {len(path)} steps in "
+              f"{(time.perf_counter() - start) * 1000:.0f} ms, "
+              f"{planner.graph.rebuilds} clusters built")
+    start = time.perf_counter()
+    optimal = AStarPlanner(board).search(head, food)
+    print(f"🎯 Flat A*: {len(optimal)} steps in {(time.perf_counter() - start) * 1000:.0f} ms")
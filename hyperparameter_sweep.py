@@ -0,0 +1,243 @@
+"""
+Hyperparameter Sweep with Successive Halving for Snake A* Experiments
+Explores game and planner settings (obstacle probability, board size, planner
+variant, heuristic weight, ...) instead of fixing them in GAME_CONFIG. A
+search space is expanded into a grid or sampled at random, and every
+configuration plays a few headless episodes. After each round only the best
+1/eta configurations go on, with eta times the episodes, so weak settings are
+dropped early and the compute goes to the strong ones. All configurations
+play the same seeds, so each comparison is paired rather than left to chance.
+
+Episodes of every round run on one process pool. The final rankings feed
+into PerformanceComparator (to_comparator) like any other set of datasets.
+
+Space keys are make_episode settings ('planner', 'rows', 'cols',
+'obstacle_probability', 'layout', ...), 'size' for (rows, cols) pairs, or
+planner options such as 'weight'; a planner option is passed only to planners
+that accept it.
+"""
+
+import inspect
+import itertools
+import math
+import random
+from concurrent.futures import ProcessPoolExecutor
+
+from snake_engine import get_planner, make_episode, run_episode
+
+MIN_EPISODES = 3  # Episodes per configuration in the first round
+ETA = 2           # Keep the best 1/ETA each round, with ETA times the episodes
+
+EPISODE_SETTINGS = set(inspect.signature(make_episode).parameters) - {'seed'}
+
+
+def grid_configs(space):
+    """
+    Every combination of a grid
+
+    Args:
+        space (dict): Setting -> list of values
+
+    Returns:
+        list: One dict per configuration
+    """
+    keys = list(space)
+    return [dict(zip(keys, values)) for values in itertools.product(*(space[key] for key in keys))]
+
+
+def random_configs(space, count, seed=0):
+    """
+    Configurations sampled from a random space
+
+    Args:
+        space (dict): Setting -> list of choices, or a (low, high) tuple drawn
+            uniformly (integers when both bounds are ints)
+        count (int): Number of configurations
+        seed (int): Sampling seed
+
+    Returns:
+        list: One dict per configuration (duplicates removed)
+    """
+    rng = random.Random(seed)
+    configs = []
+    for _ in range(count):
+        config = {}
+        for key, values in space.items():
+            if isinstance(values, tuple):
+                low, high = values
+                if isinstance(low, int) and isinstance(high, int):
+                    config[key] = rng.randint(low, high)
+                else:
+                    config[key] = round(rng.uniform(low, high), 3)
+            else:
+                config[key] = rng.choice(values)
+        if config not in configs:
+            configs.append(config)
+    return configs
+
+
+def _accepted_options(planner):
+    """Option names a planner takes, or None if it takes any (**options)"""
+    planner_class = get_planner(planner) if isinstance(planner, str) else planner
+    parameters = inspect.signature(planner_class.__init__).parameters
+    if any(p.kind == inspect.Parameter.VAR_KEYWORD for p in parameters.values()):
+        return None
+    return set(parameters) - {'self', 'board'}
+
+
+def config_settings(config, **settings):
+    """
+    make_episode settings for a configuration
+
+    Args:
+        config (dict): Sweep configuration
+        **settings: Base settings the configuration overrides
+
+    Returns:
+        dict: Settings, with planner options the planner ignores left out
+    """
+    settings = dict(settings)
+    options = dict(settings.get('planner_options') or {})
+    for key, value in config.items():
+        if key == 'size':
+            settings['rows'], settings['cols'] = value
+        elif key in EPISODE_SETTINGS:
+            settings[key] = value
+        else:
+            options[key] = value
+    accepted = _accepted_options(settings.get('planner', 'astar'))
+    if accepted is not None:
+        options = {key: value for key, value in options.items() if key in accepted}
+    settings['planner_options'] = options or None
+    return settings
+
+
+def config_name(config):
+    """'planner=astar, weight=1.5' style label"""
+    parts = []
+    for key, value in config.items():
+        if key == 'size':
+            value = f"{value[0]}x{value[1]}"
+        parts.append(f"{key}={value}")
+    return ', '.join(parts) or 'default'
+
+
+def _sweep_episode(job):
+    """Play one episode of one configuration (worker entry point)"""
+    index, seed, settings = job
+    return index, run_episode(seed, **settings)
+
+
+def successive_halving(configs, min_episodes=MIN_EPISODES, eta=ETA, max_episodes=None,
+                       metric='score', seed=0, workers=None, on_record=None, **settings):
+    """
+    Run configurations, keeping the best 1/eta after each round
+
+    Round k plays min_episodes * eta**k episodes per surviving configuration
+    (only the ones not played yet), until one configuration is left or the
+    next round would exceed max_episodes.
+
+    Args:
+        configs (list): Configurations (grid_configs or random_configs)
+        min_episodes (int): Episodes per configuration in the first round
+        eta (int): Survivor fraction 1/eta and episode growth per round
+        max_episodes (int, optional): Cap on episodes per configuration
+        metric (str): Record field to maximize (mean over episodes)
+        seed (int): First episode seed, shared by all configurations
+        workers (int, optional): Worker processes; 1 plays in-process
+        on_record (callable, optional): Called with each record, tagged with
+            its configuration name under 'config'
+        **settings: Base make_episode settings
+
+    Returns:
+        list: One result dict per distinct configuration, best first: name,
+            config, settings, values, mean, rounds (rounds played) and episodes
+    """
+    eta = max(2, int(eta))
+    results, seen = [], set()
+    for config in configs:
+        config_run = config_settings(config, **settings)
+        options = config_run['planner_options'] or {}
+        # Drop options the planner ignores: bfs with three weights is one configuration
+        config = {key: value for key, value in config.items()
+                  if key == 'size' or key in EPISODE_SETTINGS or key in options}
+        key = repr(sorted(config_run.items()))
+        if key not in seen:
+            seen.add(key)
+            results.append({'name': config_name(config), 'config': config,
+                            'settings': config_run, 'values': [], 'rounds': 0})
+    survivors = list(range(len(results)))
+    budget = max(1, int(min_episodes))
+
+    pool = ProcessPoolExecutor(max_workers=workers) if workers != 1 else None
+    try:
+        while survivors:
+            played = len(results[survivors[0]]['values'])
+            jobs = [(index, seed + episode, results[index]['settings'])
+                    for index in survivors for episode in range(played, budget)]
+            outcomes = (pool.map(_sweep_episode, jobs, chunksize=max(1, len(jobs) // 64))
+                        if pool else map(_sweep_episode, jobs))
+            for index, record in outcomes:
+                results[index]['values'].append(record[metric])
+                if on_record is not None:
+                    on_record(dict(record, config=results[index]['name']))
+            for index in survivors:
+                results[index]['rounds'] += 1
+                values = results[index]['values']
+                results[index]['mean'] = sum(values) / len(values)
+
+            keep = math.ceil(len(survivors) / eta) if len(survivors) > 1 else 0
+            next_budget = budget * eta
+            if not keep or (max_episodes is not None and next_budget > max_episodes):
+                break
+            # Stable sort: earlier configurations win ties
+            survivors = sorted(survivors, key=lambda index: -results[index]['mean'])[:keep]
+            budget = next_budget
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+    for result in results:
+        result['episodes'] = len(result['values'])
+    # Configurations that got further rank first, then by mean
+    return sorted(results, key=lambda result: (-result['rounds'], -result['mean']))
+
+
+def to_comparator(results, top=None, comparator=None):
+    """
+    PerformanceComparator with one dataset per configuration
+
+    Args:
+        results (list): Output of successive_halving
+        top (int, optional): Only the best few configurations
+
+    Returns:
+        PerformanceComparator: Ready for create_comparison_report
+    """
+    from performance_comparison import PerformanceComparator
+
+    comparator = comparator or PerformanceComparator()
+    for result in results[:top]:
+        comparator.add_dataset(result['name'], result['values'],
+                               f"{result['episodes']} episodes, {result['rounds']} rounds")
+    return comparator
+
+
+# Example usage
+if __name__ == "__main__":
+    import time
+
+    space = {'planner': ['astar', 'bfs'], 'weight': [1.0, 1.5, 3.0],
+             'obstacle_probability': [1, 3, 6], 'size': [(20, 20), (30, 30)]}
+    configs = grid_configs(space)
+    start = time.perf_counter()
+    results = successive_halving(configs, min_episodes=2, eta=3, max_episodes=20,
+                                 max_steps=2000)
+    elapsed = time.perf_counter() - start
+    total = sum(result['episodes'] for result in results)
+    print(f"🔍 {len(results)} distinct configurations, {total} episodes in {elapsed:.1f} s "
+          f"(a full grid at {results[0]['episodes']} episodes each would need "
+          f"{len(results) * results[0]['episodes']})")
+    for result in results[:5]:
+        print(f"  🏅 {result['name']}: mean {result['mean']:.1f} over {result['episodes']} episodes")
+    to_comparator(results, top=3).create_comparison_report()
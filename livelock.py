@@ -0,0 +1,114 @@
+"""
+Livelock Detection for Snake A* Experiments
+A snake that circles without ever reaching the food keeps an unattended batch
+worker busy forever. The detector hashes the full game state (head cell, body
+occupancy, food cell) with Zobrist keys, updated incrementally as the snake
+moves, and counts how often each state recurs between two meals. A state that
+comes back again and again means the planner is going round in a loop.
+
+Forks share the history: it is kept as read-only layers plus one small dict
+of counts changed since the last fork. Layers are merged like a binary
+counter (a layer absorbs the ones above it once they are as large), so a
+lookup checks O(log n) layers and forking costs O(1) instead of a copy of
+every state seen since the last meal.
+"""
+
+import copy
+
+from path_cache import ZobristHash, zobrist_keys
+
+DEFAULT_REPEATS = 3
+
+
+class LivelockDetector:
+    """Repeat counter for (head, body, food) states since the last food"""
+
+    def __init__(self, board, repeats=DEFAULT_REPEATS):
+        """
+        Args:
+            board (Board): Board to track (its occupancy is the body hash)
+            repeats (int): Occurrences of one state that count as a livelock
+        """
+        self.body = ZobristHash(board)
+        self.head_keys = zobrist_keys(board.size, salt=1)
+        self.food_keys = zobrist_keys(board.size, salt=2)
+        self.repeats = repeats
+        self.layers = []  # Read-only history shared with forks, oldest first
+        self.seen = {}    # Counts changed since the last fork
+
+    def state(self, head, food):
+        """Zobrist hash of the current game state"""
+        return self.body.value ^ self.head_keys[head] ^ self.food_keys[food]
+
+    def check(self, head, food):
+        """
+        Record the current state
+
+        Returns:
+            bool: True once this state has occurred `repeats` times
+        """
+        state = self.state(head, food)
+        count = self.seen.get(state)
+        if count is None:
+            count = 0
+            for layer in reversed(self.layers):
+                if state in layer:
+                    count = layer[state]
+                    break
+        count += 1
+        self.seen[state] = count
+        return count >= self.repeats
+
+    def states(self):
+        """Number of distinct states since the last meal"""
+        if not self.layers:
+            return len(self.seen)
+        return len(set(self.seen).union(*self.layers))
+
+    def reset(self):
+        """Forget the history (call when the food is eaten: progress was made)"""
+        self.layers = []
+        self.seen = {}
+
+    def _freeze(self):
+        """Move the recent counts into the shared layers"""
+        if not self.seen:
+            return
+        layers = self.layers + [self.seen]
+        while len(layers) > 1 and len(layers[-1]) >= len(layers[-2]):
+            newer = layers.pop()
+            merged = dict(layers.pop())
+            merged.update(newer)
+            layers.append(merged)
+        self.layers = layers
+        self.seen = {}
+
+    def detach(self):
+        self.body.detach()
+
+    def fork(self, board):
+        """Detector for a forked board, sharing the history so far"""
+        self._freeze()
+        detector = copy.copy(self)
+        detector.body = self.body.fork(board)
+        detector.seen = {}
+        return detector
+
+
+# Example usage
+if __name__ == "__main__":
+    from snake_engine import make_board
+
+    board = make_board(10, 10, 0, seed=1)
+    detector = LivelockDetector(board)
+    food = board.cell(9, 9)
+    # A length-4 snake chasing its tail round a 2x2 square never reaches the food
+    ring = [board.cell(0, 0), board.cell(0, 1), board.cell(1, 1), board.cell(1, 0)]
+    for cell in ring:
+        board.occupy(cell)
+    for step in range(20):
+        head = ring[step % 4]
+        if detector.check(head, food):
+            print(f"🔁 Livelock detected after {step + 1} ticks "
+                  f"({detector.states()} distinct states)")
+            break
@@ -1,4 +1,11 @@
+import sys
+import matplotlib
 import statistics
+
+# Render straight to a file (no window) when an output path is given
+OUTPUT_PATH = sys.argv[1] if len(sys.argv) > 1 else None
+if OUTPUT_PATH:
+    matplotlib.use('Agg')
 import matplotlib.pyplot as plt
 
 # Given data
@@ -18,4 +25,7 @@ plt.xlabel('Score')
 plt.ylabel('Frequency')
 plt.title('Histogram of Score Tries with Mean, Median, and Mode')
 plt.legend()
-plt.show()
+if OUTPUT_PATH:
+    plt.savefig(OUTPUT_PATH)
+else:
+    plt.show()
@@ -1,7 +1,14 @@
 #mean median and mode with time taken for each trial
-import matplotlib.pyplot as plt
+import sys
+import matplotlib
 import statistics
 
+# Render straight to a file (no window) when an output path is given
+OUTPUT_PATH = sys.argv[1] if len(sys.argv) > 1 else None
+if OUTPUT_PATH:
+    matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+
 # Trial numbers
 trials = list(range(1, 21))
 
@@ -27,4 +34,7 @@ plt.xlabel('Trial Number')
 plt.ylabel('Time Taken (seconds)')
 plt.legend()
 plt.grid(True)
-plt.show()
+if OUTPUT_PATH:
+    plt.savefig(OUTPUT_PATH)
+else:
+    plt.show()
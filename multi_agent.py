@@ -0,0 +1,311 @@
+"""
+Multi-Snake, Multi-Food Simulation for Snake A* Experiments
+K snakes and M food items share one board (one obstacle map and one
+occupancy array). Planning is batched: every snake that needs a new path runs
+a single BFS wave from its head that stops once all food items are found,
+then food is handed out greedily by distance so snakes do not all chase the
+same item. That is K searches per planning round instead of K * M.
+
+Records carry the board-level throughput (snake moves per second), so planner
+scaling can be measured under contention.
+"""
+
+import random
+import time
+from array import array
+from collections import deque
+
+from snake_engine import GAME_CONFIG, make_board
+
+
+class SnakeAgent:
+    """Body, path and score of one snake on a shared board"""
+
+    def __init__(self, index, head, size):
+        self.index = index
+        self.head = head
+        self.body = deque([head])
+        self.path = []
+        self.target = -1
+        self.score = 0
+        self.alive = True
+        self.death_cause = None
+        # Per-snake BFS scratch arrays, reused by every wave
+        self.stamp = 0
+        self.seen = array('i', [0]) * size
+        self.parent = array('i', [-1]) * size
+
+
+class MultiSnakeSimulation:
+    """Game state and rules for K snakes and M food items on one board"""
+
+    def __init__(self, board, snakes=4, foods=4, seed=None, max_steps=None, max_seconds=None):
+        """
+        Args:
+            board (Board): Shared board; its occupancy must be empty
+            snakes (int): Number of snakes
+            foods (int): Food items kept on the board
+            seed (int, optional): Seed for start cells and food placement
+            max_steps (int, optional): Tick limit (default: 50 ticks per cell)
+            max_seconds (float, optional): Wall-clock limit ('timeout')
+        """
+        if snakes < 1 or foods < 1:
+            raise ValueError(f"Need at least one snake and one food (got {snakes} and {foods})")
+        self.board = board
+        self.rng = random.Random(seed)
+        self.steps = 0
+        self.moves = 0
+        self.nodes_expanded = 0
+        self.searches = 0
+        self.max_steps = max_steps or 50 * board.size
+        self.deadline = time.perf_counter() + max_seconds if max_seconds else None
+
+        self.foods = set()
+        # First snake at the centre (as in the single-snake game), others random
+        self.agents = []
+        for index in range(snakes):
+            if index == 0:
+                head = board.cell(board.rows // 2, board.cols // 2)
+            else:
+                head = self._free_cell()
+            if head < 0:
+                break
+            board.occupy(head)
+            self.agents.append(SnakeAgent(index, head, board.size))
+
+        for _ in range(foods):
+            self._spawn_food()
+
+    @property
+    def alive(self):
+        return any(agent.alive for agent in self.agents)
+
+    @property
+    def score(self):
+        return sum(agent.score for agent in self.agents)
+
+    def _free_cell(self):
+        """Random cell free of obstacles, snakes and food, or -1"""
+        board = self.board
+        for _ in range(100):
+            cell = self.rng.randrange(board.size)
+            if board.passable(cell) and cell not in self.foods:
+                return cell
+
+        # Fallback: find any empty spot
+        for cell in range(board.size):
+            if board.passable(cell) and cell not in self.foods:
+                return cell
+        return -1
+
+    def _spawn_food(self):
+        cell = self._free_cell()
+        if cell >= 0:
+            self.foods.add(cell)
+
+    def _wave(self, agent):
+        """
+        BFS from the agent's head until every food item is found
+
+        Returns:
+            dict: Distance to each reachable food cell
+        """
+        board = self.board
+        neighbors, occupancy = board.neighbors, board.occupancy
+        agent.stamp += 1
+        stamp, seen, parent = agent.stamp, agent.seen, agent.parent
+        foods = self.foods
+        found = {}
+        seen[agent.head] = stamp
+        frontier = [agent.head]
+        depth = 0
+        expanded = 0
+        while frontier and len(found) < len(foods):
+            depth += 1
+            next_frontier = []
+            for cell in frontier:
+                expanded += 1
+                for _, nb in neighbors[cell]:
+                    if seen[nb] == stamp or occupancy[nb]:
+                        continue
+                    seen[nb] = stamp
+                    parent[nb] = cell
+                    if nb in foods:
+                        found[nb] = depth
+                    next_frontier.append(nb)
+            frontier = next_frontier
+
+        self.nodes_expanded += expanded
+        self.searches += 1
+        return found
+
+    def _path(self, agent, goal):
+        """Direction codes from the agent's head to goal (next move last)"""
+        cols, parent = self.board.cols, agent.parent
+        path = []
+        cell = goal
+        while cell != agent.head:
+            prev = parent[cell]
+            delta = cell - prev
+            if delta == 1:
+                path.append(0)
+            elif delta == cols:
+                path.append(1)
+            elif delta == -1:
+                path.append(2)
+            else:
+                path.append(3)
+            cell = prev
+        return path
+
+    def plan(self, agents):
+        """One wave per agent, then greedy food assignment by distance"""
+        claimed = {agent.target for agent in self.agents
+                   if agent.alive and agent.path and agent not in agents}
+        waves = {agent.index: self._wave(agent) for agent in agents}
+        pairs = sorted((distance, agent.index, food)
+                       for agent in agents for food, distance in waves[agent.index].items())
+        assigned = {}
+        for _, index, food in pairs:
+            if index not in assigned and food not in claimed:
+                assigned[index] = food
+                claimed.add(food)
+
+        for agent in agents:
+            found = waves[agent.index]
+            target = assigned.get(agent.index)
+            if target is None and found:
+                # Every reachable item is taken: contest the nearest one
+                target = min(found, key=found.get)
+            if target is None:
+                agent.path, agent.target = [], -1
+            else:
+                agent.path, agent.target = self._path(agent, target), target
+
+    def _kill(self, agent, cause):
+        agent.alive = False
+        agent.death_cause = cause
+        for cell in agent.body:
+            self.board.release(cell)
+        agent.body.clear()
+
+    def step(self):
+        """
+        Advance every snake one tick, in index order
+
+        Returns:
+            bool: False once no snake is alive
+        """
+        board = self.board
+        needs_plan = [agent for agent in self.agents if agent.alive and
+                      (not agent.path or agent.target not in self.foods)]
+        if needs_plan:
+            self.plan(needs_plan)
+
+        for agent in self.agents:
+            if not agent.alive:
+                continue
+            if not agent.path:
+                self._kill(agent, 'no_path')
+                continue
+            next_cell = board.move(agent.head, agent.path.pop())
+            if next_cell >= 0 and not board.passable(next_cell):
+                # Another snake cut across the path since it was planned
+                self.plan([agent])
+                if not agent.path:
+                    self._kill(agent, 'collision')
+                    continue
+                next_cell = board.move(agent.head, agent.path.pop())
+            if next_cell < 0:
+                self._kill(agent, 'boundary')
+                continue
+
+            agent.body.append(next_cell)
+            board.occupy(next_cell)
+            agent.head = next_cell
+            self.moves += 1
+            if next_cell in self.foods:
+                agent.score += 1
+                self.foods.discard(next_cell)
+                self._spawn_food()
+                agent.path = []
+            else:
+                board.release(agent.body.popleft())
+
+        self.steps += 1
+        cause = None
+        if self.steps >= self.max_steps:
+            cause = 'max_steps'
+        elif self.deadline is not None and time.perf_counter() > self.deadline:
+            cause = 'timeout'
+        if cause:
+            for agent in self.agents:
+                if agent.alive:
+                    agent.alive = False
+                    agent.death_cause = cause
+        return self.alive
+
+
+def run_multi_episode(seed=0, snakes=4, foods=4, rows=None, cols=None,
+                      obstacle_probability=None, board_seed=None, max_steps=None,
+                      layout=None, layout_options=None, max_seconds=None):
+    """
+    Play one multi-snake episode to completion
+
+    Args:
+        seed (int): Seed for start cells and food (and obstacles unless board_seed is set)
+        snakes (int): Number of snakes sharing the board
+        foods (int): Food items on the board at any time
+        rows, cols, obstacle_probability: Board settings (GAME_CONFIG defaults)
+        board_seed (int, optional): Separate seed for the obstacle layout
+        max_steps (int, optional): Tick limit
+        max_seconds (float, optional): Wall-clock limit
+        layout, layout_options: Obstacle layout (see snake_engine.make_board)
+
+    Returns:
+        dict: Episode record, with per-snake scores and board throughput
+    """
+    rows = GAME_CONFIG['rows'] if rows is None else rows
+    cols = GAME_CONFIG['cols'] if cols is None else cols
+    if obstacle_probability is None:
+        obstacle_probability = GAME_CONFIG['obstacle_probability']
+    board_seed = seed if board_seed is None else board_seed
+
+    start_time = time.perf_counter()
+    board = make_board(rows, cols, obstacle_probability, board_seed,
+                       layout=layout, layout_options=layout_options)
+    sim = MultiSnakeSimulation(board, snakes, foods, seed, max_steps, max_seconds)
+    while sim.step():
+        pass
+    duration = time.perf_counter() - start_time
+
+    causes = [agent.death_cause for agent in sim.agents]
+    return {
+        'planner': 'multi-bfs',
+        'layout': layout or 'legacy',
+        'rows': board.rows,
+        'cols': board.cols,
+        'obstacle_probability': obstacle_probability,
+        'seed': seed,
+        'board_seed': board_seed,
+        'score': sim.score,
+        'steps': sim.steps,
+        'duration': duration,
+        'nodes_expanded': sim.nodes_expanded,
+        'searches': sim.searches,
+        'death_cause': max(set(causes), key=causes.count),
+        'snakes': len(sim.agents),
+        'foods': foods,
+        'scores': [agent.score for agent in sim.agents],
+        'moves': sim.moves,
+        'moves_per_second': sim.moves / duration if duration > 0 else 0.0,
+    }
+
+
+# Example usage
+if __name__ == "__main__":
+    for snakes, foods in ((1, 1), (4, 4), (8, 8), (16, 16)):
+        record = run_multi_episode(seed=1, snakes=snakes, foods=foods, rows=50, cols=50)
+        print(f"🐍 {snakes:2d} snakes / {foods:2d} foods: score {record['score']:4d}, "
+              f"{record['moves']:6d} moves, {record['moves_per_second']:9.0f} moves/s, "
+              f"{record['searches']:5d} waves")
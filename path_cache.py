@@ -0,0 +1,214 @@
+"""
+Memoized Path Cache for Snake A* Experiments
+Batch replays and fixed maps ask the planner the same question over and over:
+the same head and food cells with the same short snake on the board. The
+cached planner answers repeats from an LRU cache instead of searching again.
+
+Entries are keyed by (board shape and obstacle layout, head cell, food cell, Zobrist hash of
+the occupancy bitmap). The Zobrist hash XORs a random 64-bit key per occupied
+cell and is kept up to date incrementally as a Board watcher, so building the
+key costs O(1) per plan. A cached path is only returned when the whole key
+matches, i.e. for exactly the board state it was computed on.
+"""
+
+import copy
+from collections import OrderedDict
+
+import numpy as np
+
+from snake_engine import Planner, get_planner
+
+ZOBRIST_SEED = 0x5EED
+DEFAULT_CACHE_SIZE = 4096
+MAX_KEY_TABLE = 1 << 22  # Larger boards compute their keys on demand
+MASK64 = (1 << 64) - 1
+
+# Zobrist keys per board size, and caches shared by every planner in this process
+_zobrist_keys = {}
+_shared_caches = {}
+
+
+class HashedKeys:
+    """Zobrist keys from a SplitMix64 hash of the cell, for boards too big for a table"""
+
+    def __init__(self, size, salt=0):
+        self.offset = (ZOBRIST_SEED * 0x9E3779B97F4A7C15 + size * 0xBF58476D1CE4E5B9 + salt) & MASK64
+
+    def __getitem__(self, cell):
+        z = (cell * 0x9E3779B97F4A7C15 + self.offset) & MASK64
+        z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & MASK64
+        z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & MASK64
+        return z ^ (z >> 31)
+
+
+def zobrist_keys(size, salt=0):
+    """
+    Random 64-bit key per cell (the same for every board of this size)
+
+    Args:
+        size (int): Number of cells
+        salt (int): Selects an independent key table (e.g. one for the head cell)
+    """
+    if size > MAX_KEY_TABLE:
+        return HashedKeys(size, salt)
+    keys = _zobrist_keys.get((size, salt))
+    if keys is None:
+        rng = np.random.default_rng([ZOBRIST_SEED, size, salt])
+        keys = rng.integers(0, 2 ** 64, size, dtype=np.uint64).tolist()
+        _zobrist_keys[size, salt] = keys
+    return keys
+
+
+class ZobristHash:
+    """Occupancy hash of a board, updated on every occupy/release"""
+
+    def __init__(self, board):
+        self.board = board
+        self.keys = zobrist_keys(board.size)
+        self.value = 0
+        for cell in board.occupied_cells():
+            self.value ^= self.keys[cell]
+        board.watchers.append(self)
+
+    def occupy(self, cell):
+        self.value ^= self.keys[cell]
+
+    def release(self, cell):
+        self.value ^= self.keys[cell]
+
+    def detach(self):
+        """Stop tracking the board"""
+        if self in self.board.watchers:
+            self.board.watchers.remove(self)
+
+    def fork(self, board):
+        """Hash of a forked board, starting from this value (no rescan)"""
+        zobrist = copy.copy(self)
+        zobrist.board = board
+        board.watchers.append(zobrist)
+        return zobrist
+
+
+class PathCache:
+    """Bounded LRU mapping of board-state keys to planned paths"""
+
+    def __init__(self, maxsize=DEFAULT_CACHE_SIZE):
+        self.maxsize = maxsize
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    @property
+    def hit_rate(self):
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def get(self, key):
+        """Copy of the cached path for key, or None"""
+        path = self.entries.get(key)
+        if path is None:
+            self.misses += 1
+            return None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return list(path)  # Callers pop moves off their copy
+
+    def put(self, key, path):
+        self.entries[key] = tuple(path)
+        self.entries.move_to_end(key)
+        if len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self):
+        self.entries.clear()
+
+
+def shared_cache(planner, options=None, maxsize=DEFAULT_CACHE_SIZE):
+    """Process-wide cache for a planner configuration, kept across episodes"""
+    key = (planner, tuple(sorted((options or {}).items())))
+    cache = _shared_caches.get(key)
+    if cache is None:
+        cache = _shared_caches[key] = PathCache(maxsize)
+    return cache
+
+
+class CachedPlanner(Planner):
+    """
+    Wrap a registered planner with a path cache
+
+    Only planners whose answer depends on nothing but the board, head and food
+    can be wrapped (Planner.cacheable); the hamiltonian planner, which follows
+    the body order, cannot.
+    """
+
+    def __init__(self, board, planner='astar', cache_size=DEFAULT_CACHE_SIZE, shared=True,
+                 **options):
+        """
+        Args:
+            board (Board): Board to plan on
+            planner (str): Registered planner name to wrap
+            cache_size (int): Maximum cached paths
+            shared (bool): Use the process-wide cache for this planner
+                configuration, so later episodes (and fixed maps) reuse paths
+            **options: Keyword arguments for the wrapped planner
+        """
+        # No Planner.__init__: the search counters belong to the wrapped planner
+        self.board = board
+        self.inner = get_planner(planner)(board, **options)
+        if not self.inner.cacheable:
+            raise ValueError(f"Planner '{planner}' keeps state between plans and cannot be cached")
+        self.cache = shared_cache(planner, options, cache_size) if shared else PathCache(cache_size)
+        self.zobrist = ZobristHash(board)
+        self.layout = board.layout_id()
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    @property
+    def nodes_expanded(self):
+        return self.inner.nodes_expanded
+
+    @property
+    def searches(self):
+        return self.inner.searches
+
+    def plan(self, sim):
+        key = (self.layout, sim.head, sim.food, self.zobrist.value)
+        path = self.cache.get(key)
+        if path is not None:
+            self.cache_hits += 1
+            return path
+        self.cache_misses += 1
+        path = self.inner.plan(sim)
+        self.cache.put(key, path)
+        return path
+
+    def stats(self):
+        return {'cache_hits': self.cache_hits, 'cache_misses': self.cache_misses}
+
+    def fork(self, board):
+        # The cache itself is keyed on the board state, so forks share it
+        planner = super().fork(board)
+        planner.inner = self.inner.fork(board)
+        planner.zobrist = self.zobrist.fork(board)
+        return planner
+
+
+# Example usage
+if __name__ == "__main__":
+    import time
+
+    from snake_engine import run_episode
+
+    for planner in ('astar', 'cached'):
+        start = time.perf_counter()
+        records = [run_episode(seed % 10, planner=planner, rows=50, cols=50, board_seed=7)
+                   for seed in range(40)]
+        elapsed = time.perf_counter() - start
+        hits = sum(record.get('cache_hits', 0) for record in records)
+        print(f"🗂️  {planner:6s}: {sum(r['searches'] for r in records):5d} searches, "
+              f"{hits:5d} cache hits, {elapsed:.2f} s for 40 episodes (10 seeds replayed)")
@@ -1,13 +1,16 @@
 """
 Performance Comparison Tool for Snake A* Algorithm
-This script allows comparison of different algorithm configurations or datasets
+This script allows comparison of different algorithm configurations or datasets.
+Only NumPy is imported up front; pandas, scipy and matplotlib are loaded through
+analysis_backend when a report, significance test or plot needs them.
 """
 
-import matplotlib.pyplot as plt
+import csv
+import sys
 import numpy as np
-import statistics
-from scipy import stats
-import pandas as pd
+
+from analysis_backend import figure_class, pandas, pyplot, scipy_stats
+from plot_decimation import box_stats, decimate_line, line_style, prebinned_hist
 
 class PerformanceComparator:
     def __init__(self):
@@ -68,7 +71,7 @@ class PerformanceComparator:
                 f"{stats['improvement_rate']:.1f}%"
             ])
         
-        df = pd.DataFrame(df_data, columns=[
+        df = pandas().DataFrame(df_data, columns=[
             'Dataset', 'Mean', 'Median', 'Std Dev', 'CV', 'Range', 'Improvement Rate'
         ])
         
@@ -99,88 +102,88 @@ class PerformanceComparator:
                 scores2 = self.datasets[name2]['scores']
                 
                 # T-test
-                t_stat, p_value = stats.ttest_ind(scores1, scores2)
+                t_stat, p_value = scipy_stats().ttest_ind(scores1, scores2)
                 significance = "Significant" if p_value < 0.05 else "Not significant"
                 
                 print(f"  • {name1} vs {name2}: {significance} (p={p_value:.4f})")
         
         print("=" * 100)
     
-    def create_comparison_visualizations(self):
-        """Create comprehensive comparison visualizations"""
-        if len(self.datasets) < 2:
-            print("Need at least 2 datasets for comparison")
-            return
-        
-        n_datasets = len(self.datasets)
-        fig, axes = plt.subplots(2, 3, figsize=(18, 12))
-        fig.suptitle('Performance Comparison Analysis', fontsize=16, fontweight='bold')
-        
-        # 1. Line plots comparison
-        ax1 = axes[0, 0]
-        colors = plt.cm.tab10(np.linspace(0, 1, n_datasets))
+    # Individual comparison panels, in display order. Each name maps to a
+    # plot_<name>(ax) method; the radar panel needs a polar axes.
+    PANELS = ('progression', 'boxplot', 'means', 'distribution', 'radar', 'improvement')
+    PANEL_PROJECTIONS = {'radar': 'polar'}
+
+    def _colors(self):
+        """One colour per dataset, shared by every panel"""
+        return pyplot().cm.tab10(np.linspace(0, 1, len(self.datasets)))
+
+    def plot_progression(self, ax):
+        """Line plots comparison"""
+        colors = self._colors()
         for i, (name, data) in enumerate(self.datasets.items()):
-            scores = data['scores']
-            ax1.plot(range(len(scores)), scores, 'o-', color=colors[i], 
+            x_plot, y_plot, decimated = decimate_line(np.arange(len(data['scores'])), data['scores'])
+            ax.plot(x_plot, y_plot, line_style(decimated), color=colors[i], 
                     label=name, linewidth=2, markersize=4, alpha=0.8)
-        ax1.set_xlabel('Trial Number')
-        ax1.set_ylabel('Score')
-        ax1.set_title('Score Progression Comparison')
-        ax1.legend()
-        ax1.grid(True, alpha=0.3)
-        
-        # 2. Box plots comparison
-        ax2 = axes[0, 1]
-        scores_list = [data['scores'] for data in self.datasets.values()]
-        labels = list(self.datasets.keys())
-        bp = ax2.boxplot(scores_list, labels=labels, patch_artist=True)
+        ax.set_xlabel('Trial Number')
+        ax.set_ylabel('Score')
+        ax.set_title('Score Progression Comparison')
+        ax.legend()
+        ax.grid(True, alpha=0.3)
+    
+    def plot_boxplot(self, ax):
+        """Box plots comparison"""
+        colors = self._colors()
+        box_data = [box_stats(data['scores'], name) for name, data in self.datasets.items()]
+        bp = ax.bxp(box_data, patch_artist=True)
         
         # Color the boxes
         for patch, color in zip(bp['boxes'], colors):
             patch.set_facecolor(color)
             patch.set_alpha(0.7)
         
-        ax2.set_ylabel('Score')
-        ax2.set_title('Score Distribution Comparison')
-        ax2.grid(True, alpha=0.3)
-        plt.setp(ax2.get_xticklabels(), rotation=45, ha='right')
-        
-        # 3. Mean comparison with error bars
-        ax3 = axes[0, 2]
+        ax.set_ylabel('Score')
+        ax.set_title('Score Distribution Comparison')
+        ax.grid(True, alpha=0.3)
+        pyplot().setp(ax.get_xticklabels(), rotation=45, ha='right')
+    
+    def plot_means(self, ax):
+        """Mean comparison with error bars"""
+        colors = self._colors()
+        labels = list(self.datasets.keys())
         means = [data['stats']['mean'] for data in self.datasets.values()]
         stds = [data['stats']['std'] for data in self.datasets.values()]
         x_pos = np.arange(len(labels))
         
-        bars = ax3.bar(x_pos, means, yerr=stds, capsize=5, alpha=0.7, 
+        bars = ax.bar(x_pos, means, yerr=stds, capsize=5, alpha=0.7, 
                       color=colors, edgecolor='black')
-        ax3.set_ylabel('Mean Score')
-        ax3.set_title('Mean Score Comparison (±1 SD)')
-        ax3.set_xticks(x_pos)
-        ax3.set_xticklabels(labels, rotation=45, ha='right')
-        ax3.grid(True, alpha=0.3)
+        ax.set_ylabel('Mean Score')
+        ax.set_title('Mean Score Comparison (±1 SD)')
+        ax.set_xticks(x_pos)
+        ax.set_xticklabels(labels, rotation=45, ha='right')
+        ax.grid(True, alpha=0.3)
         
         # Add value labels on bars
         for bar, mean, std in zip(bars, means, stds):
             height = bar.get_height()
-            ax3.text(bar.get_x() + bar.get_width()/2., height + std + 1,
+            ax.text(bar.get_x() + bar.get_width()/2., height + std + 1,
                     f'{mean:.1f}', ha='center', va='bottom', fontweight='bold')
-        
-        # 4. Histogram overlay
-        ax4 = axes[1, 0]
+    
+    def plot_distribution(self, ax):
+        """Histogram overlay"""
+        colors = self._colors()
         for i, (name, data) in enumerate(self.datasets.items()):
-            scores = data['scores']
-            ax4.hist(scores, bins=8, alpha=0.6, label=name, color=colors[i], 
-                    density=True, edgecolor='black')
-        ax4.set_xlabel('Score')
-        ax4.set_ylabel('Density')
-        ax4.set_title('Score Distribution Overlay')
-        ax4.legend()
-        ax4.grid(True, alpha=0.3)
-        
-        # 5. Performance metrics radar chart
-        ax5 = axes[1, 1]
-        ax5.remove()
-        ax5 = fig.add_subplot(2, 3, 5, projection='polar')
+            prebinned_hist(ax, data['scores'], bins=8, alpha=0.6, label=name, color=colors[i], 
+                           density=True, edgecolor='black')
+        ax.set_xlabel('Score')
+        ax.set_ylabel('Density')
+        ax.set_title('Score Distribution Overlay')
+        ax.legend()
+        ax.grid(True, alpha=0.3)
+    
+    def plot_radar(self, ax):
+        """Performance metrics radar chart (expects a polar axes)"""
+        colors = self._colors()
         
         # Normalize metrics for radar chart
         metrics = ['Mean', 'Consistency', 'Max Score', 'Improvement']
@@ -205,33 +208,58 @@ class PerformanceComparator:
             ]
             values += values[:1]  # Complete the circle
             
-            ax5.plot(angles, values, 'o-', linewidth=2, label=name, color=colors[i])
-            ax5.fill(angles, values, alpha=0.25, color=colors[i])
+            ax.plot(angles, values, 'o-', linewidth=2, label=name, color=colors[i])
+            ax.fill(angles, values, alpha=0.25, color=colors[i])
         
-        ax5.set_xticks(angles[:-1])
-        ax5.set_xticklabels(metrics)
-        ax5.set_ylim(0, 1)
-        ax5.set_title('Performance Metrics Comparison')
-        ax5.legend(loc='upper right', bbox_to_anchor=(1.3, 1.0))
-        
-        # 6. Improvement rate comparison
-        ax6 = axes[1, 2]
+        ax.set_xticks(angles[:-1])
+        ax.set_xticklabels(metrics)
+        ax.set_ylim(0, 1)
+        ax.set_title('Performance Metrics Comparison')
+        ax.legend(loc='upper right', bbox_to_anchor=(1.3, 1.0))
+    
+    def plot_improvement(self, ax):
+        """Improvement rate comparison"""
+        colors = self._colors()
+        labels = list(self.datasets.keys())
         improvement_rates = [data['stats']['improvement_rate'] for data in self.datasets.values()]
-        bars = ax6.bar(labels, improvement_rates, color=colors, alpha=0.7, edgecolor='black')
-        ax6.set_ylabel('Improvement Rate (%)')
-        ax6.set_title('Learning/Improvement Rate')
-        ax6.set_ylim(0, 100)
-        plt.setp(ax6.get_xticklabels(), rotation=45, ha='right')
-        ax6.grid(True, alpha=0.3)
+        bars = ax.bar(labels, improvement_rates, color=colors, alpha=0.7, edgecolor='black')
+        ax.set_ylabel('Improvement Rate (%)')
+        ax.set_title('Learning/Improvement Rate')
+        ax.set_ylim(0, 100)
+        pyplot().setp(ax.get_xticklabels(), rotation=45, ha='right')
+        ax.grid(True, alpha=0.3)
         
         # Add value labels on bars
         for bar, rate in zip(bars, improvement_rates):
             height = bar.get_height()
-            ax6.text(bar.get_x() + bar.get_width()/2., height + 1,
+            ax.text(bar.get_x() + bar.get_width()/2., height + 1,
                     f'{rate:.1f}%', ha='center', va='bottom', fontweight='bold')
+    
+    def create_comparison_visualizations(self, save_path=None):
+        """
+        Create comprehensive comparison visualizations
+        
+        Args:
+            save_path (str, optional): Write the figure to this file instead of
+                opening a blocking window
+        """
+        if len(self.datasets) < 2:
+            print("Need at least 2 datasets for comparison")
+            return
+        
+        # A bare Figure renders through Agg without touching the GUI backend
+        fig = figure_class()(figsize=(18, 12)) if save_path else pyplot().figure(figsize=(18, 12))
+        fig.suptitle('Performance Comparison Analysis', fontsize=16, fontweight='bold')
+        
+        for i, panel in enumerate(self.PANELS, 1):
+            ax = fig.add_subplot(2, 3, i, projection=self.PANEL_PROJECTIONS.get(panel))
+            getattr(self, f'plot_{panel}')(ax)
         
-        plt.tight_layout()
-        plt.show()
+        fig.tight_layout()
+        if save_path:
+            fig.savefig(save_path, dpi=100)
+        else:
+            pyplot().show()
     
     def export_comparison_data(self, filename="performance_comparison.csv"):
         """Export comparison data to CSV"""
@@ -253,8 +281,10 @@ class PerformanceComparator:
             }
             data_rows.append(row)
         
-        df = pd.DataFrame(data_rows)
-        df.to_csv(filename, index=False)
+        with open(filename, 'w', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=list(data_rows[0]) if data_rows else ['Dataset'])
+            writer.writeheader()
+            writer.writerows(data_rows)
         print(f"Comparison data exported to {filename}")
 
 
@@ -278,7 +308,7 @@ if __name__ == "__main__":
     
     # Generate comparison report and visualizations
     comparator.create_comparison_report()
-    comparator.create_comparison_visualizations()
+    comparator.create_comparison_visualizations(sys.argv[1] if len(sys.argv) > 1 else None)
     
     # Export data
     comparator.export_comparison_data()
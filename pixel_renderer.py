@@ -0,0 +1,142 @@
+"""
+Pixel-Array Renderer for Large Snake Boards
+Drawing one rect per cell costs a draw call per obstacle and per body cell,
+so a 500x500 board needs hundreds of thousands of calls per frame. This
+renderer builds the whole board as one small image instead: a NumPy code per
+cell (obstacle layer cached, occupancy overlaid with two array operations),
+one palette lookup to RGB, pygame.surfarray into a surface with a pixel per
+cell, then a single scale and blit. Frame cost depends only on the board
+size, not on snake length or obstacle count.
+
+Boards with more cells than the target has pixels are first reduced by block
+maximum over the codes, so a one-cell snake or food item stays visible
+instead of being dropped by nearest-neighbour scaling.
+"""
+
+import math
+
+import numpy as np
+import pygame
+
+# Cell codes, in drawing priority: a reduced block shows its highest code
+EMPTY, OBSTACLE, BODY, FOOD, HEAD = range(5)
+
+# Code -> RGB (same palette as the games)
+PALETTE = np.array([
+    (0, 0, 0),        # empty: black
+    (255, 0, 0),      # obstacle: red
+    (255, 255, 255),  # body: white
+    (0, 255, 0),      # food: green
+    (0, 0, 255),      # head: blue
+], dtype=np.uint8)
+
+# 'auto' switches from rects to pixels once cells are smaller than this
+PIXEL_CELL_SIZE = 4
+
+
+def use_pixels(mode, rows, cols, size):
+    """
+    Resolve a render mode ('rects', 'pixels' or 'auto') for a board and target
+
+    Args:
+        size (tuple): (width, height) of the drawn board in pixels
+    """
+    if mode == 'auto':
+        return min(size[0] / rows, size[1] / cols) < PIXEL_CELL_SIZE
+    return mode == 'pixels'
+
+
+class PixelRenderer:
+    """Board image built through surfarray and scaled to a fixed size"""
+
+    def __init__(self, rows, cols, obstacles, size):
+        """
+        Args:
+            rows (int): Cells along x (drawn horizontally, as in the games)
+            cols (int): Cells along y
+            obstacles (bytes-like): One byte per cell, non-zero for an
+                obstacle, indexed as x * cols + y; drawn into a cached layer
+            size (tuple): (width, height) of the drawn board in pixels
+        """
+        self.rows = rows
+        self.cols = cols
+        self.size = (int(size[0]), int(size[1]))
+        # Cells per output pixel along each axis (1 unless the board is larger)
+        self.block = max(1, math.ceil(rows / self.size[0]), math.ceil(cols / self.size[1]))
+        block = self.block
+        width, height = -(-rows // block), -(-cols // block)
+        self.codes = np.zeros((width * block, height * block), dtype=np.uint8)
+        self.view = self.codes[:rows, :cols]
+        self.static = (np.frombuffer(bytes(obstacles), dtype=np.uint8).reshape(rows, cols) != 0
+                       ).astype(np.uint8) * OBSTACLE
+        self.pixels = pygame.Surface((width, height))
+        self.frame = pygame.Surface(self.size)
+
+    def render(self, occupancy, food=-1, head=-1):
+        """
+        Draw the board state
+
+        Args:
+            occupancy (bytes-like): One byte per cell, 1 for the snake
+            food (int): Food cell, or -1
+            head (int): Head cell, or -1
+
+        Returns:
+            pygame.Surface: Frame of the requested size (reused between calls)
+        """
+        view, cols = self.view, self.cols
+        body = np.frombuffer(occupancy, dtype=np.uint8).reshape(self.rows, cols)
+        np.multiply(body, BODY, out=view)
+        np.maximum(view, self.static, out=view)
+        if food >= 0:
+            view[divmod(food, cols)] = FOOD
+        if head >= 0:
+            view[divmod(head, cols)] = HEAD
+
+        codes, block = self.codes, self.block
+        if block > 1:
+            width, height = codes.shape[0] // block, codes.shape[1] // block
+            codes = codes.reshape(width, block, height, block).max(axis=(1, 3))
+        pygame.surfarray.blit_array(self.pixels, PALETTE[codes])
+        return pygame.transform.scale(self.pixels, self.size, self.frame)
+
+    def draw(self, surface, dest, occupancy, food=-1, head=-1):
+        """Render and blit the frame at dest"""
+        surface.blit(self.render(occupancy, food, head), dest)
+
+
+# Example usage
+if __name__ == "__main__":
+    import os
+    import time
+
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    pygame.init()
+    screen = pygame.display.set_mode((800, 800))
+
+    from snake_engine import make_episode
+
+    sim = make_episode(seed=1, planner='astar', rows=500, cols=500, obstacle_probability=10,
+                       layout='uniform')
+    for _ in range(300):
+        sim.step()
+    board = sim.board
+    renderer = PixelRenderer(board.rows, board.cols, board.obstacles, screen.get_size())
+    start = time.perf_counter()
+    for _ in range(50):
+        renderer.draw(screen, (0, 0), board.occupancy, sim.food, sim.head)
+    pixel_ms = (time.perf_counter() - start) / 50 * 1000
+
+    size = 800 / board.rows
+    start = time.perf_counter()
+    for cell in range(board.size):
+        if board.obstacles[cell]:
+            x, y = board.coords(cell)
+            pygame.draw.rect(screen, (255, 0, 0), (x * size, y * size, size, size))
+    for cell in sim.body:
+        x, y = board.coords(cell)
+        pygame.draw.rect(screen, (255, 255, 255), (x * size, y * size, size, size))
+    rect_ms = (time.perf_counter() - start) * 1000
+    print(f"🖼️  500x500 board, {len(sim.body)} body cells: pixel array {pixel_ms:.1f} ms/frame, "
+          f"one rect per cell {rect_ms:.1f} ms/frame")
+    pygame.quit()
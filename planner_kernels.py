@@ -0,0 +1,337 @@
+"""
+Compiled Search Kernels for Snake A* Experiments
+A* and BFS written as flat loops over the board's obstacle/occupancy bytes and
+preallocated integer buffers, with no Python objects in the inner loop. With
+Numba installed the kernels are compiled with njit; without it the very same
+functions run as plain Python on array-module buffers, so results never depend
+on whether Numba is present. The registered planners ('astar-jit',
+'bfs-jit') only take the kernel path when it is compiled.
+
+The A* heap orders entries by (f, g, cell) like the heapq tuples of
+snake_engine.AStarPlanner, so both planners return identical paths.
+"""
+
+import math
+from array import array
+
+from snake_engine import AStarPlanner, BFSPlanner
+
+try:
+    from numba import njit
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+
+    def njit(*args, **kwargs):
+        """Stand-in decorator when Numba is not installed"""
+        if args and callable(args[0]):
+            return args[0]
+        return lambda function: function
+
+
+@njit(cache=True)
+def _heap_less(heap_f, heap_g, heap_cell, i, j):
+    if heap_f[i] != heap_f[j]:
+        return heap_f[i] < heap_f[j]
+    if heap_g[i] != heap_g[j]:
+        return heap_g[i] < heap_g[j]
+    return heap_cell[i] < heap_cell[j]
+
+
+@njit(cache=True)
+def _heap_swap(heap_f, heap_g, heap_cell, i, j):
+    heap_f[i], heap_f[j] = heap_f[j], heap_f[i]
+    heap_g[i], heap_g[j] = heap_g[j], heap_g[i]
+    heap_cell[i], heap_cell[j] = heap_cell[j], heap_cell[i]
+
+
+@njit(cache=True)
+def _heap_push(heap_f, heap_g, heap_cell, n, f, g, cell):
+    heap_f[n] = f
+    heap_g[n] = g
+    heap_cell[n] = cell
+    i = n
+    while i > 0:
+        parent = (i - 1) >> 1
+        if not _heap_less(heap_f, heap_g, heap_cell, i, parent):
+            break
+        _heap_swap(heap_f, heap_g, heap_cell, i, parent)
+        i = parent
+    return n + 1
+
+
+@njit(cache=True)
+def _heap_pop(heap_f, heap_g, heap_cell, n):
+    """Remove the root; returns the new size (the root is moved to index n - 1)"""
+    n -= 1
+    _heap_swap(heap_f, heap_g, heap_cell, 0, n)
+    i = 0
+    while True:
+        left = 2 * i + 1
+        if left >= n:
+            break
+        child = left
+        if left + 1 < n and _heap_less(heap_f, heap_g, heap_cell, left + 1, left):
+            child = left + 1
+        if not _heap_less(heap_f, heap_g, heap_cell, child, i):
+            break
+        _heap_swap(heap_f, heap_g, heap_cell, i, child)
+        i = child
+    return n
+
+
+@njit(cache=True)
+def _trace_path(cols, start, goal, came_dir, path_out):
+    """Write directions goal -> start into path_out (next move last)"""
+    length = 0
+    cell = goal
+    while cell != start:
+        direction = came_dir[cell]
+        path_out[length] = direction
+        length += 1
+        if direction == 0:
+            cell -= 1
+        elif direction == 1:
+            cell -= cols
+        elif direction == 2:
+            cell += 1
+        else:
+            cell += cols
+    return length
+
+
+@njit(cache=True)
+def astar_kernel(obstacles, occupancy, rows, cols, start, goal, weight, stamp,
+                 seen, g_score, closed, came_dir, heap_f, heap_g, heap_cell, path_out):
+    """
+    A* from start to goal over cells free in both obstacles and occupancy
+
+    seen/closed hold the stamp of the search that last touched a cell, so the
+    buffers never need clearing between searches.
+
+    Returns:
+        tuple: (path length written to path_out, nodes expanded), length -1
+            when the goal is unreachable
+    """
+    gx = goal // cols
+    gy = goal % cols
+    seen[start] = stamp
+    g_score[start] = 0
+    n = _heap_push(heap_f, heap_g, heap_cell, 0, 0.0, 0, start)
+    expanded = 0
+    while n > 0:
+        n = _heap_pop(heap_f, heap_g, heap_cell, n)
+        cell = heap_cell[n]
+        g = heap_g[n]
+        if closed[cell] == stamp:
+            continue
+        closed[cell] = stamp
+        expanded += 1
+        if cell == goal:
+            return _trace_path(cols, start, goal, came_dir, path_out), expanded
+
+        x = cell // cols
+        y = cell % cols
+        ng = g + 1
+        for direction in range(4):
+            if direction == 0:
+                if y == cols - 1:
+                    continue
+                nb = cell + 1
+            elif direction == 1:
+                if x == rows - 1:
+                    continue
+                nb = cell + cols
+            elif direction == 2:
+                if y == 0:
+                    continue
+                nb = cell - 1
+            else:
+                if x == 0:
+                    continue
+                nb = cell - cols
+            if obstacles[nb] or occupancy[nb] or closed[nb] == stamp:
+                continue
+            if seen[nb] != stamp or ng < g_score[nb]:
+                seen[nb] = stamp
+                g_score[nb] = ng
+                came_dir[nb] = direction
+                dx = nb // cols - gx
+                dy = nb % cols - gy
+                h = math.sqrt(dx * dx + dy * dy)
+                n = _heap_push(heap_f, heap_g, heap_cell, n, ng + weight * h, ng, nb)
+    return -1, expanded
+
+
+@njit(cache=True)
+def bfs_kernel(obstacles, occupancy, rows, cols, start, goal, stamp,
+               seen, came_dir, queue, path_out):
+    """
+    Breadth-first search from start to goal (same buffers as astar_kernel)
+
+    Returns:
+        tuple: (path length written to path_out, nodes expanded), length -1
+            when the goal is unreachable
+    """
+    seen[start] = stamp
+    queue[0] = start
+    head = 0
+    tail = 1
+    while head < tail:
+        cell = queue[head]
+        head += 1
+        if cell == goal:
+            return _trace_path(cols, start, goal, came_dir, path_out), head
+
+        x = cell // cols
+        y = cell % cols
+        for direction in range(4):
+            if direction == 0:
+                if y == cols - 1:
+                    continue
+                nb = cell + 1
+            elif direction == 1:
+                if x == rows - 1:
+                    continue
+                nb = cell + cols
+            elif direction == 2:
+                if y == 0:
+                    continue
+                nb = cell - 1
+            else:
+                if x == 0:
+                    continue
+                nb = cell - cols
+            if obstacles[nb] or occupancy[nb] or seen[nb] == stamp:
+                continue
+            seen[nb] = stamp
+            came_dir[nb] = direction
+            queue[tail] = nb
+            tail += 1
+    return -1, head
+
+
+def _buffer(typecode, size, fill=0):
+    """Scratch buffer: a NumPy array for Numba, an array.array otherwise"""
+    if HAVE_NUMBA:
+        import numpy as np
+        return np.full(size, fill, dtype={'i': np.int32, 'd': np.float64, 'b': np.int8}[typecode])
+    return array(typecode, [fill]) * size
+
+
+class KernelBuffers:
+    """Board views and scratch buffers reused by every kernel search"""
+
+    def __init__(self, board, heap=False):
+        """
+        Args:
+            board (Board): Board to search on
+            heap (bool): Also allocate the A* score and heap buffers
+        """
+        size = board.size
+        self.stamp = 0
+        self.seen = _buffer('i', size)
+        self.came_dir = _buffer('b', size)
+        self.path_out = _buffer('b', size)
+        if heap:
+            self.g_score = _buffer('i', size)
+            self.closed = _buffer('i', size)
+            # Lazy deletion: each cell can be pushed once per incoming edge
+            self.heap_f = _buffer('d', 4 * size + 1)
+            self.heap_g = _buffer('i', 4 * size + 1)
+            self.heap_cell = _buffer('i', 4 * size + 1)
+        else:
+            self.queue = _buffer('i', size)
+
+    @staticmethod
+    def bitmaps(board):
+        """
+        Obstacle and occupancy arrays for a kernel call
+
+        Zero-copy views, fetched per search because a forked board replaces
+        its occupancy bytearray on the first write (see Board.fork).
+        """
+        if HAVE_NUMBA:
+            import numpy as np
+            return (np.frombuffer(board.obstacles, dtype=np.uint8),
+                    np.frombuffer(board.dense_occupancy(), dtype=np.uint8))
+        return board.obstacles, board.occupancy
+
+    def next_stamp(self):
+        self.stamp += 1
+        return self.stamp
+
+    def path(self, length):
+        """Direction list for a kernel result ([] when unreachable)"""
+        if length < 0:
+            return []
+        return [int(direction) for direction in self.path_out[:length]]
+
+
+class AStarKernelPlanner(AStarPlanner):
+    """
+    A* through astar_kernel when Numba is available
+
+    Without Numba it runs AStarPlanner's own search, which is faster in plain
+    Python than the uncompiled kernel (use_kernel=True forces the kernel).
+    """
+
+    def __init__(self, board, weight=1.0, use_kernel=None):
+        super().__init__(board, weight)
+        self.use_kernel = HAVE_NUMBA if use_kernel is None else use_kernel
+        if self.use_kernel:
+            self.buffers = KernelBuffers(board, heap=True)
+
+    def search(self, start, goal):
+        if not self.use_kernel:
+            return super().search(start, goal)
+        board, buf = self.board, self.buffers
+        obstacles, occupancy = buf.bitmaps(board)
+        length, expanded = astar_kernel(
+            obstacles, occupancy, board.rows, board.cols, start, goal,
+            self.weight, buf.next_stamp(), buf.seen, buf.g_score, buf.closed,
+            buf.came_dir, buf.heap_f, buf.heap_g, buf.heap_cell, buf.path_out)
+        self.searches += 1
+        self.nodes_expanded += int(expanded)
+        return buf.path(length)
+
+
+class BFSKernelPlanner(BFSPlanner):
+    """Breadth-first search through bfs_kernel (BFSPlanner without Numba)"""
+
+    def __init__(self, board, use_kernel=None):
+        super().__init__(board)
+        self.use_kernel = HAVE_NUMBA if use_kernel is None else use_kernel
+        if self.use_kernel:
+            self.buffers = KernelBuffers(board)
+
+    def plan(self, sim):
+        if not self.use_kernel:
+            return super().plan(sim)
+        board, buf = self.board, self.buffers
+        obstacles, occupancy = buf.bitmaps(board)
+        length, expanded = bfs_kernel(
+            obstacles, occupancy, board.rows, board.cols, sim.head, sim.food,
+            buf.next_stamp(), buf.seen, buf.came_dir, buf.queue, buf.path_out)
+        self.searches += 1
+        self.nodes_expanded += int(expanded)
+        return buf.path(length)
+
+
+# Example usage
+if __name__ == "__main__":
+    import time
+
+    from snake_engine import make_board
+
+    print(f"⚙️  Numba available: {HAVE_NUMBA}")
+    for size in (50, 200, 400):
+        board = make_board(size, size, 3, seed=1)
+        start, goal = board.cell(size // 2, size // 2), board.cell(1, size - 2)
+        for name, planner in (('astar', AStarPlanner(board)),
+                              ('kernel', AStarKernelPlanner(board, use_kernel=True))):
+            planner.search(start, goal)  # Warm-up (compiles with Numba)
+            t0 = time.perf_counter()
+            path = planner.search(start, goal)
+            elapsed = (time.perf_counter() - t0) * 1000
+            print(f"  {size}x{size} {name:9s}: {len(path):4d} steps in {elapsed:8.2f} ms")
@@ -0,0 +1,183 @@
+"""
+Background Planner Service for the Snake A* Game
+Runs path searches on a worker thread or process so the render loop never
+waits for a planning spike. The game hands over a PlanningSnapshot (obstacle
+bitmap, snake body, food) as soon as the food spawns, keeps drawing frames, and
+polls for the finished path.
+
+Snapshots are plain data, so the same service works with a thread pool (cheap
+hand-off, shares the GIL) or a process pool (searches run truly in parallel).
+Process workers can also read the state from a SharedBoard (submit_shared),
+which avoids pickling the board on every request.
+"""
+
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, TimeoutError
+from types import SimpleNamespace
+
+MAX_CACHED_BOARDS = 8
+
+# Boards per obstacle layout, reused by every search in this worker
+_boards = {}
+
+
+class PlanningSnapshot:
+    """Copy of the game state a search needs, safe to send to another process"""
+
+    __slots__ = ('rows', 'cols', 'obstacles', 'body', 'food')
+
+    def __init__(self, rows, cols, obstacles, body, food):
+        """
+        Args:
+            rows, cols (int): Board size
+            obstacles (bytes): One byte per cell (x * cols + y), non-zero for an obstacle
+            body (tuple): Snake cells from tail to head
+            food (int): Food cell
+        """
+        self.rows = rows
+        self.cols = cols
+        self.obstacles = bytes(obstacles)
+        self.body = tuple(body)
+        self.food = food
+
+    def __getstate__(self):
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __setstate__(self, state):
+        for name, value in zip(self.__slots__, state):
+            setattr(self, name, value)
+
+
+def _board_for(snapshot):
+    """Cached Board for the snapshot's layout, with the snake marked on it"""
+    from snake_engine import Board
+
+    key = (snapshot.rows, snapshot.cols, snapshot.obstacles)
+    board = _boards.get(key)
+    if board is None:
+        if len(_boards) >= MAX_CACHED_BOARDS:
+            del _boards[next(iter(_boards))]
+        board = _boards[key] = Board(snapshot.rows, snapshot.cols, snapshot.obstacles)
+    board.occupancy[:] = bytes(board.size)
+    for cell in snapshot.body:
+        board.occupancy[cell] = 1
+    return board
+
+
+def plan_snapshot(snapshot, planner='astar'):
+    """
+    Search a path on a snapshot (runs in the worker)
+
+    Args:
+        snapshot (PlanningSnapshot): Game state to plan on
+        planner (str): Registered planner name from snake_engine.PLANNERS
+
+    Returns:
+        tuple: (directions, seconds) with directions in getpath order
+            (next move last) and the time the search took
+    """
+    from snake_engine import get_planner
+
+    start = time.perf_counter()
+    board = _board_for(snapshot)
+    state = SimpleNamespace(head=snapshot.body[-1], food=snapshot.food,
+                            body=snapshot.body)
+    path = get_planner(planner)(board).plan(state)
+    return path, time.perf_counter() - start
+
+
+class PlannerService:
+    """Computes the next path off the render thread, one request at a time"""
+
+    def __init__(self, mode='thread', planner='astar'):
+        """
+        Args:
+            mode (str): 'thread' or 'process' worker
+            planner (str): Registered planner name (one that plans from the
+                head/food state alone, such as 'astar' or 'bfs')
+        """
+        if mode not in ('thread', 'process'):
+            raise ValueError(f"Unknown planning mode '{mode}' (choose from thread, process)")
+        executor = ThreadPoolExecutor if mode == 'thread' else ProcessPoolExecutor
+        self.executor = executor(max_workers=1)
+        self.mode = mode
+        self.planner = planner
+        self.future = None
+        self.last_duration = 0.0
+        self.searches = 0
+
+    @property
+    def pending(self):
+        """True while a requested path has not been collected"""
+        return self.future is not None
+
+    def submit(self, snapshot):
+        """Start planning on a snapshot, replacing any older request"""
+        if self.future is not None:
+            self.future.cancel()
+        self.future = self.executor.submit(plan_snapshot, snapshot, self.planner)
+
+    def submit_shared(self, shared):
+        """
+        Start planning on a SharedBoard, replacing any older request
+
+        Only the block name crosses the process boundary; the worker reads the
+        state published with SharedBoard.publish* directly from shared memory.
+        """
+        from shared_board import plan_shared
+
+        if self.future is not None:
+            self.future.cancel()
+        self.future = self.executor.submit(plan_shared, shared.name, self.planner)
+
+    def poll(self, timeout=0):
+        """
+        Finished path of the pending request, or None while it is running
+
+        Args:
+            timeout (float): Seconds to wait for the result (0 does not block)
+        """
+        if self.future is None:
+            return None
+        try:
+            path, self.last_duration = self.future.result(timeout=timeout)
+        except TimeoutError:
+            return None
+        self.future = None
+        self.searches += 1
+        return path
+
+    def shutdown(self):
+        if self.future is not None:
+            self.future.cancel()
+            self.future = None
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.shutdown()
+
+
+# Example usage
+if __name__ == "__main__":
+    from snake_engine import make_board
+
+    board = make_board(300, 300, 3, seed=1)
+    snapshot = PlanningSnapshot(board.rows, board.cols, board.obstacles,
+                                [board.cell(150, 150)], board.cell(5, 290))
+    for mode in ('thread', 'process'):
+        with PlannerService(mode) as service:
+            service.submit(snapshot)
+            frame_budget, frames, worst = 1 / 60, 0, 0.0
+            start = time.perf_counter()
+            path = None
+            while path is None:
+                frame_start = time.perf_counter()
+                path = service.poll()
+                frames += 1
+                worst = max(worst, time.perf_counter() - frame_start)
+                time.sleep(frame_budget)
+            print(f"⚙️  {mode:7s}: {len(path)}-step path in {service.last_duration * 1000:.0f} ms, "
+                  f"{frames} frames kept running, worst poll {worst * 1000:.2f} ms")
@@ -0,0 +1,166 @@
+"""
+Plot Decimation Helpers for Snake A* Algorithm Analysis
+Reduces very long score series to a bounded number of points before they are
+handed to matplotlib, so render time stays roughly constant with dataset size.
+"""
+
+import numpy as np
+
+# Upper bounds on what a single panel sends to matplotlib
+MAX_PLOT_POINTS = 2000
+MAX_BARS = 100
+MAX_FLIERS = 200
+HEXBIN_THRESHOLD = 5000
+
+
+def lttb(x, y, n_out):
+    """
+    Largest-Triangle-Three-Buckets downsampling
+
+    Args:
+        x (array): Sample positions (monotonic)
+        y (array): Sample values
+        n_out (int): Number of points to keep
+
+    Returns:
+        np.ndarray: Indices of the kept samples, first and last always included
+    """
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    kept = np.empty(n_out, dtype=np.int64)
+    kept[0], kept[-1] = 0, n - 1
+
+    a = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        if i + 2 < len(edges):
+            next_start, next_end = edges[i + 1], edges[i + 2]
+        else:
+            next_start, next_end = n - 1, n
+        avg_x = x[next_start:next_end].mean()
+        avg_y = y[next_start:next_end].mean()
+
+        # Keep the point forming the largest triangle with the previous pick
+        # and the average of the next bucket
+        area = np.abs((x[a] - avg_x) * (y[start:end] - y[a]) -
+                      (x[a] - x[start:end]) * (avg_y - y[a]))
+        a = start + int(np.argmax(area))
+        kept[i + 1] = a
+    return kept
+
+
+def minmax_decimate(x, y, n_buckets):
+    """
+    Keep the minimum and maximum of each bucket, in original order
+
+    Preserves spikes exactly, which makes it the better choice for
+    difference/volatility series.
+    """
+    n = len(y)
+    if 2 * n_buckets >= n:
+        return np.asarray(x), np.asarray(y)
+
+    y = np.asarray(y, dtype=np.float64)
+    size = -(-n // n_buckets)
+    padded = np.full(size * n_buckets, np.nan)
+    padded[:n] = y
+    blocks = padded.reshape(n_buckets, size)
+    valid = ~np.all(np.isnan(blocks), axis=1)
+    offsets = np.arange(n_buckets) * size
+
+    lo = np.nanargmin(blocks[valid], axis=1) + offsets[valid]
+    hi = np.nanargmax(blocks[valid], axis=1) + offsets[valid]
+    kept = np.sort(np.concatenate([lo, hi]))
+    return np.asarray(x)[kept], y[kept]
+
+
+def decimate_line(x, y, max_points=MAX_PLOT_POINTS, method='lttb'):
+    """
+    Cap a line series at max_points
+
+    Returns:
+        tuple: (x, y, decimated) where decimated tells callers to drop markers
+    """
+    x = np.asarray(x)
+    y = np.asarray(y)
+    if len(y) <= max_points:
+        return x, y, False
+    if method == 'minmax':
+        x_out, y_out = minmax_decimate(x, y, max_points // 2)
+        return x_out, y_out, True
+    kept = lttb(x, y, max_points)
+    return x[kept], y[kept], True
+
+
+def line_style(decimated, style='o-'):
+    """Markers only make sense when every sample is drawn"""
+    return '-' if decimated else style
+
+
+def frequency_bins(values, max_bars=MAX_BARS):
+    """
+    Count score frequencies without sorting the data
+
+    Integer scores are counted with bincount, grouping neighbouring scores
+    into equal-width integer bins once the range exceeds max_bars; anything
+    else is pre-binned into at most max_bars bins.
+
+    Returns:
+        tuple: (bar_positions, counts, bar_width)
+    """
+    values = np.asarray(values)
+    lo, hi = values.min(), values.max()
+    if np.issubdtype(values.dtype, np.integer) or np.all(np.mod(values, 1) == 0):
+        step = max(1, int(np.ceil((hi - lo + 1) / max_bars)))
+        counts = np.bincount(((values - lo) // step).astype(np.int64))
+        positions = lo + np.arange(len(counts)) * step + (step - 1) / 2
+        present = counts > 0
+        return positions[present], counts[present], 0.8 * step
+
+    counts, edges = np.histogram(values, bins=max_bars)
+    return (edges[:-1] + edges[1:]) / 2, counts, edges[1] - edges[0]
+
+
+def prebinned_hist(ax, values, bins, **kwargs):
+    """Draw a histogram from np.histogram output instead of the raw samples"""
+    counts, edges = np.histogram(values, bins=bins)
+    return ax.hist(edges[:-1], bins=edges, weights=counts, **kwargs)
+
+
+def box_stats(values, label, max_fliers=MAX_FLIERS):
+    """
+    Box plot statistics for Axes.bxp with a bounded number of fliers
+
+    Matches the default 1.5 IQR whiskers of Axes.boxplot.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    q1, med, q3 = np.percentile(values, [25, 50, 75])
+    iqr = q3 - q1
+    inside = values[(values >= q1 - 1.5 * iqr) & (values <= q3 + 1.5 * iqr)]
+    fliers = np.unique(values[(values < q1 - 1.5 * iqr) | (values > q3 + 1.5 * iqr)])
+    if len(fliers) > max_fliers:
+        fliers = fliers[np.linspace(0, len(fliers) - 1, max_fliers).astype(np.int64)]
+    return {
+        'label': label,
+        'med': med,
+        'q1': q1,
+        'q3': q3,
+        'whislo': inside.min() if len(inside) else q1,
+        'whishi': inside.max() if len(inside) else q3,
+        'fliers': fliers,
+    }
+
+
+def rolling_mean_std(values, window):
+    """Rolling mean and population std in O(n) using cumulative sums"""
+    values = np.asarray(values, dtype=np.float64)
+    csum = np.concatenate([[0.0], np.cumsum(values)])
+    csq = np.concatenate([[0.0], np.cumsum(values * values)])
+    mean = (csum[window:] - csum[:-window]) / window
+    var = (csq[window:] - csq[:-window]) / window - mean * mean
+    return mean, np.sqrt(np.maximum(var, 0.0))
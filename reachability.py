@@ -0,0 +1,189 @@
+"""
+Incremental Reachability Index for Snake A* Experiments
+Labels the connected components of free cells (no obstacle, no snake) so the
+engine can tell in O(1) whether the food is reachable from the snake head,
+instead of letting a search explore the whole reachable area to find out.
+
+The index watches Board.occupy/release. Freed cells merge their neighbours'
+components through union-find. An occupied cell can only split its component
+when its free neighbours are not joined around it (checked on the 3x3 ring);
+then the labels are marked stale and rebuilt on the next query.
+
+On a board with a cached topology (board_topology.py) the index starts from
+the layout's obstacle-only components and applies the snake cells already on
+the board, so an episode on a fixed map skips the initial labelling pass.
+"""
+
+import copy
+from array import array
+from collections import deque
+
+# Ring of the 8 surrounding cells in cyclic order, as (dx, dy); even indices
+# are the 4-neighbours
+RING = ((0, -1), (1, -1), (1, 0), (1, 1), (0, 1), (-1, 1), (-1, 0), (-1, -1))
+
+
+class ReachabilityIndex:
+    """Connected components of the free cells of a board, kept up to date"""
+
+    def __init__(self, board):
+        """
+        Args:
+            board (Board): Board to index; the index registers itself as a
+                watcher so occupy/release keep it current
+        """
+        self.board = board
+        self.relabels = 0
+        topology = board.topology
+        if topology is None:
+            self.labels = array('i', [-1]) * board.size
+            self.parent = []
+            self.stale = True
+        else:
+            self.labels = array('i', topology.components.astype('int32').tobytes())
+            self.parent = list(range(int(topology.components.max()) + 1))
+            self.stale = False
+            for cell in board.occupied_cells():
+                self.occupy(cell)
+        board.watchers.append(self)
+
+    def detach(self):
+        """Stop following board updates"""
+        self.board.watchers.remove(self)
+
+    def fork(self, board):
+        """Copy of the index following a forked board (see Board.fork)"""
+        index = copy.copy(self)
+        index.board = board
+        index.labels = self.labels[:]
+        index.parent = list(self.parent)
+        board.watchers.append(index)
+        return index
+
+    # -- board hooks -----------------------------------------------------
+
+    def occupy(self, cell):
+        self.labels[cell] = -1
+        if not self.stale and self._may_split(cell):
+            self.stale = True
+
+    def release(self, cell):
+        if self.stale or not self.board.passable(cell):
+            return
+        board, labels = self.board, self.labels
+        root = -1
+        for _, nb in board.neighbors[cell]:
+            if labels[nb] >= 0:
+                other = self._find(labels[nb])
+                if root < 0:
+                    root = other
+                elif other != root:
+                    self.parent[other] = root
+        if root < 0:
+            root = len(self.parent)
+            self.parent.append(root)
+        labels[cell] = root
+
+    # -- queries ---------------------------------------------------------
+
+    def component(self, cell):
+        """Component id of a free cell, or -1 for a blocked one"""
+        if self.stale:
+            self._relabel()
+        label = self.labels[cell]
+        return self._find(label) if label >= 0 else -1
+
+    def head_components(self, head):
+        """Components the snake can enter from head (head itself is occupied)"""
+        if self.stale:
+            self._relabel()
+        labels = self.labels
+        return {self._find(labels[nb]) for _, nb in self.board.neighbors[head]
+                if labels[nb] >= 0}
+
+    def reachable(self, head, cell):
+        """True if cell lies in a component adjacent to the head"""
+        return self.component(cell) in self.head_components(head)
+
+    def random_cell(self, components, rng, attempts=100):
+        """
+        Random free cell in one of the given components, or -1 if they are empty
+
+        Args:
+            components (set): Component ids, e.g. from head_components()
+            rng (random.Random): Random source
+            attempts (int): Random picks before falling back to a scan
+        """
+        if not components:
+            return -1
+        size = self.board.size
+        for _ in range(attempts):
+            cell = rng.randrange(size)
+            if self.component(cell) in components:
+                return cell
+
+        # Fallback: scan for any cell of the components
+        for cell in range(size):
+            if self.component(cell) in components:
+                return cell
+        return -1
+
+    # -- internals -------------------------------------------------------
+
+    def _find(self, label):
+        parent = self.parent
+        while parent[label] != label:
+            parent[label] = parent[parent[label]]
+            label = parent[label]
+        return label
+
+    def _may_split(self, cell):
+        """
+        True unless the free 4-neighbours of cell stay joined through the
+        surrounding ring, in which case occupying cell cannot split anything
+        """
+        board = self.board
+        rows, cols = board.rows, board.cols
+        x, y = divmod(cell, cols)
+        free = []
+        for dx, dy in RING:
+            nx, ny = x + dx, y + dy
+            free.append(0 <= nx < rows and 0 <= ny < cols and
+                        board.passable(nx * cols + ny))
+
+        # Count runs of consecutive free ring cells that touch a 4-neighbour
+        runs = 0
+        start = free.index(False) if False in free else 0
+        touching = False
+        for offset in range(1, 9):
+            i = (start + offset) % 8
+            if free[i]:
+                touching = touching or i % 2 == 0
+            else:
+                runs += touching
+                touching = False
+        runs += touching
+        return runs > 1
+
+    def _relabel(self):
+        """Rebuild all labels with one BFS per component"""
+        board = self.board
+        labels, neighbors, passable = self.labels, board.neighbors, board.passable
+        for cell in range(board.size):
+            labels[cell] = -1
+        parent = []
+        for seed in range(board.size):
+            if labels[seed] >= 0 or not passable(seed):
+                continue
+            label = len(parent)
+            parent.append(label)
+            labels[seed] = label
+            queue = deque([seed])
+            while queue:
+                for _, nb in neighbors[queue.popleft()]:
+                    if labels[nb] < 0 and passable(nb):
+                        labels[nb] = label
+                        queue.append(nb)
+        self.parent = parent
+        self.stale = False
+        self.relabels += 1
@@ -0,0 +1,313 @@
+"""
+Keyframe-Indexed Episode Replays for Snake A* Experiments
+A replay stores the move stream of one episode (one direction byte per tick)
+plus a keyframe every few hundred ticks: body, head, food, score and the food
+RNG state. Seeking to tick N restores the nearest keyframe at or before N and
+re-simulates only the moves after it, with no planning, so any tick of a
+20,000-tick episode is reached after at most one keyframe interval of cheap
+scripted steps. The restored state is a Simulation.fork of the episode's
+start, so the obstacle map and neighbour table are built once per replay.
+
+Replays are saved as compressed .npz files (see run_recorded_episode and
+snake_cli.py simulate --replay-dir) and can be inspected programmatically
+(seek, play) or in a pygame viewer with a seek bar (view_replay).
+"""
+
+import bisect
+import json
+import math
+import os
+import time
+from collections import deque
+
+import numpy as np
+
+from snake_engine import Planner, episode_record, make_episode
+
+KEYFRAME_INTERVAL = 250
+
+
+class ScriptedPlanner(Planner):
+    """Plays back recorded moves, one per plan() call, indexed by the tick"""
+
+    cacheable = False
+
+    def __init__(self, board, moves=b''):
+        super().__init__(board)
+        self.moves = moves
+
+    def plan(self, sim):
+        # One move at a time, so food checks run every tick as in any recording
+        if sim.steps < len(self.moves):
+            return [self.moves[sim.steps]]
+        return []
+
+
+def _direction(board, cell, nxt):
+    """Direction code of the move from cell to the adjacent cell nxt"""
+    delta = nxt - cell
+    if delta == 1:
+        return 0
+    if delta == board.cols:
+        return 1
+    if delta == -1:
+        return 2
+    return 3
+
+
+class EpisodeReplay:
+    """Move stream and keyframes of one recorded episode"""
+
+    def __init__(self, settings, moves, keyframes, record):
+        """
+        Args:
+            settings (dict): make_episode settings of the recording (with seed)
+            moves (bytes): Direction code per tick
+            keyframes (dict): Keyframe arrays ('ticks', 'heads', 'foods',
+                'scores', 'respawns', 'body_offsets', 'bodies', 'rng_states',
+                'rng_gauss'); keyframe i's body, tail first, is
+                bodies[body_offsets[i]:body_offsets[i + 1]]
+            record (dict): Episode record of the recording
+        """
+        self.settings = settings
+        self.moves = bytes(moves)
+        self.keyframes = keyframes
+        self.record = record
+        self.key_ticks = keyframes['ticks'].tolist()  # Tick -> keyframe index via bisect
+        self._start = None
+
+    @property
+    def ticks(self):
+        """Number of recorded moves (the last seekable tick)"""
+        return len(self.moves)
+
+    def save(self, path):
+        np.savez_compressed(path, moves=np.frombuffer(self.moves, dtype=np.uint8),
+                            settings=json.dumps(self.settings), record=json.dumps(self.record),
+                            **self.keyframes)
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path) as data:
+            keyframes = {key: data[key] for key in data.files
+                         if key not in ('moves', 'settings', 'record')}
+            return cls(json.loads(str(data['settings'])), data['moves'].tobytes(), keyframes,
+                       json.loads(str(data['record'])))
+
+    def _start_state(self):
+        """Simulation at tick 0 driven by the recorded moves (built once)"""
+        if self._start is None:
+            settings = dict(self.settings, planner=ScriptedPlanner,
+                            planner_options={'moves': self.moves}, max_steps=None,
+                            max_seconds=None, livelock_repeats=0)
+            self._start = make_episode(**settings)
+            self._start.settings['planner'] = self.settings.get('planner', 'astar')
+        return self._start
+
+    def seek(self, tick):
+        """
+        Game state after `tick` moves
+
+        Args:
+            tick (int): Tick to seek to (clamped to 0..ticks)
+
+        Returns:
+            Simulation: Independent state; step() continues the recording
+        """
+        tick = max(0, min(tick, self.ticks))
+        key = bisect.bisect_right(self.key_ticks, tick) - 1
+        frames = self.keyframes
+        sim = self._start_state().fork()
+        board = sim.board
+        for cell in sim.body:
+            board.release(cell)
+        start, end = frames['body_offsets'][key], frames['body_offsets'][key + 1]
+        sim.body = deque(frames['bodies'][start:end].tolist())
+        for cell in sim.body:
+            board.occupy(cell)
+        sim.head = int(frames['heads'][key])
+        sim.food = int(frames['foods'][key])
+        sim.score = int(frames['scores'][key])
+        sim.food_respawns = int(frames['respawns'][key])
+        sim.steps = self.key_ticks[key]
+        gauss = float(frames['rng_gauss'][key])
+        sim.rng.setstate((3, tuple(frames['rng_states'][key].tolist()),
+                          None if math.isnan(gauss) else gauss))
+        sim.path = []
+
+        while sim.steps < tick and sim.step():
+            pass
+        if sim.steps == self.ticks:
+            # The recording ends here: report it as it ended
+            sim.alive = False
+            sim.death_cause = self.record.get('death_cause')
+        return sim
+
+    def play(self, start=0, stop=None):
+        """Yield the state after each tick from start to stop (same Simulation object)"""
+        stop = self.ticks if stop is None else min(stop, self.ticks)
+        sim = self.seek(start)
+        yield sim
+        while sim.steps < stop and sim.step():
+            yield sim
+
+
+def record_episode(seed=0, keyframe_interval=KEYFRAME_INTERVAL, **settings):
+    """
+    Play one headless episode while recording its replay
+
+    Args:
+        seed (int): Episode seed
+        keyframe_interval (int): Ticks between keyframes (the longest re-simulation per seek)
+        **settings: Passed through to make_episode
+
+    Returns:
+        EpisodeReplay: Replay, with the episode record in replay.record
+    """
+    start_time = time.perf_counter()
+    sim = make_episode(seed, **settings)
+    board = sim.board
+    moves = bytearray()
+    ticks, heads, foods, scores, respawns = [], [], [], [], []
+    offsets, bodies, rng_states, rng_gauss = [0], [], [], []
+    while True:
+        if sim.steps % keyframe_interval == 0 and (not ticks or ticks[-1] != sim.steps):
+            ticks.append(sim.steps)
+            heads.append(sim.head)
+            foods.append(sim.food)
+            scores.append(sim.score)
+            respawns.append(sim.food_respawns)
+            bodies.extend(sim.body)
+            offsets.append(len(bodies))
+            _, state, gauss = sim.rng.getstate()
+            rng_states.append(state)
+            rng_gauss.append(math.nan if gauss is None else gauss)
+        head, steps = sim.head, sim.steps
+        alive = sim.step()
+        if sim.steps > steps:
+            moves.append(_direction(board, head, sim.head))
+        if not alive:
+            break
+    record = episode_record(sim, time.perf_counter() - start_time)
+
+    keyframes = {
+        'ticks': np.array(ticks, dtype=np.int64),
+        'heads': np.array(heads, dtype=np.int64),
+        'foods': np.array(foods, dtype=np.int64),
+        'scores': np.array(scores, dtype=np.int64),
+        'respawns': np.array(respawns, dtype=np.int64),
+        'body_offsets': np.array(offsets, dtype=np.int64),
+        'bodies': np.array(bodies, dtype=np.int64),
+        'rng_states': np.array(rng_states, dtype=np.uint32),
+        'rng_gauss': np.array(rng_gauss, dtype=np.float64),
+    }
+    return EpisodeReplay(dict(settings, seed=seed), moves, keyframes, record)
+
+
+def run_recorded_episode(seed=0, replay_dir='replays', keyframe_interval=KEYFRAME_INTERVAL,
+                         **settings):
+    """
+    run_episode replacement that also saves the replay (for run_episodes)
+
+    Returns:
+        dict: Episode record, with the replay file under 'replay'
+    """
+    replay = record_episode(seed, keyframe_interval, **settings)
+    os.makedirs(replay_dir, exist_ok=True)
+    path = os.path.join(replay_dir, f"{settings.get('planner', 'astar')}_seed{seed}.npz")
+    replay.save(path)
+    return dict(replay.record, replay=path)
+
+
+def view_replay(replay, tick=0, window=600, fps=30):
+    """
+    Browse a replay in a pygame window
+
+    Keys: SPACE play/pause, LEFT/RIGHT one tick, DOWN/UP one keyframe
+    interval, HOME/END; click or drag on the bar at the bottom to seek.
+
+    Args:
+        replay (EpisodeReplay or str): Replay or .npz path
+        tick (int): Tick shown first
+        window (int): Board size in pixels
+        fps (float): Ticks per second while playing
+    """
+    import pygame
+
+    from pixel_renderer import PixelRenderer
+
+    if isinstance(replay, str):
+        replay = EpisodeReplay.load(replay)
+    pygame.init()
+    bar = 24
+    screen = pygame.display.set_mode((window, window + bar))
+    pygame.display.set_caption("Snake A* - Replay")
+    font = pygame.font.Font(None, 20)
+    clock = pygame.time.Clock()
+
+    sim = replay.seek(tick)
+    board = sim.board
+    renderer = PixelRenderer(board.rows, board.cols, board.obstacles, (window, window))
+    interval = int(np.diff(replay.key_ticks).max()) if len(replay.key_ticks) > 1 else replay.ticks
+    playing = False
+    running = True
+    while running:
+        target = None
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                running = False
+            elif event.type == pygame.KEYDOWN:
+                jumps = {pygame.K_LEFT: -1, pygame.K_RIGHT: 1,
+                         pygame.K_DOWN: -interval, pygame.K_UP: interval}
+                if event.key == pygame.K_ESCAPE:
+                    running = False
+                elif event.key == pygame.K_SPACE:
+                    playing = not playing
+                elif event.key in jumps:
+                    target = sim.steps + jumps[event.key]
+                elif event.key == pygame.K_HOME:
+                    target = 0
+                elif event.key == pygame.K_END:
+                    target = replay.ticks
+            elif (event.type in (pygame.MOUSEBUTTONDOWN, pygame.MOUSEMOTION)
+                  and pygame.mouse.get_pressed()[0] and event.pos[1] >= window):
+                target = round(event.pos[0] / window * replay.ticks)
+
+        if target is not None and target != sim.steps:
+            if target == sim.steps + 1:
+                sim.step()  # No need to go back to a keyframe
+            else:
+                sim = replay.seek(target)
+        elif playing and not sim.step():
+            playing = False
+
+        renderer.draw(screen, (0, 0), sim.board.dense_occupancy(), sim.food, sim.head)
+        screen.fill((40, 40, 40), (0, window, window, bar))
+        progress = sim.steps / replay.ticks if replay.ticks else 1.0
+        screen.fill((0, 0, 255), (0, window, int(progress * window), bar))
+        label = (f"tick {sim.steps}/{replay.ticks}  score {sim.score}"
+                 + ("" if sim.alive else f"  ({sim.death_cause})"))
+        screen.blit(font.render(label, True, (255, 255, 255)), (6, window + 5))
+        pygame.display.flip()
+        clock.tick(fps if playing else 60)
+    pygame.quit()
+
+
+# Example usage
+if __name__ == "__main__":
+    replay = record_episode(seed=7, planner='hamiltonian', rows=20, cols=20, max_steps=20000)
+    print(f"📼 Recorded {replay.ticks} ticks, score {replay.record['score']}, "
+          f"{len(replay.key_ticks)} keyframes")
+
+    tick = replay.ticks - 1
+    start = time.perf_counter()
+    naive = make_episode(7, planner='hamiltonian', rows=20, cols=20, max_steps=20000)
+    while naive.steps < tick and naive.step():
+        pass
+    naive_ms = (time.perf_counter() - start) * 1000
+    start = time.perf_counter()
+    sim = replay.seek(tick)
+    seek_ms = (time.perf_counter() - start) * 1000
+    same = (list(sim.body), sim.food, sim.score) == (list(naive.body), naive.food, naive.score)
+    print(f"⏩ Tick {tick}: re-simulating {naive_ms:.0f} ms, keyframe seek {seek_ms:.1f} ms "
+          f"(states match: {same})")
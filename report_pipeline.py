@@ -0,0 +1,154 @@
+"""
+Headless Report Pipeline for Snake A* Algorithm
+Renders every analysis and comparison panel to its own PNG/SVG file with the
+Agg backend, so reports can be generated on machines without a display.
+Panels are rendered in parallel worker processes, and a panel whose input data
+hash matches the previous run is skipped, which keeps nightly runs incremental.
+"""
+
+import hashlib
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+import matplotlib
+matplotlib.use('Agg')  # must happen before the analysis modules import pyplot
+import numpy as np
+
+from advanced_performance_analysis import SnakePerformanceAnalyzer
+from analysis_backend import figure_class
+from performance_comparison import PerformanceComparator
+
+MANIFEST_NAME = '.report_manifest.json'
+PIPELINE_VERSION = 2  # Bump to force a full re-render after changing panel code
+PANEL_SIZE = (8, 6)
+PANEL_DPI = 100
+
+
+def _digest(kind, panel, formats, arrays):
+    """Hash everything a panel's output depends on"""
+    h = hashlib.sha256()
+    h.update(f'{PIPELINE_VERSION}|{kind}|{panel}|{",".join(formats)}'.encode())
+    for label, values in arrays:
+        h.update(f'|{label}|'.encode())
+        if values is not None:
+            h.update(np.ascontiguousarray(values, dtype=np.float64).tobytes())
+    return h.hexdigest()
+
+
+def _build_jobs(scores, times, datasets, formats, output_dir):
+    """Create one render job per panel"""
+    jobs = []
+    if scores is not None:
+        arrays = [('scores', scores), ('times', times)]
+        panels = SnakePerformanceAnalyzer.PANELS
+        if times is not None:
+            panels += SnakePerformanceAnalyzer.TIME_PANELS
+        for panel in panels:
+            jobs.append({
+                'kind': 'analysis',
+                'panel': panel,
+                'data': {'scores': scores, 'times': times},
+                'digest': _digest('analysis', panel, formats, arrays),
+            })
+    if datasets and len(datasets) >= 2:
+        arrays = [(f'{name}:{description}', values)
+                  for name, (values, description) in datasets.items()]
+        for panel in PerformanceComparator.PANELS:
+            jobs.append({
+                'kind': 'comparison',
+                'panel': panel,
+                'data': {'datasets': datasets},
+                'digest': _digest('comparison', panel, formats, arrays),
+            })
+    for job in jobs:
+        job['key'] = f"{job['kind']}_{job['panel']}"
+        job['files'] = [os.path.join(output_dir, f"{job['key']}.{fmt}") for fmt in formats]
+    return jobs
+
+
+def _render_panel(job):
+    """Render a single panel to its output files (runs in a worker process)"""
+    if job['kind'] == 'analysis':
+        owner = SnakePerformanceAnalyzer(job['data']['scores'], job['data']['times'])
+        projection = None
+    else:
+        owner = PerformanceComparator()
+        for name, (values, description) in job['data']['datasets'].items():
+            owner.add_dataset(name, values, description)
+        projection = owner.PANEL_PROJECTIONS.get(job['panel'])
+
+    fig = figure_class()(figsize=PANEL_SIZE)
+    ax = fig.add_subplot(1, 1, 1, projection=projection)
+    getattr(owner, f"plot_{job['panel']}")(ax)
+    fig.tight_layout()
+    for path in job['files']:
+        fig.savefig(path, dpi=PANEL_DPI)
+    return job['key']
+
+
+def _load_manifest(output_dir):
+    """Read the digests recorded by the previous run"""
+    try:
+        with open(os.path.join(output_dir, MANIFEST_NAME)) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def render_report(scores=None, times=None, datasets=None, output_dir='reports',
+                  formats=('png',), max_workers=None, force=False):
+    """
+    Render analysis and comparison panels to image files
+
+    Args:
+        scores (list, optional): Game scores for the single-run analysis panels
+        times (list, optional): Time taken for each game
+        datasets (dict, optional): name -> (scores, description) for comparison panels
+        output_dir (str): Directory receiving one file per panel and format
+        formats (tuple): Image formats to write, e.g. ('png', 'svg')
+        max_workers (int, optional): Worker processes; 1 renders in-process
+        force (bool): Re-render every panel even if its data is unchanged
+
+    Returns:
+        dict: 'rendered' and 'skipped' lists of panel keys
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    formats = tuple(formats)
+    jobs = _build_jobs(scores, times, datasets, formats, output_dir)
+    manifest = _load_manifest(output_dir)
+
+    pending, skipped = [], []
+    for job in jobs:
+        previous = manifest.get(job['key'], {})
+        up_to_date = (previous.get('digest') == job['digest'] and
+                      all(os.path.exists(path) for path in job['files']))
+        if up_to_date and not force:
+            skipped.append(job['key'])
+        else:
+            pending.append(job)
+
+    if max_workers == 1 or len(pending) <= 1:
+        rendered = [_render_panel(job) for job in pending]
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            rendered = list(pool.map(_render_panel, pending))
+
+    manifest = {job['key']: {'digest': job['digest'], 'files': job['files']}
+                for job in jobs}
+    with open(os.path.join(output_dir, MANIFEST_NAME), 'w') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+
+    return {'rendered': rendered, 'skipped': skipped}
+
+
+# Example usage with the snake game data
+if __name__ == "__main__":
+    scores = [33, 48, 68, 35, 43, 52, 61, 36, 41, 56, 45, 78, 80, 79, 36, 48, 92, 56, 40, 36]
+    times = [53, 75, 178, 56.4, 91, 135, 150, 59, 80, 110, 98, 190, 201, 185, 73, 74, 75, 76, 77, 78]
+
+    output_dir = sys.argv[1] if len(sys.argv) > 1 else 'reports'
+    result = render_report(scores, times, output_dir=output_dir, formats=('png', 'svg'))
+    print(f"Rendered {len(result['rendered'])} panels, "
+          f"skipped {len(result['skipped'])} unchanged panels -> {output_dir}")
@@ -0,0 +1,192 @@
+"""
+Episode Results Store for Snake A* Experiments
+Keeps one row per episode in a local SQLite database, indexed on the planner and
+board configuration columns, so analysis can query slices such as
+"planner=astar, rows=100, score>50" without re-running games or scanning files.
+"""
+
+import json
+import re
+import sqlite3
+
+# Per-episode columns, in record order
+COLUMNS = (
+    ('run', 'TEXT'),
+    ('planner', 'TEXT'),
+    ('rows', 'INTEGER'),
+    ('cols', 'INTEGER'),
+    ('obstacle_probability', 'REAL'),
+    ('seed', 'INTEGER'),
+    ('board_seed', 'INTEGER'),
+    ('score', 'INTEGER'),
+    ('steps', 'INTEGER'),
+    ('duration', 'REAL'),
+    ('nodes_expanded', 'INTEGER'),
+    ('searches', 'INTEGER'),
+    ('death_cause', 'TEXT'),
+)
+COLUMN_NAMES = tuple(name for name, _ in COLUMNS)
+
+INDEXES = {
+    'idx_episodes_config': ('planner', 'rows', 'cols', 'obstacle_probability', 'score'),
+    'idx_episodes_run': ('run',),
+    'idx_episodes_score': ('score',),
+}
+
+_CONDITION = re.compile(r'^\s*(\w+)\s*(<=|>=|!=|==|=|<|>)\s*(.*?)\s*$')
+
+
+def _literal(text):
+    """Filter value as int, float or (unquoted) string"""
+    for cast in (int, float):
+        try:
+            return cast(text)
+        except ValueError:
+            pass
+    return text.strip('\'"')
+
+
+def parse_filter(text):
+    """
+    Parse "planner=astar, rows=100, score>50" into (column, operator, value)
+    conditions, all of which must hold
+    """
+    conditions = []
+    for part in filter(None, (piece.strip() for piece in text.split(','))):
+        match = _CONDITION.match(part)
+        if not match:
+            raise ValueError(f"Cannot parse filter condition '{part}'")
+        column, operator, value = match.groups()
+        if column not in COLUMN_NAMES:
+            raise ValueError(f"Unknown column '{column}' (choose from {', '.join(COLUMN_NAMES)})")
+        conditions.append((column, '=' if operator == '==' else operator, _literal(value)))
+    return conditions
+
+
+def _where_clause(where):
+    """SQL WHERE clause and parameters for a filter string, dict or None"""
+    if not where:
+        return '', []
+    if isinstance(where, dict):
+        conditions = []
+        for column, value in where.items():
+            if column not in COLUMN_NAMES:
+                raise ValueError(f"Unknown column '{column}'")
+            conditions.append((column, '=', value))
+    else:
+        conditions = parse_filter(where)
+    sql = ' AND '.join(f'"{column}" {operator} ?' for column, operator, _ in conditions)
+    return ' WHERE ' + sql, [value for _, _, value in conditions]
+
+
+class ResultsStore:
+    """SQLite-backed table of episode records"""
+
+    def __init__(self, path='results.db'):
+        """
+        Args:
+            path (str): Database file (created on first use)
+        """
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.row_factory = sqlite3.Row
+        self._create_schema()
+
+    def _create_schema(self):
+        columns = ', '.join(f'"{name}" {sql_type}' for name, sql_type in COLUMNS)
+        with self.conn:
+            self.conn.execute(f'CREATE TABLE IF NOT EXISTS episodes '
+                              f'(id INTEGER PRIMARY KEY, {columns}, extra TEXT)')
+            for index, index_columns in INDEXES.items():
+                quoted = ', '.join(f'"{name}"' for name in index_columns)
+                self.conn.execute(f'CREATE INDEX IF NOT EXISTS {index} ON episodes ({quoted})')
+
+    def add_records(self, records, run=None):
+        """
+        Insert episode records in one transaction
+
+        Fields outside COLUMNS are kept as JSON in the extra column.
+
+        Returns:
+            int: Number of rows inserted
+        """
+        rows = []
+        for record in records:
+            record = dict(record)
+            if run is not None:
+                record['run'] = run
+            extra = {key: value for key, value in record.items() if key not in COLUMN_NAMES}
+            rows.append([record.get(name) for name in COLUMN_NAMES] +
+                        [json.dumps(extra) if extra else None])
+        placeholders = ', '.join('?' * (len(COLUMN_NAMES) + 1))
+        names = ', '.join(f'"{name}"' for name in COLUMN_NAMES)
+        with self.conn:
+            self.conn.executemany(f'INSERT INTO episodes ({names}, extra) '
+                                  f'VALUES ({placeholders})', rows)
+        return len(rows)
+
+    def query(self, where=None, order_by='id', limit=None):
+        """
+        Episode records matching a filter
+
+        Args:
+            where (str or dict, optional): e.g. "planner=astar, rows=100, score>50"
+            order_by (str): Column to sort by
+            limit (int, optional): Maximum number of rows
+
+        Returns:
+            list: Record dicts (extra fields merged back in)
+        """
+        if order_by != 'id' and order_by not in COLUMN_NAMES:
+            raise ValueError(f"Unknown column '{order_by}'")
+        clause, params = _where_clause(where)
+        sql = f'SELECT * FROM episodes{clause} ORDER BY "{order_by}"'
+        if limit is not None:
+            sql += f' LIMIT {int(limit)}'
+        records = []
+        for row in self.conn.execute(sql, params):
+            record = {name: row[name] for name in COLUMN_NAMES}
+            if row['extra']:
+                record.update(json.loads(row['extra']))
+            records.append(record)
+        return records
+
+    def column(self, name, where=None):
+        """Values of one column for the matching episodes, in insertion order"""
+        if name not in COLUMN_NAMES:
+            raise ValueError(f"Unknown column '{name}'")
+        clause, params = _where_clause(where)
+        return [row[0] for row in
+                self.conn.execute(f'SELECT "{name}" FROM episodes{clause} ORDER BY id', params)]
+
+    def grouped(self, group_by, column='score', where=None):
+        """dict of group value -> list of column values, e.g. scores per planner"""
+        for name in (group_by, column):
+            if name not in COLUMN_NAMES:
+                raise ValueError(f"Unknown column '{name}'")
+        clause, params = _where_clause(where)
+        groups = {}
+        for key, value in self.conn.execute(
+                f'SELECT "{group_by}", "{column}" FROM episodes{clause} ORDER BY id', params):
+            groups.setdefault(key, []).append(value)
+        return groups
+
+    def count(self, where=None):
+        """Number of matching episodes"""
+        clause, params = _where_clause(where)
+        return self.conn.execute(f'SELECT COUNT(*) FROM episodes{clause}', params).fetchone()[0]
+
+    def explain(self, where=None):
+        """SQLite query plan for a filter, to check that an index is used"""
+        clause, params = _where_clause(where)
+        return [row[-1] for row in
+                self.conn.execute(f'EXPLAIN QUERY PLAN SELECT * FROM episodes{clause}', params)]
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
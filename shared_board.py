@@ -0,0 +1,213 @@
+"""
+Shared-Memory Board State for Multiprocess Planner Workers
+Keeps a board (obstacle bitmap, occupancy bitmap, head and food cells) in a
+multiprocessing.shared_memory block, so worker processes attach once and read
+the current state without any pickling.
+
+Layout of the block:
+    header     seq, layout, rows, cols, head, food  (HEADER struct)
+    obstacles  rows * cols bytes, non-zero for an obstacle
+    occupancy  rows * cols bytes, non-zero for a snake cell
+
+The header's seq counter is a seqlock: the writer makes it odd before changing
+anything and even again afterwards, and readers retry until they saw the same
+even value before and after copying. layout changes only when the obstacle
+bitmap does, so workers can keep their Board (and neighbour table) across reads.
+"""
+
+import struct
+import time
+from multiprocessing import shared_memory
+
+HEADER = struct.Struct('<QQIIqq')  # seq, layout, rows, cols, head, food
+MAX_READ_RETRIES = 1000
+
+# Blocks and boards attached by this (worker) process
+_attached = {}
+
+
+def _attach_block(name):
+    """Attach to an existing block without taking over its cleanup"""
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        # Python < 3.13: worker processes share the creator's resource tracker,
+        # which already knows the block, so attaching registers nothing new
+        return shared_memory.SharedMemory(name=name)
+
+
+class SharedBoard:
+    """Board state in shared memory with a seqlock-versioned header"""
+
+    def __init__(self, shm, owner):
+        self.shm = shm
+        self.owner = owner
+        _, _, self.rows, self.cols, _, _ = HEADER.unpack_from(shm.buf, 0)
+        self.size = self.rows * self.cols
+        self.obstacles_offset = HEADER.size
+        self.occupancy_offset = HEADER.size + self.size
+
+    @classmethod
+    def create(cls, rows, cols, obstacles=None, name=None):
+        """
+        Allocate a new shared board (the creating process owns and unlinks it)
+
+        Args:
+            rows, cols (int): Board size
+            obstacles (bytes-like, optional): Initial obstacle bitmap
+            name (str, optional): Block name (default: chosen by the OS)
+        """
+        size = rows * cols
+        shm = shared_memory.SharedMemory(name=name, create=True, size=HEADER.size + 2 * size)
+        HEADER.pack_into(shm.buf, 0, 0, 0, rows, cols, -1, -1)
+        board = cls(shm, owner=True)
+        if obstacles is not None:
+            board.publish(obstacles=obstacles)
+        return board
+
+    @classmethod
+    def attach(cls, name):
+        """Attach to a shared board created by another process"""
+        return cls(_attach_block(name), owner=False)
+
+    @property
+    def name(self):
+        return self.shm.name
+
+    @property
+    def layout(self):
+        """Counter bumped whenever the obstacle bitmap changes"""
+        return HEADER.unpack_from(self.shm.buf, 0)[1]
+
+    @property
+    def version(self):
+        """Current seq value (even when no write is in progress)"""
+        return HEADER.unpack_from(self.shm.buf, 0)[0]
+
+    def publish(self, occupancy=None, head=None, food=None, obstacles=None):
+        """
+        Write new state (any subset of the fields) as one atomic update
+
+        Args:
+            occupancy (bytes-like, optional): Occupancy bitmap
+            head, food (int, optional): Head and food cells
+            obstacles (bytes-like, optional): New obstacle bitmap (bumps layout)
+        """
+        buf = self.shm.buf
+        seq, layout, rows, cols, old_head, old_food = HEADER.unpack_from(buf, 0)
+        HEADER.pack_into(buf, 0, seq + 1, layout, rows, cols, old_head, old_food)
+        if obstacles is not None:
+            buf[self.obstacles_offset:self.occupancy_offset] = bytes(obstacles)
+            layout += 1
+        if occupancy is not None:
+            buf[self.occupancy_offset:self.occupancy_offset + self.size] = occupancy
+        HEADER.pack_into(buf, 0, seq + 2, layout, rows, cols,
+                         old_head if head is None else head,
+                         old_food if food is None else food)
+
+    def publish_board(self, board, head, food):
+        """Publish an engine Board's occupancy together with head and food"""
+        self.publish(occupancy=board.occupancy, head=head, food=food)
+
+    def read_into(self, occupancy):
+        """
+        Copy a consistent occupancy bitmap into a writable buffer
+
+        Returns:
+            tuple: (seq, layout, head, food) of the snapshot that was copied
+        """
+        buf = self.shm.buf
+        start, end = self.occupancy_offset, self.occupancy_offset + self.size
+        for _ in range(MAX_READ_RETRIES):
+            seq, layout, _, _, head, food = HEADER.unpack_from(buf, 0)
+            if seq & 1:
+                time.sleep(0)  # Writer in progress
+                continue
+            occupancy[:] = buf[start:end]
+            if HEADER.unpack_from(buf, 0)[0] == seq:
+                return seq, layout, head, food
+        raise RuntimeError(f"Shared board '{self.name}' kept changing while being read")
+
+    def obstacles(self):
+        """Copy of the obstacle bitmap"""
+        return bytes(self.shm.buf[self.obstacles_offset:self.occupancy_offset])
+
+    def close(self):
+        self.shm.close()
+        if self.owner:
+            self.shm.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def plan_shared(name, planner='astar'):
+    """
+    Search a path on a shared board (runs in the worker)
+
+    The worker attaches once per block and keeps one engine Board per obstacle
+    layout; each call only copies the occupancy bitmap under the seqlock.
+
+    Returns:
+        tuple: (directions, seconds) with directions in getpath order
+    """
+    from types import SimpleNamespace
+
+    from snake_engine import Board, get_planner
+
+    start = time.perf_counter()
+    entry = _attached.get(name)
+    if entry is None:
+        entry = _attached[name] = {'shared': SharedBoard.attach(name), 'layout': None,
+                                   'board': None}
+    shared = entry['shared']
+    while True:
+        if entry['board'] is None or entry['layout'] != shared.layout:
+            # New obstacle bitmap (e.g. a restarted game): rebuild the neighbour table
+            entry['layout'] = shared.layout
+            entry['board'] = Board(shared.rows, shared.cols, shared.obstacles())
+        board = entry['board']
+        _, layout, head, food = shared.read_into(board.occupancy)
+        if layout == entry['layout']:
+            break
+
+    # The head is part of the snake but is where the search starts
+    state = SimpleNamespace(head=head, food=food, body=(head,))
+    path = get_planner(planner)(board).plan(state)
+    return path, time.perf_counter() - start
+
+
+# Example usage
+if __name__ == "__main__":
+    import pickle
+
+    from planner_service import PlanningSnapshot, PlannerService
+    from snake_engine import make_board
+
+    board = make_board(1000, 1000, 3, seed=1)
+    head, food = board.cell(500, 500), board.cell(520, 540)
+    for cell in range(board.cell(300, 0), board.cell(300, 900)):
+        board.occupy(cell)
+    board.occupy(head)
+
+    body = [cell for cell in range(board.size) if board.occupancy[cell] and cell != head]
+    snapshot = PlanningSnapshot(board.rows, board.cols, board.obstacles, body + [head], food)
+    print(f"📦 Pickled snapshot: {len(pickle.dumps(snapshot)) / 1e6:.1f} MB per request")
+
+    with SharedBoard.create(board.rows, board.cols, board.obstacles) as shared, \
+            PlannerService('process') as service:
+        for label in ('snapshot', 'shared'):
+            for attempt in range(3):
+                start = time.perf_counter()
+                if label == 'shared':
+                    shared.publish_board(board, head, food)
+                    service.submit_shared(shared)
+                else:
+                    service.submit(snapshot)
+                path = service.poll(timeout=60)
+                print(f"🧠 {label:8s} request {attempt + 1}: {len(path)}-step path, "
+                      f"round trip {(time.perf_counter() - start) * 1000:7.1f} ms "
+                      f"(search {service.last_duration * 1000:7.1f} ms)")
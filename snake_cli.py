@@ -0,0 +1,603 @@
+#!/usr/bin/env python3
+"""
+Command-Line Entry Point for Snake A* Experiments
+Subcommands:
+    simulate  run N headless episodes and stream one JSON record per line
+    bench     run the planner x board-size benchmark matrix
+    analyze   analyze a recorded results file with SnakePerformanceAnalyzer
+    compare   compare several results files with PerformanceComparator
+    watch     play episodes in a live tiled window (records still streamed)
+    export    replay recorded episodes headlessly into PNG frames or raw video
+    replay    seek into a saved episode replay (simulate --replay-dir) or view it
+    sweep     search settings with successive halving and compare the best ones
+
+Records are JSON Lines, and "-" reads from stdin, so stages can be piped:
+    python3 snake_cli.py simulate -n 50 --seed 1 | python3 snake_cli.py analyze -
+With --store, episodes are also kept in a SQLite results store that analyze
+and compare can slice with --where "planner=astar, rows=50, score>20".
+Heavy modules are imported inside the subcommands to keep start-up fast.
+"""
+
+import argparse
+import json
+import os
+import sys
+
+# board_generation.LAYOUTS, spelled out so building the parser does not import NumPy
+LAYOUTS = ('uniform', 'blobs', 'maze', 'rooms', 'file')
+
+
+def write_records(records, output):
+    """Stream records as JSON Lines, flushing after each one"""
+    stream = sys.stdout if output in (None, '-') else open(output, 'w')
+    try:
+        for record in records:
+            stream.write(json.dumps(record) + '\n')
+            stream.flush()
+    finally:
+        if stream is not sys.stdout:
+            stream.close()
+
+
+def read_records(path):
+    """Yield records from a JSON Lines file ("-" for stdin)"""
+    stream = sys.stdin if path == '-' else open(path)
+    try:
+        for line in stream:
+            line = line.strip()
+            if line:
+                yield json.loads(line)
+    finally:
+        if stream is not sys.stdin:
+            stream.close()
+
+
+def parse_size(text):
+    """'ROWSxCOLS' -> (rows, cols)"""
+    try:
+        rows, cols = (int(part) for part in text.lower().split('x'))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"board size must look like 25x25, got '{text}'")
+    return rows, cols
+
+
+def parse_options(pairs):
+    """['key=value', ...] -> dict, with JSON-decoded values where possible"""
+    options = {}
+    for pair in pairs or []:
+        key, _, value = pair.partition('=')
+        try:
+            options[key] = json.loads(value)
+        except ValueError:
+            options[key] = value
+    return options
+
+
+def _check_planners(names):
+    """Fail fast on unknown planner names instead of mid-stream"""
+    from snake_engine import get_planner
+
+    for name in names:
+        try:
+            get_planner(name)
+        except ValueError as exc:
+            sys.exit(f'error: {exc}')
+
+
+def _check_sparse(args, planners, layouts=('legacy',), options=None):
+    """Fail fast on settings a sparse board cannot run instead of mid-stream"""
+    if not args.sparse:
+        return
+    from snake_engine import check_sparse_settings
+
+    for planner in planners:
+        for layout in layouts:
+            try:
+                check_sparse_settings(planner, options, args.unreachable_food, layout)
+            except ValueError as exc:
+                sys.exit(f'error: --sparse: {exc}')
+
+
+def store_records(records, path, run=None, batch_size=500):
+    """Pass records through while inserting them into the results store"""
+    from results_store import ResultsStore
+
+    with ResultsStore(path) as store:
+        batch = []
+        for record in records:
+            batch.append(record)
+            if len(batch) >= batch_size:
+                store.add_records(batch, run)
+                batch = []
+            yield record
+        store.add_records(batch, run)
+
+
+def load_values(args):
+    """
+    Metric values per dataset from result files and/or the results store
+
+    Datasets are named after the file, or after args.group_by when given.
+    """
+    datasets = {}
+    for path in args.results:
+        for record in read_records(path):
+            if args.group_by:
+                name = f"{args.group_by}={record.get(args.group_by)}"
+            else:
+                name = 'stdin' if path == '-' else os.path.splitext(os.path.basename(path))[0]
+            datasets.setdefault(name, []).append(record[args.metric])
+
+    if args.store:
+        from results_store import ResultsStore
+
+        with ResultsStore(args.store) as store:
+            if args.group_by:
+                for key, values in store.grouped(args.group_by, args.metric, args.where).items():
+                    datasets.setdefault(f"{args.group_by}={key}", []).extend(values)
+            else:
+                values = store.column(args.metric, args.where)
+                if values:
+                    datasets.setdefault(args.where or 'store', []).extend(values)
+    return datasets
+
+
+def _render_report(output_dir, **data):
+    """Render the headless report and summarize what was redrawn"""
+    from report_pipeline import render_report
+
+    result = render_report(output_dir=output_dir, **data)
+    print(f"Rendered {len(result['rendered'])} panels, "
+          f"skipped {len(result['skipped'])} unchanged panels -> {output_dir}")
+
+
+def _check_multi(args):
+    """Fail fast on simulate options the multi-snake runner does not take"""
+    from snake_engine import LIVELOCK_REPEATS
+
+    ignored = [option for option, used in (
+        ('--planner', args.planner is not None),
+        ('--planner-option', args.planner_option),
+        ('--unreachable-food', args.unreachable_food),
+        ('--livelock-repeats', args.livelock_repeats != LIVELOCK_REPEATS),
+        ('--sparse', args.sparse),
+        ('--replay-dir', args.replay_dir),
+    ) if used]
+    if ignored:
+        sys.exit(f"error: {', '.join(ignored)} cannot be combined with --snakes/--foods > 1 "
+                 f"(multi-agent mode plays batched BFS on a dense board)")
+
+
+def _budgets(args):
+    """Episode budget settings for make_episode"""
+    return {'max_steps': args.max_steps, 'max_seconds': args.max_seconds,
+            'livelock_repeats': args.livelock_repeats, 'sparse': args.sparse}
+
+
+def cmd_simulate(args):
+    from snake_engine import run_episodes
+
+    if args.snakes < 1 or args.foods < 1:
+        sys.exit('error: --snakes and --foods must be at least 1')
+    if args.snakes > 1 or args.foods > 1:
+        # Shared-board mode: batched BFS waves instead of the single-snake planners
+        from multi_agent import run_multi_episode
+
+        _check_multi(args)
+        records = run_episodes(args.episodes, seed=args.seed, workers=args.workers,
+                               runner=run_multi_episode, snakes=args.snakes,
+                               foods=args.foods, rows=args.rows, cols=args.cols,
+                               obstacle_probability=args.obstacles,
+                               board_seed=args.board_seed, layout=args.layout,
+                               layout_options=parse_options(args.layout_option),
+                               max_steps=args.max_steps, max_seconds=args.max_seconds)
+    else:
+        args.planner = args.planner or 'astar'
+        _check_planners([args.planner])
+        _check_sparse(args, [args.planner], [args.layout], parse_options(args.planner_option))
+        replay_settings = {}
+        if args.replay_dir:
+            from replay import run_recorded_episode
+            replay_settings = {'runner': run_recorded_episode, 'replay_dir': args.replay_dir,
+                               'keyframe_interval': args.keyframe_interval}
+        records = run_episodes(args.episodes, seed=args.seed, workers=args.workers,
+                               **replay_settings,
+                               planner=args.planner, rows=args.rows, cols=args.cols,
+                               obstacle_probability=args.obstacles,
+                               board_seed=args.board_seed,
+                               planner_options=parse_options(args.planner_option),
+                               unreachable_food=args.unreachable_food,
+                               layout=args.layout,
+                               layout_options=parse_options(args.layout_option),
+                               **_budgets(args))
+    if args.store:
+        records = store_records(records, args.store, args.run)
+    write_records(records, args.output)
+
+
+def cmd_bench(args):
+    from snake_engine import run_episodes
+
+    planners = args.planners.split(',')
+    _check_planners(planners)
+    layouts = args.layouts.split(',')
+    _check_sparse(args, planners, layouts)
+    layout_options = parse_options(args.layout_option)
+
+    def matrix():
+        for planner in planners:
+            for layout in layouts:
+                for rows, cols in args.sizes:
+                    yield from run_episodes(args.episodes, seed=args.seed, workers=args.workers,
+                                            planner=planner, rows=rows, cols=cols,
+                                            obstacle_probability=args.obstacles,
+                                            unreachable_food=args.unreachable_food,
+                                            layout=layout, layout_options=layout_options,
+                                            **_budgets(args))
+
+    records = matrix()
+    if args.store:
+        records = store_records(records, args.store, args.run)
+    write_records(records, args.output)
+
+
+def cmd_watch(args):
+    if args.sparse:
+        sys.exit('error: watch draws every cell and cannot show a --sparse board')
+    from batch_viewer import watch_episodes
+
+    _check_planners([args.planner])
+    stream = sys.stdout if args.output in (None, '-') else open(args.output, 'w')
+
+    def on_record(record):
+        stream.write(json.dumps(record) + '\n')
+        stream.flush()
+
+    try:
+        watch_episodes(args.episodes, seed=args.seed, tiles=args.tiles, sim_rate=args.sim_rate,
+                       render_rate=args.render_rate, on_record=on_record, render=args.render,
+                       planner=args.planner, rows=args.rows, cols=args.cols,
+                       obstacle_probability=args.obstacles, board_seed=args.board_seed,
+                       unreachable_food=args.unreachable_food, layout=args.layout,
+                       layout_options=parse_options(args.layout_option), **_budgets(args))
+    finally:
+        if stream is not sys.stdout:
+            stream.close()
+
+
+def cmd_analyze(args):
+    from advanced_performance_analysis import SnakePerformanceAnalyzer
+
+    if args.store:
+        from results_store import ResultsStore
+
+        with ResultsStore(args.store) as store:
+            scores = store.column(args.metric, args.where)
+            times = store.column('duration', args.where)
+    else:
+        records = list(read_records(args.results or '-'))
+        scores = [record[args.metric] for record in records]
+        times = [record['duration'] for record in records]
+    if not scores:
+        sys.exit('analyze: no records to analyze')
+
+    analyzer = SnakePerformanceAnalyzer(scores, times)
+    analyzer.create_comprehensive_report()
+    if args.report:
+        _render_report(args.report, scores=scores, times=times)
+
+
+def cmd_compare(args):
+    from performance_comparison import PerformanceComparator
+
+    datasets = load_values(args)
+    comparator = PerformanceComparator()
+    for name, values in datasets.items():
+        comparator.add_dataset(name, values, f"{len(values)} episodes")
+    comparator.create_comparison_report()
+    if args.export:
+        comparator.export_comparison_data(args.export)
+    if args.report:
+        _render_report(args.report, datasets={name: (values, f"{len(values)} episodes")
+                                              for name, values in datasets.items()})
+
+
+def cmd_export(args):
+    from frame_export import export_records
+
+    overrides = {}
+    if args.planner_option:
+        overrides['planner_options'] = parse_options(args.planner_option)
+    summaries = export_records(read_records(args.results or '-'), args.output_dir,
+                               fmt=args.format, size=args.size, every=args.every,
+                               chunk_frames=args.chunk_frames, max_workers=args.workers,
+                               **overrides)
+    write_records(summaries, None)
+
+
+def cmd_replay(args):
+    from replay import EpisodeReplay, view_replay
+
+    replay = EpisodeReplay.load(args.replay)
+    if args.view:
+        view_replay(replay, tick=args.tick or 0)
+        return
+    sim = replay.seek(replay.ticks if args.tick is None else args.tick)
+    state = {'tick': sim.steps, 'ticks': replay.ticks, 'score': sim.score,
+             'head': sim.board.coords(sim.head), 'food': sim.board.coords(sim.food),
+             'length': len(sim.body), 'alive': sim.alive, 'death_cause': sim.death_cause}
+    write_records([state], None)
+
+
+def parse_sweep_param(text):
+    """
+    'key=v1,v2,...' (choices) or 'key=low:high' (random range) -> (key, values)
+
+    Values are JSON-decoded where possible; 'size' values look like 25x25.
+    """
+    key, _, values = text.partition('=')
+    if not values:
+        raise argparse.ArgumentTypeError(f"sweep parameter must look like key=1,2,3, got '{text}'")
+    if key == 'size':
+        return key, [parse_size(value) for value in values.split(',')]
+    parts = values.split(':') if ':' in values else values.split(',')
+    decoded = [parse_options([f"value={part}"])['value'] for part in parts]
+    if ':' in values:
+        if len(decoded) != 2:
+            raise argparse.ArgumentTypeError(f"range must look like key=low:high, got '{text}'")
+        return key, tuple(decoded)
+    return key, decoded
+
+
+def cmd_sweep(args):
+    from hyperparameter_sweep import (grid_configs, random_configs, successive_halving,
+                                      to_comparator)
+
+    space = dict(args.param or [])
+    if args.random:
+        configs = random_configs(space, args.random, seed=args.seed)
+    else:
+        ranges = [key for key, values in space.items() if isinstance(values, tuple)]
+        if ranges:
+            sys.exit(f"sweep: ranges ({', '.join(ranges)}) need --random N")
+        configs = grid_configs(space)
+    _check_planners({config.get('planner', 'astar') for config in configs})
+    if args.sparse:
+        from hyperparameter_sweep import config_settings
+        from snake_engine import check_sparse_settings
+
+        for config in configs:
+            settings = config_settings(config, unreachable_food=args.unreachable_food)
+            try:
+                check_sparse_settings(settings.get('planner', 'astar'),
+                                      settings['planner_options'],
+                                      settings.get('unreachable_food'), settings.get('layout'))
+            except ValueError as exc:
+                sys.exit(f'error: --sparse: {exc}')
+
+    stream = open(args.output, 'w') if args.output else None
+
+    def on_record(record):
+        stream.write(json.dumps(record) + '\n')
+        stream.flush()
+
+    try:
+        results = successive_halving(configs, min_episodes=args.min_episodes, eta=args.eta,
+                                     max_episodes=args.max_episodes, metric=args.metric,
+                                     seed=args.seed, workers=args.workers,
+                                     on_record=on_record if stream else None,
+                                     unreachable_food=args.unreachable_food, **_budgets(args))
+    finally:
+        if stream is not None:
+            stream.close()
+
+    print(f"🔍 {len(results)} configurations, "
+          f"{sum(result['episodes'] for result in results)} episodes")
+    for rank, result in enumerate(results[:args.top], 1):
+        print(f"  {rank}. {result['name']}: mean {args.metric} {result['mean']:.2f} "
+              f"over {result['episodes']} episodes")
+    comparator = to_comparator(results, top=args.top)
+    comparator.create_comparison_report()
+    if args.export:
+        comparator.export_comparison_data(args.export)
+    if args.report:
+        _render_report(args.report, datasets={result['name']: (result['values'],
+                                                                f"{result['episodes']} episodes")
+                                              for result in results[:args.top]})
+
+
+def _report_dir_arg(parser):
+    parser.add_argument('--report', metavar='DIR',
+                        help='also render the figures headlessly into DIR')
+
+
+def _store_args(parser, reading):
+    parser.add_argument('--store', metavar='DB', help='SQLite results store')
+    if reading:
+        parser.add_argument('--where', metavar='FILTER',
+                            help='store filter, e.g. "planner=astar, rows=50, score>20"')
+    else:
+        parser.add_argument('--run', help='label stored with every episode')
+
+
+def _unreachable_food_arg(parser):
+    parser.add_argument('--unreachable-food', choices=('respawn', 'end'),
+                        help='respawn food sealed off from the head, or end the episode '
+                             'early (default: search and fail)')
+
+
+def _budget_args(parser):
+    from snake_engine import LIVELOCK_REPEATS
+
+    parser.add_argument('--max-steps', type=int,
+                        help="end an episode after this many moves ('max_steps')")
+    parser.add_argument('--max-seconds', type=float,
+                        help="end an episode after this much wall-clock time ('timeout')")
+    parser.add_argument('--livelock-repeats', type=int, default=LIVELOCK_REPEATS,
+                        help="end an episode when one game state recurs this often between "
+                             "meals ('livelock'; 0 disables)")
+    parser.add_argument('--sparse', action='store_true',
+                        help='tiled sparse board with scattered obstacles (huge boards; '
+                             'astar, bfs and anytime planners, also under cached and '
+                             'rollout; legacy layout, no --unreachable-food)')
+
+
+def _layout_args(parser, matrix=False):
+    choices = ', '.join(('legacy',) + LAYOUTS)
+    if matrix:
+        parser.add_argument('--layouts', default='legacy',
+                            help=f'comma-separated obstacle layouts ({choices})')
+    else:
+        parser.add_argument('--layout', choices=('legacy',) + LAYOUTS, default='legacy',
+                            help='obstacle layout (legacy: per-cell roll as in the game)')
+    parser.add_argument('--layout-option', action='append', metavar='KEY=VALUE',
+                        help='layout setting such as scale=12 or path=map.txt (repeatable)')
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description='Snake A* experiment runner')
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    sim = sub.add_parser('simulate', help='run headless episodes')
+    sim.add_argument('-n', '--episodes', type=int, default=20)
+    sim.add_argument('--planner', help='single-snake planner (default: astar)')
+    sim.add_argument('--planner-option', action='append', metavar='KEY=VALUE',
+                     help='planner keyword argument (repeatable)')
+    sim.add_argument('--rows', type=int, default=25)
+    sim.add_argument('--cols', type=int, default=25)
+    sim.add_argument('--obstacles', type=float, default=3,
+                     help='obstacle probability in percent')
+    sim.add_argument('--seed', type=int, default=0, help='seed of the first episode')
+    sim.add_argument('--board-seed', type=int,
+                     help='fixed obstacle layout for every episode')
+    sim.add_argument('--workers', type=int, default=1)
+    _unreachable_food_arg(sim)
+    _layout_args(sim)
+    _budget_args(sim)
+    sim.add_argument('--snakes', type=int, default=1,
+                     help='snakes sharing one board (multi-agent mode when > 1; no '
+                          'planner, unreachable-food, livelock, sparse or replay options)')
+    sim.add_argument('--foods', type=int, default=1,
+                     help='food items on the board (multi-agent mode when > 1)')
+    sim.add_argument('-o', '--output', help='output file (default: stdout)')
+    sim.add_argument('--replay-dir', metavar='DIR',
+                     help='also save a seekable replay of every episode into DIR')
+    sim.add_argument('--keyframe-interval', type=int, default=250,
+                     help='ticks between replay keyframes (longest re-simulation per seek)')
+    _store_args(sim, reading=False)
+    sim.set_defaults(func=cmd_simulate)
+
+    bench = sub.add_parser('bench', help='run the planner benchmark matrix')
+    bench.add_argument('--planners', default='astar,bfs',
+                       help='comma-separated planner names')
+    bench.add_argument('--sizes', type=parse_size, nargs='+', default=[(25, 25), (50, 50)],
+                       metavar='ROWSxCOLS')
+    bench.add_argument('-n', '--episodes', type=int, default=10)
+    bench.add_argument('--obstacles', type=float, default=3)
+    bench.add_argument('--seed', type=int, default=0)
+    bench.add_argument('--workers', type=int, default=1)
+    _unreachable_food_arg(bench)
+    _layout_args(bench, matrix=True)
+    _budget_args(bench)
+    bench.add_argument('-o', '--output', help='output file (default: stdout)')
+    _store_args(bench, reading=False)
+    bench.set_defaults(func=cmd_bench)
+
+    watch = sub.add_parser('watch', help='watch episodes live in a tiled window')
+    watch.add_argument('-n', '--episodes', type=int, default=8)
+    watch.add_argument('--tiles', type=int, default=4, help='episodes shown at once')
+    watch.add_argument('--sim-rate', type=float,
+                       help='simulation ticks per second per tile (default: unbounded)')
+    watch.add_argument('--render-rate', type=float, default=30, help='frames per second')
+    watch.add_argument('--render', choices=('auto', 'rects', 'pixels'), default='auto',
+                       help='draw one rect per cell, or the board as one scaled pixel '
+                            'array (auto: pixels once cells are smaller than 4 px)')
+    watch.add_argument('--planner', default='astar')
+    watch.add_argument('--rows', type=int, default=25)
+    watch.add_argument('--cols', type=int, default=25)
+    watch.add_argument('--obstacles', type=float, default=3,
+                       help='obstacle probability in percent')
+    watch.add_argument('--seed', type=int, default=0, help='seed of the first episode')
+    watch.add_argument('--board-seed', type=int,
+                       help='fixed obstacle layout for every episode')
+    _unreachable_food_arg(watch)
+    _layout_args(watch)
+    _budget_args(watch)
+    watch.add_argument('-o', '--output', help='output file (default: stdout)')
+    watch.set_defaults(func=cmd_watch)
+
+    analyze = sub.add_parser('analyze', help='analyze a results file')
+    analyze.add_argument('results', nargs='?',
+                         help='JSON Lines results file, or - for stdin (default)')
+    analyze.add_argument('--metric', default='score', help='record field to analyze')
+    _report_dir_arg(analyze)
+    _store_args(analyze, reading=True)
+    analyze.set_defaults(func=cmd_analyze)
+
+    compare = sub.add_parser('compare', help='compare results files')
+    compare.add_argument('results', nargs='*', help='JSON Lines results files, or - for stdin')
+    compare.add_argument('--group-by', metavar='FIELD',
+                         help='split records into datasets by this field instead of by file')
+    compare.add_argument('--metric', default='score', help='record field to compare')
+    compare.add_argument('--export', metavar='CSV', help='export the summary table')
+    _report_dir_arg(compare)
+    _store_args(compare, reading=True)
+    compare.set_defaults(func=cmd_compare)
+
+    export = sub.add_parser('export', help='render recorded episodes to frames or raw video')
+    export.add_argument('results', nargs='?',
+                        help='JSON Lines results file, or - for stdin (default)')
+    export.add_argument('-o', '--output-dir', default='frames')
+    export.add_argument('--format', choices=('png', 'raw'), default='png',
+                        help='one PNG per frame, or one raw RGB24 stream per episode')
+    export.add_argument('--size', type=int, default=400,
+                        help='frame size in pixels along the longer board side')
+    export.add_argument('--every', type=int, default=1, help='render every n-th tick')
+    export.add_argument('--chunk-frames', type=int, default=1000,
+                        help='frames per worker job (long episodes are split)')
+    export.add_argument('--workers', type=int, help='worker processes (default: one per CPU)')
+    export.add_argument('--planner-option', action='append', metavar='KEY=VALUE',
+                        help='planner setting the episodes were recorded with (repeatable)')
+    export.set_defaults(func=cmd_export)
+
+    replay = sub.add_parser('replay', help='seek into a saved episode replay')
+    replay.add_argument('replay', help='.npz replay from simulate --replay-dir')
+    replay.add_argument('--tick', type=int, help='tick to seek to (default: the last one)')
+    replay.add_argument('--view', action='store_true',
+                        help='browse the replay in a window (SPACE, arrows, seek bar)')
+    replay.set_defaults(func=cmd_replay)
+
+    sweep = sub.add_parser('sweep', help='search settings with successive halving')
+    sweep.add_argument('--param', type=parse_sweep_param, action='append', metavar='KEY=VALUES',
+                       help='setting to explore: planner=astar,bfs, size=25x25,50x50, '
+                            'weight=1.0,2.0, or a range weight=1.0:3.0 with --random '
+                            '(repeatable)')
+    sweep.add_argument('--random', type=int, metavar='N',
+                       help='sample N configurations instead of the full grid')
+    sweep.add_argument('--min-episodes', type=int, default=3,
+                       help='episodes per configuration in the first round')
+    sweep.add_argument('--eta', type=int, default=2,
+                       help='keep the best 1/ETA each round, with ETA times the episodes')
+    sweep.add_argument('--max-episodes', type=int, help='cap on episodes per configuration')
+    sweep.add_argument('--metric', default='score', help='record field to maximize')
+    sweep.add_argument('--seed', type=int, default=0,
+                       help='first episode seed (shared by all configurations)')
+    sweep.add_argument('--workers', type=int, help='worker processes (default: one per CPU)')
+    sweep.add_argument('--top', type=int, default=5, help='configurations compared at the end')
+    _unreachable_food_arg(sweep)
+    _budget_args(sweep)
+    sweep.add_argument('-o', '--output', help='also write every episode record here')
+    sweep.add_argument('--export', metavar='CSV', help='export the comparison table')
+    _report_dir_arg(sweep)
+    sweep.set_defaults(func=cmd_sweep)
+
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
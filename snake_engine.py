@@ -0,0 +1,751 @@
+"""
+Headless Snake Simulation Engine
+Runs the autonomous snake game without pygame so episodes can be simulated in
+batch. The rules mirror snake_game_with_Astar.py: the snake starts in the
+centre of the board, follows a planned path to the food, and the episode ends
+when no path exists or the snake runs into a wall, an obstacle or itself.
+"""
+
+import copy
+import heapq
+import importlib
+import math
+import random
+import time
+import weakref
+from collections import deque
+
+# Default board settings (same as the GUI game)
+GAME_CONFIG = {
+    'cols': 25,
+    'rows': 25,
+    'obstacle_probability': 3
+}
+
+# Occurrences of one (head, body, food) state that end an episode as 'livelock'
+LIVELOCK_REPEATS = 3
+
+# Direction codes used by getpath: (dx, dy) per code
+DIRECTIONS = {
+    0: (0, 1),   # down
+    1: (1, 0),   # right
+    2: (0, -1),  # up
+    3: (-1, 0),  # left
+}
+
+# Planner name -> "module:Class"; modules are imported on first use
+PLANNERS = {
+    'astar': 'snake_engine:AStarPlanner',
+    'bfs': 'snake_engine:BFSPlanner',
+    'hamiltonian': 'hamiltonian_planner:HamiltonianPlanner',
+    'astar-jit': 'planner_kernels:AStarKernelPlanner',
+    'bfs-jit': 'planner_kernels:BFSKernelPlanner',
+    'cached': 'path_cache:CachedPlanner',
+    'anytime': 'anytime_planner:AnytimePlanner',
+    'hpa': 'hpa_planner:HPAPlanner',
+    'rollout': 'rollout_planner:RolloutPlanner',
+}
+
+# Planners that only index board.obstacles, board.occupancy and board.neighbors,
+# so they run on a SparseBoard; wrappers qualify when the planner they run does
+SPARSE_PLANNERS = ('astar', 'bfs', 'anytime')
+WRAPPER_PLANNERS = {'cached': ('planner', 'astar'), 'rollout': ('base', 'astar')}
+
+# Forks of boards up to this many cells copy the occupancy on the first write
+# (a memcpy of a few KB beats slower reads in every search); larger boards
+# give each fork an OccupancyOverlay of the cells it changed
+FORK_COPY_CELLS = 1 << 16
+
+
+class OccupancyOverlay:
+    """Occupancy of a forked board: the cells it changed over the parent's bitmap"""
+
+    def __init__(self, base):
+        """
+        Args:
+            base (bytes-like): Parent occupancy; the parent board keeps the
+                pre-write value of any cell it changes here (see Board.fork)
+        """
+        self.base = base
+        self.changes = {}
+
+    def __len__(self):
+        return len(self.base)
+
+    def __getitem__(self, cell):
+        value = self.changes.get(cell)
+        return self.base[cell] if value is None else value
+
+    def __setitem__(self, cell, value):
+        self.changes[cell] = value
+
+    def __iter__(self):
+        return iter(bytes(self))
+
+    def __bytes__(self):
+        dense = bytearray(bytes(self.base))
+        for cell, value in self.changes.items():
+            dense[cell] = value
+        return bytes(dense)
+
+
+class Board:
+    """Obstacle map plus snake occupancy for a rows x cols grid"""
+
+    # True while the occupancy bytearray is shared with a fork (copied on write)
+    shared_occupancy = False
+    # Overlays of live forks reading this board's occupancy (large boards)
+    overlays = None
+
+    def __init__(self, rows, cols, obstacles, topology=None):
+        """
+        Args:
+            rows (int): Number of rows (x coordinate range)
+            cols (int): Number of columns (y coordinate range)
+            obstacles (bytes-like): One byte per cell, non-zero for an obstacle,
+                indexed as x * cols + y
+            topology (Topology, optional): Cached precomputations for this
+                obstacle layout (see board_topology.py)
+        """
+        self.rows = rows
+        self.cols = cols
+        self.size = rows * cols
+        self.obstacles = bytearray(obstacles)
+        self.occupancy = bytearray(self.size)
+        self.topology = topology
+        self.watchers = []  # Objects notified of occupy/release (e.g. ReachabilityIndex)
+        if topology is not None:
+            self.neighbors = topology.neighbor_lists()
+        else:
+            self.neighbors = self._build_neighbors()
+
+    def _build_neighbors(self):
+        """(direction, cell) pairs for every obstacle-free neighbour of each cell"""
+        rows, cols, obstacles = self.rows, self.cols, self.obstacles
+        neighbors = []
+        for cell in range(self.size):
+            x, y = divmod(cell, cols)
+            adjacent = []
+            if y < cols - 1 and not obstacles[cell + 1]:
+                adjacent.append((0, cell + 1))
+            if x < rows - 1 and not obstacles[cell + cols]:
+                adjacent.append((1, cell + cols))
+            if y > 0 and not obstacles[cell - 1]:
+                adjacent.append((2, cell - 1))
+            if x > 0 and not obstacles[cell - cols]:
+                adjacent.append((3, cell - cols))
+            neighbors.append(tuple(adjacent))
+        return neighbors
+
+    def cell(self, x, y):
+        """Linear index of grid position (x, y)"""
+        return x * self.cols + y
+
+    def coords(self, cell):
+        """Grid position (x, y) of a linear index"""
+        return divmod(cell, self.cols)
+
+    def move(self, cell, direction):
+        """Cell reached by moving one step, or -1 when leaving the board"""
+        x, y = divmod(cell, self.cols)
+        dx, dy = DIRECTIONS[direction]
+        x, y = x + dx, y + dy
+        if x < 0 or x >= self.rows or y < 0 or y >= self.cols:
+            return -1
+        return x * self.cols + y
+
+    def passable(self, cell):
+        """True if the cell holds neither an obstacle nor the snake"""
+        return not (self.obstacles[cell] or self.occupancy[cell])
+
+    def occupy(self, cell):
+        if self.shared_occupancy:
+            self._own_occupancy()
+        if self.overlays:
+            self._preserve(cell)
+        self.occupancy[cell] = 1
+        for watcher in self.watchers:
+            watcher.occupy(cell)
+
+    def release(self, cell):
+        if self.shared_occupancy:
+            self._own_occupancy()
+        if self.overlays:
+            self._preserve(cell)
+        self.occupancy[cell] = 0
+        for watcher in self.watchers:
+            watcher.release(cell)
+
+    def _own_occupancy(self):
+        """Take a private copy of the occupancy before the first write after a fork"""
+        self.occupancy = bytearray(self.occupancy)
+        self.shared_occupancy = False
+
+    def _preserve(self, cell):
+        """Keep a cell's current value in every fork overlay before changing it"""
+        value = self.occupancy[cell]
+        for overlay in self.overlays:
+            if cell not in overlay.changes:
+                overlay.changes[cell] = value
+
+    def dense_occupancy(self):
+        """
+        Occupancy as a bytearray, for readers that need a buffer (NumPy views)
+
+        A fork holding an OccupancyOverlay takes its own copy here.
+        """
+        if not isinstance(self.occupancy, bytearray):
+            self.occupancy = bytearray(bytes(self.occupancy))
+        return self.occupancy
+
+    def fork(self):
+        """
+        Copy of the board for lookahead search
+
+        The obstacle map, neighbour table and topology are shared (they never
+        change after construction). On boards up to FORK_COPY_CELLS the
+        occupancy bitmap is shared too until either board writes to it; that
+        board then takes its own copy. Larger forks read the parent's bitmap
+        through an OccupancyOverlay holding only the cells changed since the
+        fork, on either side, so forking and stepping cost O(changes) rather
+        than O(cells). Watchers are not carried over.
+
+        Returns:
+            Board: Independent board with the same occupancy
+        """
+        board = copy.copy(self)
+        board.watchers = []
+        board.overlays = None
+        if self.size > FORK_COPY_CELLS:
+            board.occupancy = overlay = OccupancyOverlay(self.occupancy)
+            board.shared_occupancy = False
+            if self.overlays is None:
+                self.overlays = weakref.WeakSet()
+            self.overlays.add(overlay)
+        else:
+            self.shared_occupancy = board.shared_occupancy = True
+        return board
+
+    def layout_id(self):
+        """Hash identifying the board shape and obstacle layout (within this process)"""
+        return hash((self.rows, self.cols, bytes(self.obstacles)))
+
+    def occupied_cells(self):
+        """Cells currently holding the snake"""
+        cells, occupancy = [], self.occupancy
+        if not isinstance(occupancy, bytearray):
+            occupancy = bytes(occupancy)
+        cell = occupancy.find(1)
+        while cell >= 0:
+            cells.append(cell)
+            cell = occupancy.find(1, cell + 1)
+        return cells
+
+
+def random_obstacles(rows, cols, obstacle_probability, rng):
+    """Per-cell obstacle roll, same rule as Spot.__init__ in the GUI game"""
+    return bytearray(rng.randint(1, 101) < obstacle_probability
+                     for _ in range(rows * cols))
+
+
+def make_board(rows=None, cols=None, obstacle_probability=None, seed=None,
+               topology_cache=None, layout=None, layout_options=None, sparse=False):
+    """
+    Create a board with random obstacles and a clear starting cell
+
+    Args:
+        topology_cache (str or bool, optional): Attach the cached topology of the
+            layout, saved under this directory (True for the default one)
+        layout (str, optional): board_generation layout ('uniform', 'blobs',
+            'maze', 'rooms', 'file'); None or 'legacy' rolls every cell like the
+            GUI game
+        layout_options (dict, optional): Extra generate_obstacles settings
+        sparse (bool): Build a tiled SparseBoard with uniformly scattered
+            obstacles (for huge boards; layout and topology_cache do not apply)
+    """
+    rows = GAME_CONFIG['rows'] if rows is None else rows
+    cols = GAME_CONFIG['cols'] if cols is None else cols
+    if obstacle_probability is None:
+        obstacle_probability = GAME_CONFIG['obstacle_probability']
+    if sparse:
+        from sparse_board import SparseBoard, random_sparse_obstacles
+        cells = random_sparse_obstacles(rows, cols, obstacle_probability, seed)
+        return SparseBoard(rows, cols, cells.tolist())
+    if layout in (None, 'legacy'):
+        obstacles = random_obstacles(rows, cols, obstacle_probability, random.Random(seed))
+        obstacles[(rows // 2) * cols + cols // 2] = 0
+    else:
+        from board_generation import generate_obstacles, to_bitmap
+        grid = generate_obstacles(rows, cols, layout, obstacle_probability, seed,
+                                  **(layout_options or {}))
+        rows, cols = grid.shape
+        obstacles = to_bitmap(grid)
+    if not topology_cache:
+        return Board(rows, cols, obstacles)
+
+    from board_topology import TOPOLOGY_CACHE_DIR, load_topology
+    cache_dir = TOPOLOGY_CACHE_DIR if topology_cache is True else topology_cache
+    return Board(rows, cols, obstacles, load_topology(rows, cols, obstacles, cache_dir))
+
+
+class Planner:
+    """
+    Base class for path planners
+
+    plan() returns a list of direction codes in reverse order, so the next
+    move is popped from the end (the convention used by getpath).
+    """
+
+    # True when plan() depends only on the board, head and food (see path_cache)
+    cacheable = True
+
+    def __init__(self, board):
+        self.board = board
+        self.nodes_expanded = 0
+        self.searches = 0
+
+    def plan(self, sim):
+        """Directions from the snake head to the food, or [] if unreachable"""
+        raise NotImplementedError
+
+    def stats(self):
+        """Extra planner counters for the episode record"""
+        return {}
+
+    def fork(self, board):
+        """
+        Planner for a forked board (see Simulation.fork)
+
+        The default is a shallow copy rebound to the new board, which suits
+        planners without per-episode mutable state; the others override it.
+        Search counters carry on from this planner's.
+        """
+        planner = copy.copy(self)
+        planner.board = board
+        return planner
+
+    @staticmethod
+    def _reconstruct(came_from, start, goal):
+        """Walk came_from back from goal to start, collecting directions"""
+        path = []
+        cell = goal
+        while cell != start:
+            cell, direction = came_from[cell]
+            path.append(direction)
+        return path
+
+
+class AStarPlanner(Planner):
+    """A* search with the Euclidean heuristic used by getpath"""
+
+    def __init__(self, board, weight=1.0):
+        super().__init__(board)
+        self.weight = float(weight)
+
+    def plan(self, sim):
+        return self.search(sim.head, sim.food)
+
+    def search(self, start, goal):
+        """A* from start to goal over currently passable cells"""
+        self.searches += 1
+        board = self.board
+        cols, neighbors, occupancy = board.cols, board.neighbors, board.occupancy
+        gx, gy = divmod(goal, cols)
+        weight = self.weight
+
+        g_score = {start: 0}
+        came_from = {}
+        closed = set()
+        open_heap = [(0.0, 0, start)]
+        expanded = 0
+        found = False
+        while open_heap:
+            _, g, cell = heapq.heappop(open_heap)
+            if cell in closed:
+                continue
+            closed.add(cell)
+            expanded += 1
+            if cell == goal:
+                found = True
+                break
+            ng = g + 1
+            for direction, nb in neighbors[cell]:
+                if occupancy[nb] or nb in closed:
+                    continue
+                if ng < g_score.get(nb, ng + 1):
+                    g_score[nb] = ng
+                    came_from[nb] = (cell, direction)
+                    x, y = divmod(nb, cols)
+                    h = math.sqrt((x - gx) ** 2 + (y - gy) ** 2)
+                    heapq.heappush(open_heap, (ng + weight * h, ng, nb))
+
+        self.nodes_expanded += expanded
+        return self._reconstruct(came_from, start, goal) if found else []
+
+
+class BFSPlanner(Planner):
+    """Breadth-first search (shortest path, no heuristic)"""
+
+    def plan(self, sim):
+        self.searches += 1
+        start, goal = sim.head, sim.food
+        neighbors, occupancy = self.board.neighbors, self.board.occupancy
+        came_from = {start: None}
+        queue = deque([start])
+        expanded = 0
+        found = False
+        while queue:
+            cell = queue.popleft()
+            expanded += 1
+            if cell == goal:
+                found = True
+                break
+            for direction, nb in neighbors[cell]:
+                if occupancy[nb] or nb in came_from:
+                    continue
+                came_from[nb] = (cell, direction)
+                queue.append(nb)
+
+        self.nodes_expanded += expanded
+        return self._reconstruct(came_from, start, goal) if found else []
+
+
+def get_planner(name):
+    """Planner class registered under name"""
+    try:
+        module_name, class_name = PLANNERS[name].split(':')
+    except KeyError:
+        raise ValueError(f"Unknown planner '{name}' (choose from {', '.join(PLANNERS)})")
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+class Simulation:
+    """Game state and rules for one headless episode"""
+
+    def __init__(self, board, planner, seed=None, unreachable_food=None, max_steps=None,
+                 max_seconds=None, livelock_repeats=None):
+        """
+        Args:
+            board (Board): Board to play on; its occupancy must be empty
+            planner (Planner): Planner bound to the same board
+            seed (int, optional): Seed for food placement
+            unreachable_food (str, optional): What to do when the food lies in a
+                region sealed off from the head: 'respawn' it where the snake
+                can reach it, or 'end' the episode ('sealed') without searching.
+                None keeps the original rules (the search fails: 'no_path').
+            max_steps (int, optional): End the episode ('max_steps') after this many moves
+            max_seconds (float, optional): End the episode ('timeout') once this
+                much wall-clock time has passed since it was set up
+            livelock_repeats (int, optional): End the episode ('livelock') when one
+                (head, body, food) state occurs this often between two meals
+        """
+        self.board = board
+        self.planner = planner
+        self.rng = random.Random(seed)
+        self.score = 0
+        self.steps = 0
+        self.alive = True
+        self.death_cause = None
+        self.unreachable_food = unreachable_food
+        self.food_respawns = 0
+        self.max_steps = max_steps
+        self.deadline = time.perf_counter() + max_seconds if max_seconds else None
+
+        # Initialize snake at center
+        self.head = board.cell(board.rows // 2, board.cols // 2)
+        self.body = deque([self.head])
+        board.occupy(self.head)
+
+        self.reachability = None
+        if unreachable_food:
+            from reachability import ReachabilityIndex
+            self.reachability = ReachabilityIndex(board)
+
+        self.livelock = None
+        if livelock_repeats:
+            from livelock import LivelockDetector
+            self.livelock = LivelockDetector(board, livelock_repeats)
+
+        self.food = self.place_food()
+        self.path = []
+        if self.food < 0:
+            self.end('board_full')
+        elif self.food_reachable():
+            self.path = planner.plan(self)
+
+    def place_food(self):
+        """Random free cell (same strategy as the GUI game), or -1 if none"""
+        board = self.board
+        for _ in range(100):
+            cell = self.rng.randrange(board.size)
+            if board.passable(cell):
+                return cell
+
+        # Fallback: find any empty spot
+        for cell in range(board.size):
+            if board.passable(cell):
+                return cell
+        return -1
+
+    def food_reachable(self):
+        """
+        Check the food against the reachability index, respawning it or
+        ending the episode when it is sealed off
+
+        Returns:
+            bool: False once the episode has ended
+        """
+        index = self.reachability
+        if index is None or index.reachable(self.head, self.food):
+            return True
+        if self.unreachable_food == 'respawn':
+            food = index.random_cell(index.head_components(self.head), self.rng)
+            if food >= 0:
+                self.food = food
+                self.food_respawns += 1
+                return True
+        return self.end('sealed')
+
+    def end(self, cause):
+        """Finish the episode, recording why"""
+        self.alive = False
+        self.death_cause = cause
+        return False
+
+    def step(self):
+        """
+        Advance one tick
+
+        Returns:
+            bool: False once the episode has ended
+        """
+        if not self.alive:
+            return False
+        if not self.path:
+            # No path available, try to recalculate
+            if not self.food_reachable():
+                return False
+            self.path = self.planner.plan(self)
+            if not self.path:
+                return self.end('no_path')
+
+        board = self.board
+        next_cell = board.move(self.head, self.path.pop())
+        if next_cell < 0:
+            return self.end('boundary')
+        if not board.passable(next_cell):
+            return self.end('collision')
+
+        # Move snake
+        self.body.append(next_cell)
+        board.occupy(next_cell)
+        self.head = next_cell
+        self.steps += 1
+
+        # Check if food was eaten
+        if next_cell == self.food:
+            self.score += 1
+            self.food = self.place_food()
+            if self.food < 0:
+                return self.end('board_full')
+            if self.livelock is not None:
+                self.livelock.reset()
+            if not self.food_reachable():
+                return False
+            self.path = self.planner.plan(self)
+        else:
+            board.release(self.body.popleft())  # Remove tail if no food eaten
+        return self.within_budget()
+
+    def fork(self, seed=None, planner=None):
+        """
+        Independent copy of the game state for lookahead and rollouts
+
+        Shares everything that cannot change during an episode (obstacles,
+        neighbour table, topology) and copies only the small mutable parts:
+        body, path, random state and the occupancy bitmap, which is copied
+        lazily on the first write (see Board.fork). The planner, reachability
+        index and livelock detector are forked onto the new board.
+
+        Args:
+            seed (int, optional): Reseed food placement in the fork; None keeps
+                the parent's random state, so the fork replays the same food
+            planner (Planner, optional): Planner to fork for the copy instead of
+                this simulation's own (a rollout fork plays its base planner)
+
+        Returns:
+            Simulation: Fork that can be stepped without touching this one
+        """
+        sim = copy.copy(self)
+        sim.board = board = self.board.fork()
+        sim.planner = (planner or self.planner).fork(board)
+        if seed is None:
+            sim.rng = random.Random()
+            sim.rng.setstate(self.rng.getstate())
+        else:
+            sim.rng = random.Random(seed)
+        sim.body = deque(self.body)
+        sim.path = list(self.path)
+        if self.reachability is not None:
+            sim.reachability = self.reachability.fork(board)
+        if self.livelock is not None:
+            sim.livelock = self.livelock.fork(board)
+        return sim
+
+    def within_budget(self):
+        """
+        End the episode if it ran out of steps or time, or is going in circles
+
+        Returns:
+            bool: False once the episode has ended
+        """
+        if self.max_steps is not None and self.steps >= self.max_steps:
+            return self.end('max_steps')
+        if self.deadline is not None and time.perf_counter() > self.deadline:
+            return self.end('timeout')
+        if self.livelock is not None and self.livelock.check(self.head, self.food):
+            return self.end('livelock')
+        return True
+
+
+def check_sparse_settings(planner='astar', planner_options=None, unreachable_food=None,
+                          layout=None):
+    """
+    Raise ValueError for episode settings a SparseBoard cannot run
+
+    Dense-only planners need flat per-cell arrays (and crash on sparse
+    bitmaps), and the reachability index behind unreachable_food allocates
+    per-cell arrays, which would defeat the sparse board on huge grids.
+    """
+    if not isinstance(planner, str):
+        return  # Planner classes (e.g. replays) are the caller's responsibility
+    options = planner_options or {}
+    while planner in WRAPPER_PLANNERS:
+        option, default = WRAPPER_PLANNERS[planner]
+        planner, options = (options.get(option, default),
+                            {key: value for key, value in options.items() if key != option})
+    if planner not in SPARSE_PLANNERS:
+        raise ValueError(f"Planner '{planner}' needs a dense board "
+                         f"(sparse boards support {', '.join(SPARSE_PLANNERS)}, "
+                         f"also inside {' and '.join(WRAPPER_PLANNERS)})")
+    if unreachable_food:
+        raise ValueError("unreachable_food needs a dense board (its reachability index "
+                         "keeps per-cell arrays)")
+    if layout not in (None, 'legacy'):
+        raise ValueError(f"Layout '{layout}' needs a dense board (sparse boards scatter "
+                         f"obstacles uniformly)")
+
+
+def make_episode(seed=0, planner='astar', rows=None, cols=None, obstacle_probability=None,
+                 board_seed=None, planner_options=None, topology_cache=True,
+                 unreachable_food=None, layout=None, layout_options=None, max_steps=None,
+                 max_seconds=None, livelock_repeats=LIVELOCK_REPEATS, sparse=False):
+    """
+    Set up one headless episode without playing it
+
+    Args:
+        seed (int): Seed for food placement (and obstacles unless board_seed is set)
+        planner (str or type): Registered planner name, or a Planner subclass
+        rows, cols, obstacle_probability: Board settings (GAME_CONFIG defaults)
+        board_seed (int, optional): Separate seed for the obstacle layout
+        planner_options (dict, optional): Keyword arguments for the planner
+        topology_cache (str or bool): Reuse the cached topology of a fixed
+            board_seed layout (directory, or True for the default one)
+        unreachable_food (str, optional): 'respawn' or 'end' (see Simulation)
+        layout, layout_options: Obstacle layout (see make_board)
+        max_steps, max_seconds, livelock_repeats: Episode budgets (see
+            Simulation; 0 or None disables livelock detection)
+        sparse (bool): Play on a SparseBoard (see make_board); settings it
+            cannot run raise ValueError (see check_sparse_settings)
+
+    Returns:
+        Simulation: Fresh simulation, with the episode settings in sim.settings
+    """
+    if sparse:
+        check_sparse_settings(planner, planner_options, unreachable_food, layout)
+    rows = GAME_CONFIG['rows'] if rows is None else rows
+    cols = GAME_CONFIG['cols'] if cols is None else cols
+    if obstacle_probability is None:
+        obstacle_probability = GAME_CONFIG['obstacle_probability']
+    fixed_board = board_seed is not None
+    board_seed = seed if board_seed is None else board_seed
+
+    board = make_board(rows, cols, obstacle_probability, board_seed,
+                       topology_cache=topology_cache if fixed_board else None,
+                       layout=layout, layout_options=layout_options, sparse=sparse)
+    planner_class = get_planner(planner) if isinstance(planner, str) else planner
+    planner_obj = planner_class(board, **(planner_options or {}))
+    sim = Simulation(board, planner_obj, seed, unreachable_food, max_steps, max_seconds,
+                     livelock_repeats)
+    sim.settings = {
+        'planner': planner,
+        'layout': layout or 'legacy',
+        'rows': board.rows,
+        'cols': board.cols,
+        'obstacle_probability': obstacle_probability,
+        'seed': seed,
+        'board_seed': board_seed,
+    }
+    return sim
+
+
+def episode_record(sim, duration):
+    """Episode record for a finished simulation from make_episode"""
+    return dict(sim.settings,
+                score=sim.score,
+                steps=sim.steps,
+                duration=duration,
+                nodes_expanded=sim.planner.nodes_expanded,
+                searches=sim.planner.searches,
+                death_cause=sim.death_cause,
+                food_respawns=sim.food_respawns,
+                **sim.planner.stats())
+
+
+def run_episode(seed=0, **settings):
+    """
+    Play one headless episode to completion
+
+    Args:
+        seed (int): Episode seed
+        **settings: Passed through to make_episode
+
+    Returns:
+        dict: Episode record
+    """
+    start_time = time.perf_counter()
+    sim = make_episode(seed, **settings)
+    while sim.step():
+        pass
+    return episode_record(sim, time.perf_counter() - start_time)
+
+
+def _run_episode_job(job):
+    """Pool-friendly wrapper: (runner, kwargs) -> record"""
+    runner, kwargs = job
+    return runner(**kwargs)
+
+
+def run_episodes(episodes, seed=0, workers=1, runner=None, **settings):
+    """
+    Yield episode records for seeds seed, seed + 1, ... in order
+
+    Args:
+        episodes (int): Number of episodes
+        seed (int): First episode seed
+        workers (int): Worker processes (1 runs in-process)
+        runner (callable, optional): Module-level episode function taking
+            seed and **settings (default: run_episode)
+        **settings: Passed through to the runner
+    """
+    runner = runner or run_episode
+    jobs = [dict(settings, seed=seed + i) for i in range(episodes)]
+    if workers == 1:
+        for job in jobs:
+            yield runner(**job)
+        return
+
+    from multiprocessing import Pool
+    with Pool(workers) as pool:
+        for record in pool.imap(_run_episode_job, [(runner, job) for job in jobs]):
+            yield record
@@ -8,8 +8,12 @@ Features: WASD movement, pause functionality, game menu, and score tracking.
 import pygame
 import sys
 import random
+import time
+from collections import deque
 from enum import Enum
 
+from game_scheduler import GameScheduler
+
 # Initialize pygame
 pygame.init()
 
@@ -19,7 +23,9 @@ GAME_CONFIG = {
     'rows': 25,
     'width': 600,
     'height': 600,
-    'fps': 8,  # Slower for manual control
+    'fps': 8,  # Simulation ticks per second (slower for manual control)
+    'render_fps': 60,  # Frames per second, independent of the simulation rate
+    'turn_buffer': 3,  # Turns queued ahead, applied one per simulation tick
     'obstacle_probability': 2  # Fewer obstacles for manual play
 }
 
@@ -51,7 +57,6 @@ cell_height = height // rows
 # Initialize screen
 screen = pygame.display.set_mode([width, height])
 pygame.display.set_caption("Snake Game - Manual Control (WASD)")
-clock = pygame.time.Clock()
 
 # Direction constants
 UP = (0, -1)
@@ -59,6 +64,95 @@ DOWN = (0, 1)
 LEFT = (-1, 0)
 RIGHT = (1, 0)
 
+# WASD -> direction
+KEY_DIRECTIONS = {pygame.K_w: UP, pygame.K_s: DOWN, pygame.K_a: LEFT, pygame.K_d: RIGHT}
+
+class TurnBuffer:
+    """Bounded queue of timestamped turns, consumed one per simulation tick"""
+    
+    def __init__(self, size=3):
+        self.size = max(1, size)
+        self.turns = deque()
+        self.dropped = 0
+    
+    def push(self, direction, heading, timestamp):
+        """
+        Queue a turn unless it repeats or reverses the heading it follows
+        
+        Args:
+            direction (tuple): Requested direction
+            heading (tuple): Current snake direction (used when the queue is empty)
+            timestamp (float): time.perf_counter() when the key was read
+        
+        Returns:
+            bool: True if the turn was queued
+        """
+        # Checked against the last queued turn, so two quick presses
+        # (e.g. W then A while moving right) never add up to a reversal
+        last = self.turns[-1][0] if self.turns else heading
+        if direction == last or direction == (-last[0], -last[1]):
+            return False
+        if len(self.turns) >= self.size:
+            self.dropped += 1
+            return False
+        self.turns.append((direction, timestamp))
+        return True
+    
+    def pop(self):
+        """Next (direction, timestamp) turn, or None"""
+        return self.turns.popleft() if self.turns else None
+    
+    def clear(self):
+        self.turns.clear()
+
+class LatencyHistogram:
+    """Input-to-movement latencies in fixed-width millisecond bins"""
+    
+    def __init__(self, bin_ms=1, max_ms=1000):
+        self.bin_ms = bin_ms
+        self.counts = [0] * (max_ms // bin_ms + 1)  # Last bin collects everything slower
+        self.count = 0
+        self.max_ms = 0.0
+    
+    def add(self, seconds):
+        ms = seconds * 1000
+        self.counts[min(int(ms // self.bin_ms), len(self.counts) - 1)] += 1
+        self.count += 1
+        self.max_ms = max(self.max_ms, ms)
+    
+    def percentile(self, q):
+        """Upper edge of the bin holding the q-th percentile, in ms (0 without samples)"""
+        if not self.count:
+            return 0.0
+        target = q / 100 * self.count
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= target:
+                return min((index + 1) * self.bin_ms, self.max_ms)
+        return self.max_ms
+    
+    def summary(self):
+        return {'count': self.count, 'p50_ms': self.percentile(50),
+                'p99_ms': self.percentile(99), 'max_ms': self.max_ms}
+    
+    def report(self, group_ms=25, width=40):
+        """Text histogram with bins merged into group_ms buckets"""
+        if not self.count:
+            return "No turns recorded"
+        per_group = max(1, group_ms // self.bin_ms)
+        groups = [sum(self.counts[i:i + per_group]) for i in range(0, len(self.counts), per_group)]
+        lines = []
+        for index, count in enumerate(groups):
+            if count:
+                low = index * per_group * self.bin_ms
+                bar = '#' * max(1, round(count / self.count * width))
+                lines.append(f"{low:4d}-{low + per_group * self.bin_ms:4d} ms {count:6d} {bar}")
+        stats = self.summary()
+        lines.append(f"{stats['count']} turns: p50 {stats['p50_ms']:.0f} ms, "
+                     f"p99 {stats['p99_ms']:.0f} ms, max {stats['max_ms']:.0f} ms")
+        return "\n".join(lines)
+
 class Snake:
     """Snake class for managing snake body and movement"""
     
@@ -126,12 +220,25 @@ class Food:
         return (random.randint(0, cols - 1), random.randint(0, rows - 1))
     
     def respawn(self, snake_body):
-        """Respawn food at new location avoiding snake"""
-        while True:
+        """
+        Respawn food at new location avoiding snake
+
+        Returns:
+            bool: False when the snake fills the board and no spot is left
+        """
+        for _ in range(100):
             new_pos = self.generate_position()
             if new_pos not in snake_body:
                 self.position = new_pos
-                break
+                return True
+
+        # Fallback: pick among the remaining free spots
+        occupied = set(snake_body)
+        free = [(x, y) for x in range(cols) for y in range(rows) if (x, y) not in occupied]
+        if not free:
+            return False
+        self.position = random.choice(free)
+        return True
     
     def draw(self, surface):
         """Draw food on the surface"""
@@ -149,6 +256,9 @@ class Game:
         self.high_score = 0
         self.snake = Snake()
         self.food = Food()
+        self.turns = TurnBuffer(GAME_CONFIG['turn_buffer'])
+        self.latency = LatencyHistogram()
+        self.quit_requested = False
         self.font_large = pygame.font.Font(None, 48)
         self.font_medium = pygame.font.Font(None, 36)
         self.font_small = pygame.font.Font(None, 24)
@@ -160,15 +270,35 @@ class Game:
         self.score = 0
         self.snake.reset()
         self.food.respawn(self.snake.body)
+        self.turns.clear()
         self.state = GameState.PLAYING
     
-    def handle_input(self, event):
+    def poll_input(self):
+        """
+        Drain pending events, timestamping them as they are read
+        
+        Called every rendered frame and again right before each simulation
+        tick, so a key pressed just before a tick still turns the snake on it.
+        
+        Returns:
+            bool: False once the player asked to quit
+        """
+        now = time.perf_counter()
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                self.quit_requested = True
+            elif event.type == pygame.KEYDOWN:
+                if self.handle_input(event, now) is False:
+                    self.quit_requested = True
+        return not self.quit_requested
+    
+    def handle_input(self, event, timestamp=None):
         """Handle keyboard input based on game state"""
         if event.type == pygame.KEYDOWN:
             if self.state == GameState.MENU:
-                self.handle_menu_input(event.key)
+                return self.handle_menu_input(event.key)
             elif self.state == GameState.PLAYING:
-                self.handle_game_input(event.key)
+                self.handle_game_input(event.key, timestamp)
             elif self.state == GameState.PAUSED:
                 self.handle_pause_input(event.key)
             elif self.state == GameState.GAME_OVER:
@@ -182,22 +312,20 @@ class Game:
             return False
         return True
     
-    def handle_game_input(self, key):
-        """Handle input during gameplay (WASD movement)"""
+    def handle_game_input(self, key, timestamp=None):
+        """Handle input during gameplay (WASD turns are queued, one per tick)"""
         # Movement controls (WASD)
-        if key == pygame.K_w and self.snake.direction != DOWN:
-            self.snake.direction = UP
-        elif key == pygame.K_s and self.snake.direction != UP:
-            self.snake.direction = DOWN
-        elif key == pygame.K_a and self.snake.direction != RIGHT:
-            self.snake.direction = LEFT
-        elif key == pygame.K_d and self.snake.direction != LEFT:
-            self.snake.direction = RIGHT
-        
-        # Game controls
+        if key in KEY_DIRECTIONS:
+            if timestamp is None:
+                timestamp = time.perf_counter()
+            self.turns.push(KEY_DIRECTIONS[key], self.snake.direction, timestamp)
+        
+        # Game controls (queued turns would otherwise count the pause as lag)
         elif key == pygame.K_p or key == pygame.K_SPACE:
+            self.turns.clear()
             self.state = GameState.PAUSED
         elif key == pygame.K_q or key == pygame.K_ESCAPE:
+            self.turns.clear()
             self.state = GameState.MENU
         
         return True
@@ -220,11 +348,18 @@ class Game:
     
     def update(self):
         """Update game logic"""
+        if not self.poll_input():
+            return False
         if self.state != GameState.PLAYING:
             return
         
-        # Move snake
+        # Apply at most one queued turn, then move snake
+        turn = self.turns.pop()
+        if turn is not None:
+            self.snake.direction = turn[0]
         self.snake.move()
+        if turn is not None:
+            self.latency.add(time.perf_counter() - turn[1])
         
         # Check collision
         if self.snake.check_collision():
@@ -235,7 +370,8 @@ class Game:
         if self.snake.get_head() == self.food.position:
             self.score += 1
             self.snake.grow()
-            self.food.respawn(self.snake.body)
+            if not self.food.respawn(self.snake.body):
+                self.state = GameState.GAME_OVER  # Board full
     
     def draw_menu(self):
         """Draw main menu"""
@@ -343,6 +479,14 @@ class Game:
         menu_text = self.font_small.render("Press Q for Menu", True, WHITE)
         menu_rect = menu_text.get_rect(center=(width // 2, height // 2 + 110))
         screen.blit(menu_text, menu_rect)
+        
+        # Input latency so far
+        if self.latency.count:
+            lag_text = self.font_small.render(
+                f"Input lag p50 {self.latency.percentile(50):.0f} ms / "
+                f"p99 {self.latency.percentile(99):.0f} ms", True, GRAY)
+            lag_rect = lag_text.get_rect(center=(width // 2, height // 2 + 150))
+            screen.blit(lag_text, lag_rect)
     
     def draw(self):
         """Draw current game state"""
@@ -358,29 +502,25 @@ class Game:
         pygame.display.flip()
 
 def main():
-    """Main game loop"""
+    """Main game loop: simulation and rendering run at separate rates"""
     game = Game()
-    running = True
-    
-    while running:
-        clock.tick(GAME_CONFIG['fps'])
-        
-        # Handle events
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                running = False
-            elif event.type == pygame.KEYDOWN:
-                result = game.handle_input(event)
-                if result is False:
-                    running = False
-        
-        # Update game
-        game.update()
+    scheduler = GameScheduler(render_rate=GAME_CONFIG['render_fps'])
+    scheduler.add_simulation(game.update, rate=GAME_CONFIG['fps'])
+
+    def frame(now):
+        # Handle events every frame, so input is read between simulation ticks
+        if not game.poll_input():
+            return False
         
         # Draw everything
         game.draw()
     
+    scheduler.run(frame)
     pygame.quit()
+    print("⌨️  Input-to-movement latency:")
+    print(game.latency.report())
+    if game.turns.dropped:
+        print(f"⚠️  {game.turns.dropped} turns dropped (buffer of {game.turns.size} full)")
     sys.exit()
 
 if __name__ == "__main__":
@@ -1,11 +1,12 @@
-from pygame import display, time, draw, QUIT, init, KEYDOWN, K_a, K_s, K_d, K_w, K_ESCAPE
+from pygame import display, draw, QUIT, init, KEYDOWN, K_a, K_s, K_d, K_w, K_ESCAPE
 from random import randint
 import pygame
 import sys
 from numpy import sqrt
-
-# Initialize pygame
-init()
+from game_scheduler import GameScheduler
+from pixel_renderer import PixelRenderer, use_pixels
+from planner_service import PlannerService, PlanningSnapshot
+from shared_board import SharedBoard
 
 # Game configuration
 GAME_CONFIG = {
@@ -13,12 +14,16 @@ GAME_CONFIG = {
     'rows': 25, 
     'width': 600,
     'height': 600,
-    'fps': 12,
-    'obstacle_probability': 3
+    'fps': 12,  # Simulation ticks per second
+    'render_fps': 60,  # Frames per second; the head glides between ticks
+    'obstacle_probability': 3,
+    'board_layout': None,         # board_generation layout ('blobs', 'maze', 'rooms', ...) or None for per-spot rolls
+    'async_planning': 'thread',   # 'thread' (the pure-Python search holds the GIL, so it still takes time from rendering), 'process' (shared-memory board, no GIL contention) or None to plan inline
+    'planning_budget_ms': 20,     # Wait this long for a fresh path before animating on
+    'render_mode': 'auto'         # 'rects' (one per spot), 'pixels' (one surfarray blit) or 'auto' (pixels below 4 px cells)
 }
 
 # Game state variables
-done = False
 score = 0
 game_over = False
 
@@ -38,10 +43,12 @@ height = GAME_CONFIG['height']
 wr = width / cols
 hr = height / rows
 
-# Game setup
-screen = display.set_mode([width, height])
-display.set_caption("Snake A* Algorithm - Autonomous Pathfinding Game")
-clock = time.Clock()
+# Window, planner service and shared board are created in main(), so planner
+# worker processes that re-import this module (spawn start method) do not
+# open windows or start games of their own
+screen = None
+planner_service = None
+shared_board = None
 
 
 # Enhanced A* algorithm with error handling and optimization
@@ -130,6 +137,16 @@ def getpath(food1, snake1):
     return dir_array1
 
 
+def show_at(x, y, color):
+    """Draw a spot-sized rect at grid position (x, y), which may be fractional"""
+    draw.rect(screen, color, [
+        x * hr + 2, 
+        y * wr + 2, 
+        hr - 4, 
+        wr - 4
+    ])
+
+
 class Spot:
     """Enhanced Spot class with better initialization and validation"""
     def __init__(self, x, y):
@@ -145,12 +162,7 @@ class Spot:
 
     def show(self, color):
         """Draw the spot on screen with proper positioning"""
-        draw.rect(screen, color, [
-            self.x * hr + 2, 
-            self.y * wr + 2, 
-            hr - 4, 
-            wr - 4
-        ])
+        show_at(self.x, self.y, color)
 
     def add_neighbors(self):
         """Add valid neighbors to this spot"""
@@ -167,21 +179,57 @@ class Spot:
 
 def initialize_game():
     """Initialize the game grid, snake, and food"""
-    global grid, snake, food, current, dir_array
+    global grid, snake, food, current, previous, dir_array, obstacle_map, occupancy, renderer
     
     # Create and setup grid
     grid = [[Spot(i, j) for j in range(cols)] for i in range(rows)]
     for i in range(rows):
         for j in range(cols):
             grid[i][j].add_neighbors()
+    if GAME_CONFIG['board_layout']:
+        # Connected layout from the generation engine replaces the per-spot rolls
+        from board_generation import generate_obstacles
+        layout = generate_obstacles(rows, cols, GAME_CONFIG['board_layout'],
+                                    GAME_CONFIG['obstacle_probability'])
+        for i in range(rows):
+            for j in range(cols):
+                grid[i][j].obstrucle = bool(layout[i, j])
+    obstacle_map = bytes(grid[i][j].obstrucle for i in range(rows) for j in range(cols))
+    if shared_board is not None:
+        shared_board.publish(obstacles=obstacle_map)
+    # Spots are drawn x across, y down, each hr x wr pixels
+    renderer = (PixelRenderer(rows, cols, obstacle_map, (rows * hr, cols * wr))
+                if use_pixels(GAME_CONFIG['render_mode'], rows, cols, (rows * hr, cols * wr))
+                else None)
 
     # Initialize snake at center
     snake = [grid[rows // 2][cols // 2]]
+    occupancy = bytearray(rows * cols)  # Snake cells, kept in step with snake
+    occupancy[snake[0].x * cols + snake[0].y] = 1
     
     # Place food avoiding obstacles and snake
     food = place_food()
-    current = snake[-1]
-    dir_array = getpath(food, snake)
+    current = previous = snake[-1]
+    dir_array = request_path()
+
+def request_path():
+    """
+    Path from the snake head to the food
+
+    With async planning the search starts on the planner service from a
+    snapshot of the board; [] is returned if it does not finish within the
+    planning budget, and handle_movement collects the path later.
+    """
+    if planner_service is None:
+        return getpath(food, snake)
+    body = [s.x * cols + s.y for s in snake]
+    if shared_board is not None:
+        shared_board.publish(occupancy, head=body[-1], food=food.x * cols + food.y)
+        planner_service.submit_shared(shared_board)
+    else:
+        planner_service.submit(PlanningSnapshot(rows, cols, obstacle_map, body,
+                                                food.x * cols + food.y))
+    return planner_service.poll(GAME_CONFIG['planning_budget_ms'] / 1000) or []
 
 def place_food():
     """Place food in a valid location"""
@@ -221,8 +269,16 @@ def handle_movement():
     global current, score, dir_array, food
     
     if not dir_array:
-        # No path available, try to recalculate
-        dir_array = getpath(food, snake)
+        if planner_service is not None and planner_service.pending:
+            dir_array = planner_service.poll()
+            if dir_array is None:
+                dir_array = []
+                return True  # Search still running - keep animating
+        else:
+            # No path available, try to recalculate
+            dir_array = request_path()
+            if planner_service is not None and planner_service.pending:
+                return True
         if not dir_array:
             return False  # Game over - no path possible
     
@@ -252,70 +308,112 @@ def handle_movement():
     
     # Move snake
     snake.append(next_spot)
+    occupancy[next_x * cols + next_y] = 1
     current = snake[-1]
 
     # Check if food was eaten
     if current == food:
         score += 1
         food = place_food()
-        dir_array = getpath(food, snake)
+        dir_array = request_path()
     else:
-        snake.pop(0)  # Remove tail if no food eaten
+        tail = snake.pop(0)  # Remove tail if no food eaten
+        occupancy[tail.x * cols + tail.y] = 0
     
     return True
 
-# Initialize game
-initialize_game()
+def main():
+    """Set up the window and the planner service, then run the game loop"""
+    global screen, planner_service, shared_board
 
-# Main game loop
-while not done:
-    clock.tick(GAME_CONFIG['fps'])
-    screen.fill(BLACK)
-    
-    # Handle movement and check for game over
-    if not handle_movement():
-        game_over = True
-    
-    # Draw game elements
-    for spot in snake:
-        spot.show(WHITE)
-    
-    for i in range(rows):
-        for j in range(cols):
-            if grid[i][j].obstrucle:
-                grid[i][j].show(RED)
+    init()
+    screen = display.set_mode([width, height])
+    display.set_caption("Snake A* Algorithm - Autonomous Pathfinding Game")
 
-    food.show(GREEN)
-    snake[-1].show(BLUE)  # Highlight snake head
-    
-    # Draw UI
-    draw_ui()
-    
-    # Display game over message
-    if game_over:
-        font = pygame.font.Font(None, 48)
-        game_over_text = font.render("GAME OVER", True, RED)
-        text_rect = game_over_text.get_rect(center=(width//2, height//2))
-        screen.blit(game_over_text, text_rect)
-        
-        restart_text = font.render("Press R to restart", True, WHITE)
-        restart_rect = restart_text.get_rect(center=(width//2, height//2 + 50))
-        screen.blit(restart_text, restart_rect)
+    # Background planner, so a slow search never stalls the frame loop
+    planner_service = (PlannerService(GAME_CONFIG['async_planning'])
+                       if GAME_CONFIG['async_planning'] else None)
+    # Process workers read the board from shared memory instead of pickled snapshots
+    shared_board = (SharedBoard.create(rows, cols)
+                    if GAME_CONFIG['async_planning'] == 'process' else None)
 
-    display.flip()
-    
-    # Handle events
-    for event in pygame.event.get():
-        if event.type == QUIT:
-            done = True
-        elif event.type == KEYDOWN:
-            if event.key == K_ESCAPE:
-                done = True
-            elif event.key == pygame.K_r and game_over:
-                # Restart game
-                score = 0
-                game_over = False
-                initialize_game()
-
-pygame.quit()
-sys.exit()
+    # Initialize game
+    initialize_game()
+
+    def update():
+        """One simulation tick (no more searches once the game is over)"""
+        global previous, game_over
+        previous = current
+        if not game_over and not handle_movement():
+            game_over = True
+
+    scheduler = GameScheduler(render_rate=GAME_CONFIG['render_fps'])
+    sim_loop = scheduler.add_simulation(update, rate=GAME_CONFIG['fps'])
+
+    def frame(now):
+        global score, game_over
+
+        # Handle events
+        for event in pygame.event.get():
+            if event.type == QUIT:
+                return False
+            elif event.type == KEYDOWN:
+                if event.key == K_ESCAPE:
+                    return False
+                elif event.key == pygame.K_r and game_over:
+                    # Restart game
+                    score = 0
+                    game_over = False
+                    initialize_game()
+
+        screen.fill(BLACK)
+
+        # Draw game elements
+        if renderer is not None:
+            # Cells are a few pixels wide here: no sub-cell motion to show
+            renderer.draw(screen, (0, 0), occupancy, food.x * cols + food.y,
+                          current.x * cols + current.y)
+        else:
+            for spot in snake[:-1]:
+                spot.show(WHITE)
+
+            for i in range(rows):
+                for j in range(cols):
+                    if grid[i][j].obstrucle:
+                        grid[i][j].show(RED)
+
+            food.show(GREEN)
+            # Highlight snake head, interpolated from the previous cell
+            alpha = 1.0 if game_over else sim_loop.alpha(now)
+            show_at(previous.x + (current.x - previous.x) * alpha,
+                    previous.y + (current.y - previous.y) * alpha, BLUE)
+
+        # Draw UI
+        draw_ui()
+
+        # Display game over message
+        if game_over:
+            font = pygame.font.Font(None, 48)
+            game_over_text = font.render("GAME OVER", True, RED)
+            text_rect = game_over_text.get_rect(center=(width//2, height//2))
+            screen.blit(game_over_text, text_rect)
+
+            restart_text = font.render("Press R to restart", True, WHITE)
+            restart_rect = restart_text.get_rect(center=(width//2, height//2 + 50))
+            screen.blit(restart_text, restart_rect)
+
+        display.flip()
+
+    # Simulation and rendering run at separate rates
+    scheduler.run(frame)
+
+    if planner_service is not None:
+        planner_service.shutdown()
+    if shared_board is not None:
+        shared_board.close()
+    pygame.quit()
+    sys.exit()
+
+
+if __name__ == "__main__":
+    main()
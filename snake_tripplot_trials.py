@@ -1,7 +1,14 @@
-import matplotlib.pyplot as plt
+import sys
+import matplotlib
 import numpy as np
 import statistics
 
+# Render straight to a file (no window) when an output path is given
+OUTPUT_PATH = sys.argv[1] if len(sys.argv) > 1 else None
+if OUTPUT_PATH:
+    matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+
 # Given data
 tries = [33, 48, 68, 35, 43, 52, 61, 36, 41, 56, 45, 78, 80, 79, 36, 48, 92, 56, 40, 36]
 
@@ -83,7 +90,10 @@ ax4.set_title('Trial-to-Trial Performance Changes')
 ax4.grid(True, alpha=0.3)
 
 plt.tight_layout()
-plt.show()
+if OUTPUT_PATH:
+    plt.savefig(OUTPUT_PATH)
+else:
+    plt.show()
 
 # Additional analysis output
 print("=" * 50)
@@ -0,0 +1,90 @@
+"""Per-tick budget of the anytime planner on a large board"""
+
+import heapq
+from types import SimpleNamespace
+
+import anytime_planner
+from anytime_planner import TIME_CHECK_INTERVAL, AnytimePlanner
+from snake_engine import make_board, make_episode
+
+MAX_SECONDS = 0.002
+HEAP_OP_SECONDS = 1e-6  # Simulated cost of one heap operation (per entry for heapify)
+
+
+class HeapCounter:
+    """heapq stand-in for the planner that counts pops and drives a simulated clock"""
+
+    def __init__(self):
+        self.pops = 0
+        self.now = 0.0
+
+    def heappop(self, heap):
+        self.pops += 1
+        self.now += HEAP_OP_SECONDS
+        return heapq.heappop(heap)
+
+    def heappush(self, heap, item):
+        self.now += HEAP_OP_SECONDS
+        heapq.heappush(heap, item)
+
+    def heapify(self, heap):
+        self.now += HEAP_OP_SECONDS * len(heap)
+        heapq.heapify(heap)
+
+
+def count_heap(monkeypatch, clock=False):
+    counter = HeapCounter()
+    monkeypatch.setattr(anytime_planner, 'heapq', counter)
+    if clock:
+        monkeypatch.setattr(anytime_planner, 'time', SimpleNamespace(perf_counter=lambda: counter.now))
+    return counter
+
+
+def walk(planner, board, head, food, ticks):
+    """Follow the planner's moves for up to ticks moves, yielding after each plan()"""
+    sim = SimpleNamespace(head=head, food=food)
+    board.occupy(head)
+    for _ in range(ticks):
+        move = planner.plan(sim)
+        yield move
+        if not move or sim.head == food:
+            return
+        board.release(sim.head)
+        sim.head = board.move(sim.head, move[0])
+        board.occupy(sim.head)
+
+
+def test_time_budget_holds_on_large_board(monkeypatch):
+    # Long searches grow the tree to hundreds of thousands of cells, and each
+    # meal throws it away: neither may show up in a single tick. The clock
+    # only advances with heap work, so the check is exact and load-independent
+    counter = count_heap(monkeypatch, clock=True)
+    sim = make_episode(0, planner='anytime', rows=1000, cols=1000, obstacle_probability=20,
+                       layout='blobs', planner_options={'max_seconds': MAX_SECONDS,
+                                                        'max_expansions': None},
+                       max_steps=1500, livelock_repeats=0)
+    plan, ticks = sim.planner.plan, []
+
+    def timed_plan(state):
+        start = counter.now
+        path = plan(state)
+        ticks.append(counter.now - start)
+        return path
+
+    sim.planner.plan = timed_plan
+    while sim.step():
+        pass
+    assert sim.score > 0 and len(ticks) > 1000
+    # Past the deadline, at most one check interval of pops (each with up to
+    # four pushes) may run before the clock is read again
+    assert max(ticks) <= MAX_SECONDS + TIME_CHECK_INTERVAL * 5 * HEAP_OP_SECONDS
+
+
+def test_expansion_budget_counts_every_pop(monkeypatch):
+    counter = count_heap(monkeypatch)
+    board = make_board(300, 300, 20, seed=2, layout='blobs')
+    planner = AnytimePlanner(board, max_expansions=500)
+    before = 0
+    for _ in walk(planner, board, board.cell(150, 150), board.cell(5, 290), 100):
+        assert counter.pops - before <= 500
+        before = counter.pops
@@ -0,0 +1,19 @@
+"""Start-up cost of the command-line entry point"""
+
+import os
+import subprocess
+import sys
+
+import board_generation
+import snake_cli
+
+
+def test_layout_choices_match_board_generation():
+    assert snake_cli.LAYOUTS == board_generation.LAYOUTS
+
+
+def test_parser_does_not_import_numpy():
+    code = "import sys, snake_cli; snake_cli.build_parser(); print('numpy' in sys.modules)"
+    result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True,
+                            cwd=os.path.dirname(snake_cli.__file__), check=True)
+    assert result.stdout.strip() == 'False'
@@ -0,0 +1,52 @@
+"""Forked boards and livelock detectors stay independent of their parents"""
+
+from livelock import LivelockDetector
+from snake_engine import FORK_COPY_CELLS, OccupancyOverlay, make_board
+
+
+def check_isolated(board):
+    a, b, c = board.cell(1, 1), board.cell(1, 2), board.cell(2, 2)
+    board.occupy(a)
+    fork = board.fork()
+    board.occupy(b)
+    board.release(a)
+    fork.occupy(c)
+    assert [board.occupancy[cell] for cell in (a, b, c)] == [0, 1, 0]
+    assert [fork.occupancy[cell] for cell in (a, b, c)] == [1, 0, 1]
+    assert sorted(fork.occupied_cells()) == [a, c]
+    return fork
+
+
+def test_small_board_fork_copies():
+    fork = check_isolated(make_board(20, 20, 0, seed=1))
+    assert isinstance(fork.occupancy, bytearray)
+
+
+def test_large_board_fork_keeps_changes_only():
+    side = int(FORK_COPY_CELLS ** 0.5) + 1
+    board = make_board(side, side, 0, seed=1)
+    fork = check_isolated(board)
+    assert isinstance(fork.occupancy, OccupancyOverlay)
+    assert len(fork.occupancy.changes) == 3
+    # A fork of a fork sees its parent's changes, not the later ones
+    grandchild = fork.fork()
+    fork.release(board.cell(2, 2))
+    assert grandchild.occupancy[board.cell(2, 2)] == 1
+    assert bytes(fork.dense_occupancy()) == bytes(fork.occupancy)
+
+
+def test_livelock_fork_shares_history():
+    board = make_board(10, 10, 0, seed=1)
+    detector = LivelockDetector(board, repeats=3)
+    head, food = board.cell(0, 0), board.cell(9, 9)
+    assert not detector.check(head, food)
+    fork = detector.fork(board.fork())
+    assert not fork.check(head, food)
+    assert fork.check(head, food)
+    # The fork's counts never reach the parent
+    assert not detector.check(head, food)
+    for _ in range(40):
+        detector.fork(board.fork())
+        detector.check(board.cell(5, 5), food)
+    assert len(detector.layers) <= 3
+    assert detector.check(head, food)
@@ -0,0 +1,16 @@
+"""Shared path cache across boards of different shapes"""
+
+import path_cache
+from snake_engine import run_episode
+
+
+def test_same_cell_count_different_shape():
+    # 20x20 and 10x40 have the same cell count and no obstacles, so only the
+    # board shape tells their cache entries apart
+    path_cache._shared_caches.clear()
+    run_episode(0, planner='cached', rows=20, cols=20, obstacle_probability=0)
+    shared = run_episode(0, planner='cached', rows=10, cols=40, obstacle_probability=0)
+    path_cache._shared_caches.clear()
+    fresh = run_episode(0, planner='cached', rows=10, cols=40, obstacle_probability=0)
+    assert shared['death_cause'] != 'boundary'
+    assert (shared['score'], shared['steps']) == (fresh['score'], fresh['steps'])